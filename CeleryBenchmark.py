@@ -0,0 +1,42 @@
+# CeleryCm 처리량 측정 스크립트 (브로커/결과 백엔드는 메모리, 작업 상태/배치 버퍼는 Redis 필요)
+
+import time
+from typing import List
+
+from celery import Celery
+from celery.contrib.testing.worker import start_worker
+
+from common import CeleryCm
+
+app = Celery('benchmark', broker='memory://', backend='cache+memory://')
+app.conf.broker_transport_options = {'polling_interval': 0.001}
+app.conf.worker_prefetch_multiplier = 0    # 무제한 : prefetch 한도 대기로 인한 지연 제외
+
+@app.task(base=CeleryCm.BaseTask, bind=True)
+def add(self, x: int, y: int) -> int:
+    return x + y
+
+@app.task(base=CeleryCm.BatchTask, bind=True, batch_size=100, batch_interval=0.05)
+def add_batch(self, items: List[CeleryCm.BatchItem]) -> List[int]:
+    return [item.args[0] + item.args[1] for item in items]
+
+def benchmark_batching(items: int = 2000, concurrency: int = 4):
+    # 항목 items 개를 delay() 로 보내고 모든 결과를 받을 때까지의 처리량(items/s) : 항목별 메시지 vs BatchTask
+    try:
+        CeleryCm.RedisManager.shared().redis_client.ping()
+    except Exception as e:
+        print(f"batching benchmark skipped (Redis unavailable: {e})")
+        return
+
+    print(f"{'path':<10} {'items':>8} {'seconds':>10} {'items/s':>10}")
+    with start_worker(app, pool='threads', concurrency=concurrency, perform_ping_check=False):
+        for label, task in (("unbatched", add), ("batched", add_batch)):
+            start = time.perf_counter()
+            results = [task.delay(i, i) for i in range(items)]
+            for i, result in enumerate(results):
+                assert result.get(timeout=60, interval=0.001) == i * 2
+            elapsed = time.perf_counter() - start
+            print(f"{label:<10} {items:>8} {elapsed:>10.2f} {items / elapsed:>10,.0f}")
+
+if __name__ == "__main__":
+    benchmark_batching()
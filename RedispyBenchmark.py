@@ -0,0 +1,140 @@
+# RedispyCm 성능 측정 스크립트 (Redis 서버 없이 실행 가능한 항목 위주)
+
+import hashlib
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from common import RedispyCm
+
+def sample_records(rows: int = 5000) -> List[Dict[str, Any]]:
+    # DataFrame.to_dict('records') 결과와 유사한 데이터
+    random.seed(0)
+    return [
+        {
+            "id": i,
+            "name": f"user_{i}",
+            "score": random.random() * 100,
+            "city": random.choice(["Seoul", "Busan", "Incheon", "Daegu"]),
+            "active": i % 3 == 0,
+        }
+        for i in range(rows)
+    ]
+
+def measure(func: Callable[[], Any], rounds: int) -> float:
+    # 1회 평균 실행 시간(초)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds
+
+def benchmark_serializers(rounds: int = 50):
+    # 포맷/압축별 인코딩, 디코딩 처리량(rows/s) 및 저장 크기(bytes)
+    payload = sample_records()
+    print(f"{'format':<8} {'compression':<12} {'bytes':>10} {'encode rows/s':>14} {'decode rows/s':>14}")
+    for format in RedispyCm.RedisSerializer.FORMATS:
+        for compression in RedispyCm.RedisSerializer.CODECS:
+            try:
+                serializer = RedispyCm.RedisSerializer(format, compression, compression_threshold=0)
+            except ImportError:
+                continue
+            data = serializer.dumps(payload)
+            encode = measure(lambda: serializer.dumps(payload), rounds)
+            decode = measure(lambda: serializer.loads(data), rounds)
+            print(f"{format:<8} {str(compression):<12} {len(data):>10} "
+                  f"{len(payload) / encode:>14,.0f} {len(payload) / decode:>14,.0f}")
+
+def legacy_cache_key(prefix: str, *args, **kwargs) -> str:
+    # 기존 RedisCache.cache_key 구현 (str() + MD5)
+    key_parts = [prefix]
+    key_parts.extend(str(arg) for arg in args)
+    key_parts.extend(f"{k}:{v}" for k, v in sorted(kwargs.items()))
+    key = ":".join(key_parts)
+    return hashlib.md5(key.encode()).hexdigest()
+
+def benchmark_cache_keys(rounds: int = 200):
+    # 인자 유형별 키 생성 시간(µs) : 기존 str()+MD5 방식 vs CacheKeyBuilder
+    cases = {
+        "small args": ((123, "user"), {"active": True}),
+        "list 10k ints": ((list(range(10_000)),), {}),
+        "dict 1k items": (({f"k{i}": i for i in range(1000)},), {}),
+    }
+    try:
+        import numpy as np
+        import pandas as pd
+        cases["ndarray 1M"] = ((np.arange(1_000_000, dtype=np.float64),), {})
+        cases["DataFrame 100k"] = ((pd.DataFrame({"a": np.arange(100_000), "b": np.random.rand(100_000)}),), {})
+    except ImportError:
+        pass
+
+    builder = RedispyCm.CacheKeyBuilder()
+    print(f"{'case':<16} {'legacy µs':>12} {'builder µs':>12}")
+    for name, (args, kwargs) in cases.items():
+        legacy = measure(lambda: legacy_cache_key("func", *args, **kwargs), rounds)
+        current = measure(lambda: builder.build("module.func", args, kwargs), rounds)
+        print(f"{name:<16} {legacy * 1e6:>12.1f} {current * 1e6:>12.1f}")
+
+class LegacyLock:
+    # 기존 RedisLock 구현 (SET NX + 고정 간격 폴링, GET 후 DEL 로 해제)
+    def __init__(self, client, name: str, timeout: int = 10, retry_delay: float = 0.1):
+        self.client = client
+        self.name = f"lock:{name}"
+        self.timeout = timeout
+        self.retry_delay = retry_delay
+        self.token = hashlib.md5(str(time.time()).encode()).hexdigest()
+
+    def run(self, critical: Callable[[], Any]):
+        while not self.client.set(self.name, self.token, nx=True, ex=self.timeout):
+            time.sleep(self.retry_delay)
+        try:
+            critical()
+        finally:
+            if self.client.get(self.name) == self.token:
+                self.client.delete(self.name)
+
+def percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * p), len(values) - 1)]
+
+def benchmark_lock_contention(workers: int = 8, rounds: int = 25, hold: float = 0.002):
+    # 같은 락을 workers 개 스레드가 경쟁할 때 처리량과 대기 시간 : 기존 폴링 방식 vs RedisLock (Redis 서버 필요)
+    client = RedispyCm.RedisConnectionPool(RedispyCm.RedisConfig(max_connections=workers * 3)).get_connection()
+    try:
+        client.ping()
+    except Exception as e:
+        print(f"lock contention benchmark skipped (Redis unavailable: {e})")
+        return
+
+    def legacy(name: str):
+        LegacyLock(client, name).run(lambda: time.sleep(hold))
+
+    def current(name: str):
+        with RedispyCm.RedisLock(client, name).acquire_lock():
+            time.sleep(hold)
+
+    print(f"{'lock':<8} {'acquires/s':>12} {'wait p50 ms':>12} {'wait p99 ms':>12}")
+    for label, acquire in (("legacy", legacy), ("current", current)):
+        name = f"bench:{label}:{random.random()}"
+        waits: List[float] = []
+
+        def worker():
+            for _ in range(rounds):
+                start = time.perf_counter()
+                acquire(name)
+                waits.append(time.perf_counter() - start - hold)
+
+        threads = [threading.Thread(target=worker) for _ in range(workers)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<8} {len(waits) / elapsed:>12,.0f} "
+              f"{percentile(waits, 0.5) * 1000:>12.1f} {percentile(waits, 0.99) * 1000:>12.1f}")
+
+if __name__ == "__main__":
+    benchmark_serializers()
+    benchmark_cache_keys()
+    benchmark_lock_contention()
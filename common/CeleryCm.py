@@ -1,15 +1,31 @@
-from celery import Celery, Task
+from celery import Celery, Task, chord
 from celery.schedules import crontab
-from celery.signals import after_task_publish, task_prerun, task_success, task_failure
-from datetime import timedelta
+from celery import states
+from celery.exceptions import Retry
+from celery.signals import (after_task_publish, before_task_publish, task_prerun, task_postrun,
+                            task_success, task_failure)
+from celery.utils import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import bisect
+import hashlib
+import io
 import logging
+import os
 import redis
 import json
-from typing import Any, Dict, Optional
+import random
+import shutil
+from typing import Any, Dict, Iterator, List, Optional, Union
 from contextlib import contextmanager
 import time
 from functools import wraps
 
+if __package__:
+    from .RedispyCm import RedisConfig, RedisConnectionPool
+else:   # python common/CeleryCm.py 직접 실행
+    from RedispyCm import RedisConfig, RedisConnectionPool
+
 # 기본 설정
 class CeleryConfig:
     # Celery 브로커 및 백엔드 설정
@@ -32,6 +48,11 @@ class CeleryConfig:
     CELERYD_CONCURRENCY = 4
     CELERYD_PREFETCH_MULTIPLIER = 1
 
+    # 작업 상태 해시(task_status:{id}) 설정 : 보관 기간(초, None 이면 만료 없음)
+    # 결과 JSON 이 TASK_STATUS_MAX_RESULT_BYTES 를 넘으면 상태 해시에는 저장하지 않고 결과 백엔드 참조만 기록
+    TASK_STATUS_TTL = 7 * 24 * 3600
+    TASK_STATUS_MAX_RESULT_BYTES = 64 * 1024
+
 # Celery 앱 초기화
 app = Celery('tasks')
 app.config_from_object(CeleryConfig)
@@ -43,23 +64,227 @@ class RedisManager:
     # def __init__(self, host='localhost', port=6379, db=2):
     #     self.redis_client = redis.Redis(host=host, port=port, db=db)
 
-    # Redis Password 반영후
-    def __init__(self, db=0, password=None):
-        self.redis_client = redis.StrictRedis(
+    # 연결 풀 기본값 : 공유 인스턴스 하나가 모든 작업의 상태/중복 제거/지표 기록을 처리하므로
+    # threads/gevent 워커 풀에서도 충분한 연결 수를 두고, 초과 요청은 예외 대신 최대 POOL_TIMEOUT 초 대기
+    MAX_CONNECTIONS = 100
+    POOL_TIMEOUT = 20.0
+
+    # Redis Password 반영후 : RedisFramework 와 같은 설정별 연결 풀 레지스트리 사용
+    def __init__(self, db=0, password=None, max_connections: Optional[int] = None,
+                 pool_timeout: Optional[float] = None):
+        self.connection_pool = RedisConnectionPool(RedisConfig(
             host='localhost',
             port=6379,
             db=db,
-            password=password
-        )
+            password=password,
+            max_connections=max_connections or self.MAX_CONNECTIONS,
+            pool_timeout=self.POOL_TIMEOUT if pool_timeout is None else pool_timeout
+        ))
+        self.redis_client = self.connection_pool.get_binary_connection()
+        self._set_status_script = self.redis_client.register_script(self.SET_STATUS_SCRIPT)
+        self._claim_script = self.redis_client.register_script(self.DEDUP_CLAIM_SCRIPT)
+        self._finish_script = self.redis_client.register_script(self.DEDUP_FINISH_SCRIPT)
+        self._claim_batch_script = self.redis_client.register_script(self.BATCH_CLAIM_SCRIPT)
+        self._recover_batch_script = self.redis_client.register_script(self.BATCH_RECOVER_SCRIPT)
+
+    # 상태 인덱스 : 상태별 ZSET(task_index:status:{상태}) 과 전체 시간 ZSET(task_index:time), 점수는 마지막 갱신 시각
+    STATUS_INDEX_PREFIX = 'task_index:status:'
+    TIME_INDEX = 'task_index:time'
+
+    # 상태 해시 갱신과 인덱스 이동을 원자적으로 처리 (이전 상태 인덱스에서 제거 후 새 상태 인덱스에 추가)
+    # TTL 지정시 해시 만료 설정 및 보관 기간이 지난 인덱스 항목 정리
+    # KEYS[1] = 상태 해시, KEYS[2] = 시간 인덱스, ARGV = [task_id, 시각, 상태 인덱스 prefix, TTL, field, value, ...]
+    SET_STATUS_SCRIPT = """
+    local old = redis.call('HGET', KEYS[1], 'status')
+    redis.call('HSET', KEYS[1], 'updated_at', ARGV[2], unpack(ARGV, 5))
+    local new = redis.call('HGET', KEYS[1], 'status')
+    if old and old ~= new then
+        redis.call('ZREM', ARGV[3] .. old, ARGV[1])
+    end
+    if new then
+        redis.call('ZADD', ARGV[3] .. new, ARGV[2], ARGV[1])
+    end
+    redis.call('ZADD', KEYS[2], ARGV[2], ARGV[1])
+    local ttl = tonumber(ARGV[4])
+    if ttl > 0 then
+        redis.call('EXPIRE', KEYS[1], ttl)
+        local cutoff = '(' .. (tonumber(ARGV[2]) - ttl)
+        redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', cutoff)
+        if new then
+            redis.call('ZREMRANGEBYSCORE', ARGV[3] .. new, '-inf', cutoff)
+        end
+    end
+    return 1
+    """
+
+    # 중복 작업 제거 : task_dedup:{지문} 값은 실행 중이면 작업 ID, 완료 후 결과 보관 기간 동안 'done:{작업 ID}'
+    # 집계는 task_dedup:stats 해시의 '{작업명}|{miss|hit|coalesced|rejected}' 필드
+    DEDUP_PREFIX = 'task_dedup:'
+    DEDUP_STATS = 'task_dedup:stats'
+
+    # KEYS[1] = 지문 키, KEYS[2] = 집계 해시, ARGV = [작업 ID, 실행 중 TTL(ms), 작업명, 실행 중 중복 분류]
+    # 반환 {분류, 기존 작업 ID} : 같은 작업 ID 재발행(Task.retry)은 'own' 으로 집계하지 않음
+    DEDUP_CLAIM_SCRIPT = """
+    if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+        redis.call('HINCRBY', KEYS[2], ARGV[3] .. '|miss', 1)
+        return {'miss', ARGV[1]}
+    end
+    local current = redis.call('GET', KEYS[1])
+    if current == ARGV[1] then
+        return {'own', current}
+    end
+    local kind = ARGV[4]
+    if string.sub(current, 1, 5) == 'done:' then
+        kind = 'hit'
+        current = string.sub(current, 6)
+    end
+    redis.call('HINCRBY', KEYS[2], ARGV[3] .. '|' .. kind, 1)
+    return {kind, current}
+    """
 
-    def set_task_status(self, task_id, status):
+    # 자신이 등록한 지문만 완료 처리 : ARGV = [작업 ID, 결과 보관 TTL(초, 0 이면 삭제)]
+    DEDUP_FINISH_SCRIPT = """
+    if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+        return 0
+    end
+    if tonumber(ARGV[2]) > 0 then
+        redis.call('SET', KEYS[1], 'done:' .. ARGV[1], 'EX', ARGV[2])
+    else
+        redis.call('DEL', KEYS[1])
+    end
+    return 1
+    """
+
+    # 배치 버퍼 : 꺼낸 항목은 결과 저장 전까지 처리 리스트({버퍼}:processing:{ID})에 보관,
+    # 처리 리스트 목록은 {버퍼}:processing ZSET(점수는 꺼낸 시각)으로 관리해 워커 장애시 버퍼로 되돌림
+    # KEYS[1] = 버퍼, KEYS[2] = 처리 리스트, KEYS[3] = 처리 ZSET, KEYS[4] = flush 예약 플래그, ARGV = [최대 건수, 시각]
+    BATCH_CLAIM_SCRIPT = """
+    redis.call('DEL', KEYS[4])
+    local items = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+    if #items == 0 then
+        return items
+    end
+    redis.call('LTRIM', KEYS[1], #items, -1)
+    for i = 1, #items, 1000 do
+        redis.call('RPUSH', KEYS[2], unpack(items, i, math.min(i + 999, #items)))
+    end
+    redis.call('ZADD', KEYS[3], ARGV[2], KEYS[2])
+    return items
+    """
+
+    # 기한이 지난 처리 리스트 항목을 원래 순서대로 버퍼 앞에 되돌리고 되돌린 건수 반환
+    # KEYS[1] = 버퍼, KEYS[2] = 처리 ZSET, ARGV = [기한 시각]
+    BATCH_RECOVER_SCRIPT = """
+    local count = 0
+    for _, key in ipairs(redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])) do
+        local items = redis.call('LRANGE', key, 0, -1)
+        for i = #items, 1, -1 do
+            redis.call('LPUSH', KEYS[1], items[i])
+        end
+        count = count + #items
+        redis.call('DEL', key)
+        redis.call('ZREM', KEYS[2], key)
+    end
+    return count
+    """
+    _shared: Dict[tuple, 'RedisManager'] = {}
+
+    @classmethod
+    def status_index_key(cls, status: str) -> str:
+        return f"{cls.STATUS_INDEX_PREFIX}{status}"
+
+    @classmethod
+    def shared(cls, db=0, password=None, max_connections: Optional[int] = None,
+               pool_timeout: Optional[float] = None) -> 'RedisManager':
+        """프로세스 내 공유 인스턴스 (작업 클래스마다 클라이언트/스크립트를 새로 만들지 않도록)"""
+        key = (db, password, max_connections, pool_timeout)
+        if key not in cls._shared:
+            cls._shared[key] = cls(db=db, password=password, max_connections=max_connections,
+                                   pool_timeout=pool_timeout)
+        return cls._shared[key]
+
+    def set_task_status(self, task_id, status, ttl: Optional[int] = None, pipe=None):
+        """상태 해시와 인덱스 갱신 (EVALSHA 1회), pipe 지정시 해당 파이프라인에 추가만 함"""
         if not isinstance(status, dict):    # status dictionary 체크 Validation 추가
             raise ValueError("status must be a dictionary")
-        self.redis_client.hset(f"task_status:{task_id}", mapping=status)
+        fields = [item for key, value in status.items() if value is not None for item in (key, value)]
+        self._set_status_script(keys=[f"task_status:{task_id}", self.TIME_INDEX],
+                                args=[task_id, time.time(), self.STATUS_INDEX_PREFIX, ttl or 0, *fields],
+                                client=pipe)
+
+    def set_task_statuses(self, statuses: Dict[str, Dict[str, Any]], ttl: Optional[int] = None):
+        """여러 작업 상태를 하나의 파이프라인으로 갱신"""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for task_id, status in statuses.items():
+            self.set_task_status(task_id, status, ttl, pipe)
+        pipe.execute()
+
+    @classmethod
+    def task_fingerprint(cls, name: str, args, kwargs) -> str:
+        """(작업명, args, kwargs) 지문 키 : JSON 직렬화 결과 기준이라 tuple/list 는 같은 호출로 취급"""
+        payload = json.dumps([name, list(args or ()), kwargs or {}], sort_keys=True, default=str)
+        return f"{cls.DEDUP_PREFIX}{hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()}"
+
+    def claim_task(self, fingerprint: str, task_id: str, name: str, inflight_ttl: float,
+                   duplicate: str = 'coalesced') -> tuple:
+        """지문 선점 (SET NX), (분류, 작업 ID) 반환 : miss/own 이면 task_id, hit/coalesced/rejected 면 기존 작업 ID"""
+        kind, current = self._claim_script(keys=[fingerprint, self.DEDUP_STATS],
+                                           args=[task_id, int(inflight_ttl * 1000), name, duplicate])
+        return kind.decode(), current.decode()
+
+    def finish_task(self, fingerprint: str, task_id: str, result_ttl: float = 0):
+        """성공시 결과 보관 기간으로 전환, 실패시(result_ttl=0) 지문 삭제"""
+        self._finish_script(keys=[fingerprint], args=[task_id, int(result_ttl)])
+
+    def claim_batch(self, key: str, size: int) -> tuple:
+        """버퍼에서 최대 size 개 항목을 처리 리스트로 옮기고 (처리 리스트 키, 항목 목록) 반환"""
+        processing = f"{key}:processing:{uuid()}"
+        items = self._claim_batch_script(keys=[key, processing, f"{key}:processing", f"{key}:scheduled"],
+                                         args=[size, time.time()])
+        return processing, items
+
+    def release_batch(self, key: str, processing: str):
+        """결과 저장이 끝난 처리 리스트 삭제"""
+        pipe = self.redis_client.pipeline()
+        pipe.delete(processing)
+        pipe.zrem(f"{key}:processing", processing)
+        pipe.execute()
+
+    def recover_batches(self, key: str, timeout: float) -> int:
+        """timeout 초 넘게 결과가 저장되지 않은 처리 리스트(워커 장애) 항목을 버퍼로 되돌리고 건수 반환"""
+        return self._recover_batch_script(keys=[key, f"{key}:processing"], args=[time.time() - timeout])
 
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         return {k.decode(): v.decode() for k, v in self.redis_client.hgetall(f"task_status:{task_id}").items()}
 
+    def rebuild_task_indexes(self, batch_size: int = 1000) -> int:
+        """인덱스 도입 전 상태 해시를 SCAN 으로 찾아 인덱스에 등록 (KEYS 미사용), 등록한 작업 수 반환"""
+        count = 0
+        keys = []
+        for key in self.redis_client.scan_iter(match='task_status:*', count=batch_size):
+            keys.append(key)
+            if len(keys) >= batch_size:
+                count += self._index_existing(keys)
+                keys = []
+        if keys:
+            count += self._index_existing(keys)
+        return count
+
+    def _index_existing(self, keys: list) -> int:
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hmget(key, 'status', 'updated_at')
+        now = time.time()
+        pipe_index = self.redis_client.pipeline(transaction=False)
+        for key, (status, updated_at) in zip(keys, pipe.execute()):
+            task_id = key.decode().split(':', 1)[1]
+            score = float(updated_at) if updated_at else now
+            pipe_index.zadd(self.TIME_INDEX, {task_id: score})
+            if status:
+                pipe_index.zadd(self.status_index_key(status.decode()), {task_id: score})
+        pipe_index.execute()
+        return len(keys)
+
 # 로깅 설정
 class TaskLogger:
     def __init__(self, name: str):
@@ -82,28 +307,174 @@ class TaskLogger:
         self.logger.error(f"Task {task_id} failed: {exc}\n{traceback}")
 
 # 기본 작업 클래스
+class DuplicateTaskError(Exception):
+    """dedup='reject' 작업에 같은 호출이 이미 실행 중일 때 발생"""
+    def __init__(self, name: str, task_id: str):
+        super().__init__(f"Task {name} with the same arguments is already running: {task_id}")
+        self.task_id = task_id
+
 class BaseTask(Task):
     abstract = True
+    # 중복 호출 처리 : None(사용 안 함), 'coalesce'(실행 중인 작업의 AsyncResult 반환), 'reject'(DuplicateTaskError)
+    # 두 방식 모두 dedup_result_ttl 초 안에 완료된 같은 호출은 기존 결과의 AsyncResult 반환
+    # 주의 : 중복 호출이 돌려받는 것은 다른 작업의 AsyncResult 이므로 group/chord 안에서는 dedup 작업 사용 불가
+    # (작업 ID 가 요청과 달라 chord 카운트/결과 순서가 맞지 않음)
+    dedup: Optional[str] = None
+    dedup_result_ttl = 300
+    dedup_inflight_ttl = 3600
 
     def __init__(self):
         self.logger = TaskLogger(self.name)
-        self.redis_manager = RedisManager()
+        self.redis_manager = RedisManager.shared()
+
+    def apply_async(self, args=None, kwargs=None, task_id=None, **options):
+        if not self.dedup:
+            return super().apply_async(args, kwargs, task_id, **options)
+        task_id = task_id or uuid()
+        duplicate = 'rejected' if self.dedup == 'reject' else 'coalesced'
+        fingerprint = RedisManager.task_fingerprint(self.name, args, kwargs)
+        kind, current = self.redis_manager.claim_task(fingerprint, task_id, self.name,
+                                                      self.dedup_inflight_ttl, duplicate)
+        if kind == 'rejected':
+            raise DuplicateTaskError(self.name, current)
+        if kind in ('hit', 'coalesced'):
+            return self.AsyncResult(current)
+        try:
+            return super().apply_async(args, kwargs, task_id, **options)
+        except Exception:
+            # 발행 실패(브로커 장애, 직렬화 오류 등)시 선점 해제 : 남겨두면 inflight TTL 동안 같은 호출이 모두 막힘
+            self.redis_manager.finish_task(fingerprint, task_id, 0)
+            raise
+
+    def _finish_dedup(self, task_id: str, args, kwargs, result_ttl: float):
+        if self.dedup:
+            self.redis_manager.finish_task(RedisManager.task_fingerprint(self.name, args, kwargs),
+                                           task_id, result_ttl)
+
+    def _set_status(self, task_id: str, status: Dict[str, Any]):
+        self.redis_manager.set_task_status(task_id, status, self.app.conf.get('TASK_STATUS_TTL'))
+
+    def _result_fields(self, retval) -> Dict[str, Any]:
+        # 결과가 크면 상태 해시에는 크기만 기록하고 결과 백엔드(AsyncResult(task_id))를 참조하도록 표시
+        if retval is None:
+            return {}
+        result = json.dumps(retval, default=str)
+        max_bytes = self.app.conf.get('TASK_STATUS_MAX_RESULT_BYTES')
+        if max_bytes and len(result) > max_bytes:
+            return {'result_location': 'backend', 'result_size': len(result)}
+        return {'result': result}
 
     def on_success(self, retval, task_id, args, kwargs):
         self.logger.log_task_success(task_id, retval)
-        self.redis_manager.set_task_status(task_id, {
-            'status': 'SUCCESS',
-            'result': json.dumps(retval) if retval is not None else None
-        })
+        self._set_status(task_id, {'status': 'SUCCESS', **self._result_fields(retval)})
+        self._finish_dedup(task_id, args, kwargs, self.dedup_result_ttl)
 
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         self.logger.log_task_failure(task_id, exc, einfo.traceback)
-        self.redis_manager.set_task_status(task_id, {
+        self._set_status(task_id, {
             'status': 'FAILURE',
             'error': str(exc)
         })
+        self._finish_dedup(task_id, args, kwargs, 0)
+
+    def on_retry(self, exc, task_id, args, kwargs, einfo):
+        # request.retries 는 이번 재시도 전 횟수
+        # 재시도 원인은 last_error 에 기록 : error 는 최종 실패에만 쓰므로 이후 SUCCESS 해시에 남지 않음
+        self.logger.logger.warning(f"Task {task_id} retry {self.request.retries + 1}: {exc}")
+        self._set_status(task_id, {
+            'status': 'RETRY',
+            'retries': self.request.retries + 1,
+            'last_error': str(exc)
+        })
+
+# 배치 작업 항목 : 호출자가 delay()/apply_async() 에 넘긴 인자와 개별 작업 ID
+@dataclass
+class BatchItem:
+    id: str
+    args: list = field(default_factory=list)
+    kwargs: dict = field(default_factory=dict)
+
+# 마이크로 배치 작업 클래스 : 호출자는 항목마다 delay() 를 호출하지만 브로커 메시지는 배치 단위로 발행
+# 항목은 Redis 리스트(batch:{작업명})에 쌓이고, batch_size 개가 모이거나 batch_interval 초가 지나면
+# flush 메시지 1건이 최대 batch_size 개 항목을 run(items) 로 처리, 결과는 항목별 AsyncResult 로 저장
+# run 은 items 와 같은 길이의 결과 리스트를 반환 (Exception 인스턴스 항목은 해당 작업만 FAILURE)
+# 꺼낸 항목은 결과 저장 후 삭제 : 처리 중 워커가 죽으면 batch_visibility_timeout 초 후 다음 flush 가 버퍼로 되돌려
+# 다시 실행 (최소 1회 실행), 이후 호출이 없으면 recover() 를 주기 작업으로 실행
+# 항목별 countdown/eta/queue 등 발행 옵션은 지원하지 않음 (배치 메시지 하나로 함께 처리되므로 ValueError)
+class BatchTask(BaseTask):
+    abstract = True
+    batch_size = 100
+    batch_interval = 0.05
+    batch_visibility_timeout = 300
+    typing = False      # flush 메시지는 run(items) 시그니처와 다른 인자로 발행
+    FLUSH_KWARG = '__batch_flush__'
+
+    @property
+    def batch_key(self) -> str:
+        return f"batch:{self.name}"
+
+    def apply_async(self, args=None, kwargs=None, task_id=None, **options):
+        if kwargs and kwargs.get(self.FLUSH_KWARG):
+            return super().apply_async(args, kwargs, task_id, **options)
+        if options:
+            raise ValueError(f"BatchTask items do not support publish options: {', '.join(sorted(options))}")
+        task_id = task_id or uuid()
+        pipe = self.redis_manager.redis_client.pipeline(transaction=False)
+        pipe.rpush(self.batch_key, json.dumps({'id': task_id, 'args': list(args or ()), 'kwargs': kwargs or {}}))
+        pipe.set(f"{self.batch_key}:scheduled", 1, nx=True, px=max(1, int(self.batch_interval * 1000)))
+        size, scheduled = pipe.execute()
+        if size % self.batch_size == 0:
+            super().apply_async(kwargs={self.FLUSH_KWARG: True})
+        elif scheduled:
+            super().apply_async(kwargs={self.FLUSH_KWARG: True}, countdown=self.batch_interval)
+        return self.AsyncResult(task_id)
+
+    def __call__(self, *args, **kwargs):
+        if kwargs.pop(self.FLUSH_KWARG, False):
+            return self.flush()
+        return super().__call__(*args, **kwargs)
+
+    def recover(self) -> int:
+        """처리 중 워커 장애로 남은 항목을 버퍼로 되돌리고 flush 예약, 되돌린 건수 반환"""
+        count = self.redis_manager.recover_batches(self.batch_key, self.batch_visibility_timeout)
+        for _ in range(-(-count // self.batch_size)):
+            super().apply_async(kwargs={self.FLUSH_KWARG: True})
+        if count:
+            self.logger.logger.warning(f"Recovered {count} unfinished items of {self.batch_key}")
+        return count
+
+    def flush(self) -> int:
+        """버퍼에서 최대 batch_size 개 항목을 꺼내 처리 후 처리 건수 반환"""
+        self.recover()
+        # 예약 플래그도 함께 삭제 : 이후 추가되는 항목은 새 타이머 예약
+        processing, raw = self.redis_manager.claim_batch(self.batch_key, self.batch_size)
+        if not raw:
+            return 0
+        items = [BatchItem(**json.loads(data)) for data in raw]
+        try:
+            results = super().__call__(items)
+            if len(results) != len(items):
+                raise ValueError(f"batch returned {len(results)} results for {len(items)} items")
+        except Exception as exc:
+            self._store_results(items, [exc] * len(items))
+            self.redis_manager.release_batch(self.batch_key, processing)
+            raise
+        self._store_results(items, results)
+        self.redis_manager.release_batch(self.batch_key, processing)
+        return len(items)
+
+    def _store_results(self, items: List[BatchItem], results: List[Any]):
+        statuses = {}
+        for item, result in zip(items, results):
+            if isinstance(result, Exception):
+                self.backend.store_result(item.id, result, states.FAILURE)
+                statuses[item.id] = {'status': states.FAILURE, 'error': str(result)}
+            else:
+                self.backend.store_result(item.id, result, states.SUCCESS)
+                statuses[item.id] = {'status': states.SUCCESS, **self._result_fields(result)}
+        self.redis_manager.set_task_statuses(statuses, self.app.conf.get('TASK_STATUS_TTL'))
 
-# 재시도 데코레이터
+# 재시도 데코레이터 (워커 안에서 sleep 하므로 대기 동안 워커 슬롯 점유 : 새 작업은 retry_with_backoff 사용)
 def retry_on_failure(max_retries=3, delay=1):
     def decorator(func):
         @wraps(func)
@@ -119,14 +490,37 @@ def retry_on_failure(max_retries=3, delay=1):
         return wrapper
     return decorator
 
-# 성능 측정 데코레이터
+# 백오프 재시도 데코레이터 (bind=True 작업용) : Task.retry 로 재예약하므로 대기 동안 워커 슬롯 반환
+# 대기 시간 = random(0, min(max_delay, base_delay * 2^재시도 횟수)) (jitter=False 면 상한값 그대로)
+def retry_with_backoff(max_retries=3, base_delay=1, max_delay=60, jitter=True,
+                       retry_for: tuple = (Exception,), dont_retry_for: tuple = ()):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except Retry:
+                raise
+            except dont_retry_for:
+                raise
+            except retry_for as e:
+                if self.request.retries >= max_retries:
+                    raise
+                countdown = min(max_delay, base_delay * 2 ** self.request.retries)
+                if jitter:
+                    countdown = random.uniform(0, countdown)
+                raise self.retry(exc=e, countdown=countdown, max_retries=max_retries)
+        return wrapper
+    return decorator
+
+# 성능 측정 데코레이터 (함수 본문 실행 시간 로그, 작업 단위 지표는 시그널 핸들러가 TaskMetrics 에 집계)
 def measure_performance(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        duration = time.time() - start_time
-        logging.info(f"Task {func.__name__} took {duration:.2f} seconds to complete")
+        duration = time.perf_counter() - start_time
+        logging.info(f"Task {func.__name__} took {duration:.4f} seconds to complete")
         return result
     return wrapper
 
@@ -151,7 +545,88 @@ class TaskScheduler:
         else:
             raise ValueError("Invalid schedule format")
 
-# 작업 모니터링
+# 작업 지표 : 작업명별 시간 구간 해시 task_metrics:{작업명}:{구간 시작 epoch} 에 워커 전체 값을 누적
+# 필드 : 상태별 개수(success/failure/retry ...), run:{버킷}/wait:{버킷} 히스토그램 개수, run_sum/wait_sum
+# run = prerun~postrun 실행 시간(perf_counter), wait = 발행(또는 ETA)~prerun 큐 대기 시간(호스트 간 비교라 wall clock)
+TASK_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+                        30.0, 60.0, 120.0, 300.0, 600.0, 1200.0)
+
+class TaskMetrics:
+    PREFIX = 'task_metrics:'
+    NAMES = 'task_metrics:names'
+
+    def __init__(self, redis_manager: RedisManager, bucket_seconds: int = 60, retention: int = 24 * 3600,
+                 buckets: tuple = TASK_LATENCY_BUCKETS):
+        self.redis_manager = redis_manager
+        self.bucket_seconds = bucket_seconds
+        self.retention = retention
+        self.buckets = buckets
+
+    def _key(self, name: str, timestamp: float) -> str:
+        return f"{self.PREFIX}{name}:{int(timestamp // self.bucket_seconds * self.bucket_seconds)}"
+
+    def record(self, name: str, state: str, run_time: Optional[float] = None, wait_time: Optional[float] = None):
+        """작업 1건 기록 (파이프라인 1회)"""
+        key = self._key(name, time.time())
+        pipe = self.redis_manager.redis_client.pipeline(transaction=False)
+        pipe.hincrby(key, state.lower(), 1)
+        for kind, value in (('run', run_time), ('wait', wait_time)):
+            if value is not None:
+                pipe.hincrby(key, f"{kind}:{bisect.bisect_left(self.buckets, value)}", 1)
+                pipe.hincrbyfloat(key, f"{kind}_sum", value)
+        pipe.expire(key, self.retention)
+        pipe.sadd(self.NAMES, name)
+        pipe.execute()
+
+    def percentile(self, counts: List[int], p: float) -> Optional[float]:
+        """버킷 개수로 백분위 추정 (버킷 안에서는 선형 보간, 마지막 버킷 초과분은 마지막 경계값)"""
+        total = sum(counts)
+        if not total:
+            return None
+        rank = p * total
+        seen = 0
+        for i, count in enumerate(counts):
+            if count and seen + count >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def names(self) -> List[str]:
+        return sorted(name.decode() for name in self.redis_manager.redis_client.smembers(self.NAMES))
+
+    def summary(self, name: str, window: int = 300) -> Dict[str, Any]:
+        """최근 window 초(구간 단위로 올림) 상태별 개수, 처리량(완료/초), run/wait 평균 및 p50/p95/p99"""
+        now = time.time()
+        start = (now - window) // self.bucket_seconds * self.bucket_seconds
+        pipe = self.redis_manager.redis_client.pipeline(transaction=False)
+        for timestamp in range(int(start), int(now) + 1, self.bucket_seconds):
+            pipe.hgetall(self._key(name, timestamp))
+        fields: Dict[str, float] = {}
+        for row in pipe.execute():
+            for field, value in row.items():
+                fields[field.decode()] = fields.get(field.decode(), 0) + float(value)
+
+        states_count = {field: int(value) for field, value in fields.items()
+                        if ':' not in field and not field.endswith('_sum')}
+        completed = states_count.get('success', 0) + states_count.get('failure', 0)
+        result: Dict[str, Any] = {
+            'counts': states_count,
+            'throughput': completed / (now - start),
+        }
+        for kind in ('run', 'wait'):
+            counts = [int(fields.get(f"{kind}:{i}", 0)) for i in range(len(self.buckets) + 1)]
+            total = sum(counts)
+            result[kind] = {
+                'count': total,
+                'mean': fields.get(f"{kind}_sum", 0.0) / total if total else None,
+                **{f"p{int(p * 100)}": self.percentile(counts, p) for p in (0.5, 0.95, 0.99)},
+            }
+        return result
+
+# 작업 모니터링 : 조회는 모두 RedisManager 가 유지하는 인덱스 ZSET 사용 (KEYS 미사용)
 class TaskMonitor:
     def __init__(self, redis_manager: RedisManager):
         self.redis_manager = redis_manager
@@ -159,23 +634,384 @@ class TaskMonitor:
     def get_task_info(self, task_id: str) -> Dict[str, Any]:
         return self.redis_manager.get_task_status(task_id)
 
+    def _index(self, status: Optional[str]) -> str:
+        return RedisManager.status_index_key(status) if status else RedisManager.TIME_INDEX
+
+    @staticmethod
+    def _range(start: Optional[float], end: Optional[float]) -> tuple:
+        # start/end : 마지막 갱신 시각(epoch 초 또는 datetime) 범위
+        low = '-inf' if start is None else start.timestamp() if isinstance(start, datetime) else start
+        high = '+inf' if end is None else end.timestamp() if isinstance(end, datetime) else end
+        return low, high
+
+    def list_tasks(self, status: Optional[str] = None, start=None, end=None,
+                   offset: int = 0, limit: int = 100, newest_first: bool = True) -> List[str]:
+        """작업 ID 목록 (상태/갱신 시각 범위 필터, offset/limit 페이지)"""
+        client = self.redis_manager.redis_client
+        low, high = self._range(start, end)
+        if newest_first:
+            ids = client.zrevrangebyscore(self._index(status), high, low, start=offset, num=limit)
+        else:
+            ids = client.zrangebyscore(self._index(status), low, high, start=offset, num=limit)
+        return [task_id.decode() for task_id in ids]
+
+    def count_tasks(self, status: Optional[str] = None, start=None, end=None) -> int:
+        """조건에 맞는 작업 수 (ZCOUNT)"""
+        low, high = self._range(start, end)
+        return self.redis_manager.redis_client.zcount(self._index(status), low, high)
+
+    def iter_tasks(self, status: Optional[str] = None, start=None, end=None,
+                   batch_size: int = 500) -> Iterator[str]:
+        """갱신 시각 순 작업 ID 순회 (마지막 점수 기준 커서 : 순회 중 추가/삭제가 있어도 중복 없이 진행)"""
+        client = self.redis_manager.redis_client
+        key = self._index(status)
+        low, high = self._range(start, end)
+        seen: set = set()   # 경계 점수(low)에서 이미 반환한 ID
+        while True:
+            rows = client.zrangebyscore(key, low, high, start=0, num=batch_size + len(seen), withscores=True)
+            for task_id, _ in rows:
+                if task_id not in seen:
+                    yield task_id.decode()
+            if len(rows) < batch_size + len(seen):
+                return
+            low = rows[-1][1]
+            seen = {task_id for task_id, score in rows if score == low}
+
+    def status_counts(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        client = self.redis_manager.redis_client
+        keys = list(client.scan_iter(match=f"{RedisManager.STATUS_INDEX_PREFIX}*", count=100))
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.zcard(key)
+        prefix = len(RedisManager.STATUS_INDEX_PREFIX)
+        return {key.decode()[prefix:]: count for key, count in zip(keys, pipe.execute())}
+
+    def dedup_stats(self) -> Dict[str, Dict[str, Any]]:
+        """작업별 중복 제거 집계 : miss(실제 실행), hit(보관 결과 반환), coalesced/rejected(실행 중 중복), dedup_ratio(재계산하지 않은 비율)"""
+        stats: Dict[str, Dict[str, Any]] = {}
+        for field, count in self.redis_manager.redis_client.hgetall(RedisManager.DEDUP_STATS).items():
+            name, kind = field.decode().rsplit('|', 1)
+            stats.setdefault(name, {'miss': 0, 'hit': 0, 'coalesced': 0, 'rejected': 0})[kind] = int(count)
+        for counts in stats.values():
+            total = sum(counts.values())
+            counts['dedup_ratio'] = (total - counts['miss']) / total if total else 0.0
+        return stats
+
+    def task_metrics(self, name: Optional[str] = None, window: int = 300) -> Dict[str, Dict[str, Any]]:
+        """작업명별 처리량과 실행/대기 시간 백분위 (워커 전체, TaskMetrics 집계 기준)"""
+        collector = TaskMetrics(self.redis_manager)
+        return {task_name: collector.summary(task_name, window) for task_name in ([name] if name else collector.names())}
+
     def get_active_tasks(self) -> list[str]:
-        return [k.decode().split(':')[1] for k in
-                self.redis_manager.redis_client.keys('task_status:*')]
+        return list(self.iter_tasks())
 
 # 샘플 작업 정의
-@app.task(base=BaseTask, bind=True)
+@app.task(base=BaseTask, bind=True, dedup='coalesce')
 @measure_performance
-@retry_on_failure(max_retries=3)
+@retry_with_backoff(max_retries=3)
 def sample_task(self, x: int, y: int) -> int:
     """샘플 계산 작업"""
     return x + y
 
+@app.task(base=BatchTask, bind=True, batch_size=100, batch_interval=0.05)
+def sample_batch_task(self, items: List[BatchItem]) -> List[int]:
+    """샘플 배치 작업 : sample_batch_task.delay(x, y) 호출들을 모아 한 번에 계산"""
+    return [item.args[0] + item.args[1] for item in items]
+
 @app.task(base=BaseTask, bind=True)
 def periodic_task(self):
     """주기적으로 실행되는 작업"""
     self.logger.logger.info("Periodic task executed")
 
+# DataFrame 분산 처리 : 입력을 청크로 나눠 chord 로 실행, 워커 간 데이터는 공유 디렉터리의 Parquet 파일로 교환
+# (결과 백엔드에는 파일 경로와 작은 통계값만 저장) work_dir 는 모든 워커가 접근 가능한 경로여야 함
+# pandas/numpy/PandasCm(scipy) 는 DataFrame 작업에서만 필요하므로 함수 안에서 import (워커/클라이언트 기동 비용 절감)
+def _pandas_cm():
+    if __package__:
+        from .PandasCm import PandasCm
+    else:
+        from PandasCm import PandasCm
+    return PandasCm()
+
+# source(청크 설명) : {'path', 'format': 'parquet'} 또는 CSV 바이트 구간 {'path', 'format': 'csv', 'start', 'end', 'names', 'options'}
+def read_chunk(source: Dict[str, Any]) -> 'pd.DataFrame':
+    import pandas as pd
+    if source['format'] == 'parquet':
+        return pd.read_parquet(source['path'])
+    with open(source['path'], 'rb') as f:
+        f.seek(source['start'])
+        data = f.read(source['end'] - source['start'])
+    return pd.read_csv(io.BytesIO(data), header=None, names=source['names'], **source['options'])
+
+# CSV 바이트 구간 분할은 첫 줄을 헤더로 가정 : 구간마다 다시 적용되면 안 되는 행 위치 기준 옵션은 거부
+CSV_ROW_OPTIONS = ('skiprows', 'skipfooter', 'nrows', 'chunksize', 'iterator', 'names', 'header')
+CSV_DTYPE_SAMPLE_ROWS = 10000
+
+def csv_chunk_dtypes(sample: 'pd.DataFrame') -> Dict[str, Any]:
+    """앞부분 샘플의 dtype 을 모든 청크에 고정 (정수/불리언은 결측을 담을 수 있는 nullable 타입, 날짜는 parse_dates 에 맡김)"""
+    dtypes = {}
+    for col, dtype in sample.dtypes.items():
+        if dtype.kind in 'iu':
+            dtypes[col] = 'Int64'
+        elif dtype.kind == 'b':
+            dtypes[col] = 'boolean'
+        elif dtype.kind != 'M':
+            dtypes[col] = str(dtype)      # 작업 인자(JSON)로 전달
+    return dtypes
+
+def csv_byte_ranges(path: str, chunk_bytes: int, sample_rows: int = CSV_DTYPE_SAMPLE_ROWS,
+                    **read_options) -> List[Dict[str, Any]]:
+    """CSV 파일을 줄 경계에 맞춘 바이트 구간으로 분할 (각 워커가 자기 구간만 읽고 파싱, 따옴표 안 줄바꿈은 미지원)
+
+    청크마다 dtype 을 따로 추론하면 Parquet 스키마가 달라지므로 sample_rows 행으로 한 번 정한 dtype 을 모든 청크에 전달
+    (read_options 의 dtype 이 우선).
+    """
+    import pandas as pd
+    rejected = [option for option in CSV_ROW_OPTIONS
+                if option in read_options and not (option == 'header' and read_options[option] in (0, 'infer'))]
+    if rejected:
+        raise ValueError(f"CSV 바이트 구간 분할에서 사용할 수 없는 옵션입니다: {rejected}")
+    options = {key: value for key, value in read_options.items() if key != 'header'}
+    # usecols 와 관계없이 전체 컬럼명을 구간 파싱에 사용 (usecols 는 각 구간에서 적용)
+    names = list(pd.read_csv(path, nrows=0, **{key: value for key, value in options.items()
+                                               if key not in ('usecols', 'dtype')}).columns)
+    user_dtype = options.get('dtype')
+    if user_dtype is None or isinstance(user_dtype, dict):
+        sample = pd.read_csv(path, nrows=sample_rows, **options)
+        options['dtype'] = {**csv_chunk_dtypes(sample), **(user_dtype or {})}
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        f.readline()    # 헤더
+        offsets = [f.tell()]
+        while offsets[-1] + chunk_bytes < size:
+            f.seek(offsets[-1] + chunk_bytes)
+            f.readline()
+            offsets.append(f.tell())
+    offsets.append(size)
+    return [{'path': path, 'format': 'csv', 'start': start, 'end': end, 'names': names, 'options': options}
+            for start, end in zip(offsets, offsets[1:]) if end > start]
+
+# 청크별 부분 집계 후 합산 가능한 집계 함수 : 함수 -> 필요한 부분 집계
+# 평균/분산은 (개수, 평균, 편차 제곱합 M2) 로 저장 후 Chan 병렬 공식으로 병합 (sum/sumsq 방식의 자릿수 상쇄 방지)
+PARTIAL_AGGREGATES = {
+    'sum': ('sum',),
+    'count': ('count',),
+    'min': ('min',),
+    'max': ('max',),
+    'mean': ('count', 'mean'),
+    'var': ('count', 'mean', 'm2'),
+    'std': ('count', 'mean', 'm2'),
+}
+# 그대로 합치는 부분 집계 (count 도 청크별 개수의 합)
+COMBINE_AGGREGATES = {'sum': 'sum', 'count': 'sum', 'min': 'min', 'max': 'max'}
+
+def partial_aggregate(df: 'pd.DataFrame', group_by: Union[str, List[str], None],
+                      agg_columns: Dict[str, List[str]]) -> 'pd.DataFrame':
+    """청크의 부분 집계 (컬럼명 '{컬럼}__{부분집계}'), group_by 가 None 이면 전체 1행"""
+    import pandas as pd
+    source = df if group_by is None else df.groupby(group_by)
+    parts = {}
+    for col, funcs in agg_columns.items():
+        values = source[col]
+        for func in funcs:
+            if func not in PARTIAL_AGGREGATES:
+                raise ValueError(f"청크 단위로 합칠 수 없는 집계입니다: {func} (지원: {', '.join(PARTIAL_AGGREGATES)})")
+            for part in PARTIAL_AGGREGATES[func]:
+                name = f"{col}__{part}"
+                if name not in parts:
+                    parts[name] = values.var(ddof=0) * values.count() if part == 'm2' else getattr(values, part)()
+    if group_by is None:
+        return pd.DataFrame({name: [value] for name, value in parts.items()})
+    return pd.DataFrame(parts)
+
+def combine_aggregates(partials: 'pd.DataFrame', group_by: Union[str, List[str], None],
+                       agg_columns: Dict[str, List[str]]) -> 'pd.DataFrame':
+    """부분 집계를 합쳐 df.groupby(group_by).agg(agg_columns) 와 같은 형태의 결과 생성"""
+    import numpy as np
+    import pandas as pd
+    if group_by is None:
+        partials = partials.set_axis([0] * len(partials))     # 전체 집계는 단일 그룹
+    level = list(range(partials.index.nlevels))
+    result = {}
+    for col, funcs in agg_columns.items():
+        moments = None
+        for func in funcs:
+            if func in COMBINE_AGGREGATES:
+                result[(col, func)] = partials[f"{col}__{func}"].groupby(level=level).agg(COMBINE_AGGREGATES[func])
+                continue
+            if moments is None:
+                # n = Σn_i, mean = ref + Σn_i·(mean_i - ref) / n, M2 = ΣM2_i + Σn_i·(mean_i - mean)²
+                # ref(그룹의 첫 청크 평균) 기준 차이로 합산해 큰 값의 자릿수 손실 방지, 개수 0 인 청크는 제외
+                count = partials[f"{col}__count"]
+                n = count.groupby(level=level).sum()
+                ref = partials[f"{col}__mean"].groupby(level=level).first()
+                shift = partials[f"{col}__mean"] - ref.reindex(partials.index).to_numpy()
+                mean = ref + (shift * count).fillna(0).groupby(level=level).sum() / n
+                m2 = None
+                if f"{col}__m2" in partials:
+                    delta = partials[f"{col}__mean"] - mean.reindex(partials.index).to_numpy()
+                    m2 = (partials[f"{col}__m2"] + count * delta ** 2).fillna(0).groupby(level=level).sum()
+                moments = (n, mean, m2)
+            n, mean, m2 = moments
+            if func == 'mean':
+                result[(col, func)] = mean
+            else:
+                var = (m2 / (n - 1)).where(n > 1)
+                result[(col, func)] = var if func == 'var' else np.sqrt(var)
+    frame = pd.DataFrame(result)
+    return frame.reset_index(drop=True) if group_by is None else frame
+
+def _remove_dirs(dirs: Optional[List[str]]):
+    """작업 중간 파일 디렉터리 삭제 (이미 없으면 무시)"""
+    for path in dirs or []:
+        shutil.rmtree(path, ignore_errors=True)
+
+@app.task(base=BaseTask)
+def dataframe_cleanup(request, exc, traceback, dirs: List[str]):
+    """chord 실패 시 link_error 콜백 : 분할 입력/중간 파일 디렉터리 삭제"""
+    _remove_dirs(dirs)
+
+@app.task(base=BaseTask, bind=True)
+def dataframe_aggregate_chunk(self, source: Dict[str, Any], group_by, agg_columns: Dict[str, List[str]],
+                              output: str) -> str:
+    """청크 부분 집계를 Parquet 파일로 저장 후 경로 반환"""
+    partial_aggregate(read_chunk(source), group_by, agg_columns).to_parquet(output)
+    return output
+
+@app.task(base=BaseTask, bind=True)
+def dataframe_combine_aggregates(self, paths: List[str], group_by, agg_columns: Dict[str, List[str]],
+                                 output: str, cleanup: Optional[List[str]] = None) -> str:
+    """chord 콜백 : 부분 집계 파일을 합쳐 최종 결과 Parquet 경로 반환 (cleanup 디렉터리는 삭제)"""
+    import pandas as pd
+    partials = pd.concat([pd.read_parquet(path) for path in paths])
+    result = combine_aggregates(partials, group_by, agg_columns)
+    result.columns = [f"{col}_{func}" for col, func in result.columns]    # Parquet 컬럼명은 문자열만 허용
+    result.to_parquet(output)
+    for path in paths:
+        os.remove(path)
+    _remove_dirs(cleanup)
+    return output
+
+@app.task(base=BaseTask, bind=True)
+def dataframe_transform_chunk(self, source: Dict[str, Any], columns: List[str], operation: str, output: str,
+                              stats: Optional[Dict[str, Dict[str, float]]] = None,
+                              options: Optional[Dict[str, Any]] = None) -> str:
+    """청크 변환 결과를 Parquet 파일로 저장 (normalize/standardize 는 전체 통계 stats 사용)"""
+    df = read_chunk(source)
+    if operation in ChunkedDataFrame.GLOBAL_OPERATIONS:
+        for col in columns:
+            col_stats = stats[col]
+            if operation == 'normalize':
+                df[col] = (df[col] - col_stats['min']) / (col_stats['max'] - col_stats['min'])
+            else:
+                df[col] = (df[col] - col_stats['mean']) / col_stats['std']
+    else:
+        df = _pandas_cm().data_transformation_d(df, columns, operation, **(options or {}))
+    df.to_parquet(output)
+    return output
+
+@app.task(base=BaseTask, bind=True)
+def dataframe_transform_with_stats(self, stat_paths: List[str], sources: List[Dict[str, Any]], columns: List[str],
+                                   operation: str, outputs: List[str], cleanup: Optional[List[str]] = None,
+                                   cleanup_on_error: Optional[List[str]] = None):
+    """chord 콜백 : 전체 통계를 합친 뒤 변환 chord 로 교체"""
+    import pandas as pd
+    partials = pd.concat([pd.read_parquet(path) for path in stat_paths])
+    for path in stat_paths:
+        os.remove(path)
+    totals = combine_aggregates(partials, None, {col: ['min', 'max', 'mean', 'std'] for col in columns})
+    stats = {col: {func: float(totals[(col, func)].iloc[0]) for func in ('min', 'max', 'mean', 'std')}
+             for col in columns}
+    return self.replace(chord(
+        [dataframe_transform_chunk.s(source, columns, operation, output, stats)
+         for source, output in zip(sources, outputs)],
+        dataframe_collect.s(cleanup).on_error(dataframe_cleanup.s(dirs=cleanup_on_error))
+    ))
+
+@app.task(base=BaseTask, bind=True)
+def dataframe_collect(self, paths: List[str], cleanup: Optional[List[str]] = None) -> List[str]:
+    """chord 콜백 : 청크 순서대로 정렬된 결과 파일 목록 반환 (pd.read_parquet(목록 상위 디렉터리) 로 읽기 가능)"""
+    _remove_dirs(cleanup)
+    return sorted(paths)
+
+class ChunkedDataFrame:
+    """DataFrame 또는 파일을 청크로 나눠 워커들에 분산 처리 (PandasCm 의 data_transformation_d / data_grouping 대응)"""
+    # 청크 내 값만으로 계산 가능한 변환과, 전체 통계(min/max/mean/std)를 먼저 구해야 하는 변환
+    ROW_OPERATIONS = ('datetime_convert', 'log_transform')
+    GLOBAL_OPERATIONS = ('normalize', 'standardize')
+
+    def __init__(self, work_dir: str, chunk_rows: int = 500_000, chunk_bytes: int = 256 * 1024 * 1024):
+        self.work_dir = work_dir
+        self.chunk_rows = chunk_rows
+        self.chunk_bytes = chunk_bytes
+        self.pandas = _pandas_cm()
+
+    def _job_dir(self, name: str) -> str:
+        path = os.path.join(self.work_dir, f"{name}-{uuid()}")
+        os.makedirs(path)
+        return path
+
+    def split(self, data: Union['pd.DataFrame', str], file_type: str = 'csv', **read_options) -> List[Dict[str, Any]]:
+        """청크 목록 생성 : CSV 는 바이트 구간(파싱도 워커에서), 그 외는 PandasCm.read_data 후 행 단위 Parquet 파일"""
+        import pandas as pd
+        if isinstance(data, str) and file_type == 'csv':
+            return csv_byte_ranges(data, self.chunk_bytes, **read_options)
+        df = data if isinstance(data, pd.DataFrame) else self.pandas.read_data(data, file_type, **read_options)
+        job_dir = self._job_dir('input')
+        sources = []
+        for i, start in enumerate(range(0, len(df), self.chunk_rows)):
+            path = os.path.join(job_dir, f"part-{i:05d}.parquet")
+            df.iloc[start:start + self.chunk_rows].to_parquet(path)
+            sources.append({'path': path, 'format': 'parquet'})
+        return sources
+
+    @staticmethod
+    def _input_dirs(sources: List[Dict[str, Any]]) -> List[str]:
+        """split 이 만든 Parquet 입력 디렉터리 (CSV 바이트 구간은 원본 파일이므로 제외)"""
+        return sorted({os.path.dirname(source['path']) for source in sources if source['format'] == 'parquet'})
+
+    def transform(self, data: Union['pd.DataFrame', str], columns: List[str], operation: str,
+                  file_type: str = 'csv', read_options: Optional[Dict[str, Any]] = None, **kwargs):
+        """청크별 변환 chord 실행, AsyncResult.get() 은 결과 Parquet 파일 목록"""
+        if operation not in self.ROW_OPERATIONS + self.GLOBAL_OPERATIONS:
+            raise ValueError(f"청크 단위로 처리할 수 없는 변환 작업입니다: {operation} "
+                             f"(지원: {', '.join(self.ROW_OPERATIONS + self.GLOBAL_OPERATIONS)})")
+        sources = self.split(data, file_type, **(read_options or {}))
+        job_dir = self._job_dir('transform')
+        outputs = [os.path.join(job_dir, f"part-{i:05d}.parquet") for i in range(len(sources))]
+        # 성공 시 분할 입력만, 실패 시 결과 디렉터리(통계 파일 포함)까지 삭제
+        input_dirs = self._input_dirs(sources)
+        on_error = dataframe_cleanup.s(dirs=input_dirs + [job_dir])
+        if operation in self.ROW_OPERATIONS:
+            return chord(
+                dataframe_transform_chunk.s(source, columns, operation, output, options=kwargs)
+                for source, output in zip(sources, outputs)
+            )(dataframe_collect.s(input_dirs).on_error(on_error))
+        agg_columns = {col: ['min', 'max', 'std'] for col in columns}
+        return chord(
+            dataframe_aggregate_chunk.s(source, None, agg_columns, os.path.join(job_dir, f"stats-{i:05d}.parquet"))
+            for i, source in enumerate(sources)
+        )(dataframe_transform_with_stats.s(sources, columns, operation, outputs, input_dirs, input_dirs + [job_dir])
+          .on_error(on_error))
+
+    def group(self, data: Union['pd.DataFrame', str], group_by: Union[str, List[str]],
+              agg_columns: Dict[str, List[str]], file_type: str = 'csv',
+              read_options: Optional[Dict[str, Any]] = None):
+        """청크별 부분 집계 후 합산하는 chord 실행, AsyncResult.get() 은 결과 Parquet 경로 (컬럼명 '{컬럼}_{집계}')"""
+        for funcs in agg_columns.values():
+            unsupported = [func for func in funcs if func not in PARTIAL_AGGREGATES]
+            if unsupported:
+                raise ValueError(f"청크 단위로 합칠 수 없는 집계입니다: {unsupported} (지원: {', '.join(PARTIAL_AGGREGATES)})")
+        sources = self.split(data, file_type, **(read_options or {}))
+        job_dir = self._job_dir('group')
+        input_dirs = self._input_dirs(sources)
+        return chord(
+            dataframe_aggregate_chunk.s(source, group_by, agg_columns, os.path.join(job_dir, f"partial-{i:05d}.parquet"))
+            for i, source in enumerate(sources)
+        )(dataframe_combine_aggregates.s(group_by, agg_columns, os.path.join(job_dir, 'result.parquet'), input_dirs)
+          .on_error(dataframe_cleanup.s(dirs=input_dirs + [job_dir])))
+
 # 작업 스케줄 설정 예시
 scheduler = TaskScheduler(app)
 scheduler.schedule_task(
@@ -199,6 +1035,14 @@ def task_error_handler():
         raise
 
 # Celery 시그널 핸들러
+task_metrics = TaskMetrics(RedisManager.shared())
+_task_starts: Dict[str, tuple] = {}     # task_id -> (prerun perf_counter, 큐 대기 시간)
+
+@before_task_publish.connect
+def task_publish_time_handler(headers=None, **kwargs):
+    # 큐 대기 시간 측정용 발행 시각 (재시도 메시지는 새로 발행되므로 재시도 발행 시각)
+    headers.setdefault('published_at', time.time())
+
 @after_task_publish.connect
 def task_sent_handler(sender=None, headers=None, **kwargs):
     logging.info(f"Task {sender} sent for processing")
@@ -206,6 +1050,25 @@ def task_sent_handler(sender=None, headers=None, **kwargs):
 @task_prerun.connect
 def task_prerun_handler(task_id=None, task=None, **kwargs):
     logging.info(f"Task {task.name}[{task_id}] is about to run")
+    wait = None
+    published_at = task.request.get('published_at')
+    if published_at is not None:
+        eta = task.request.eta
+        if eta:     # countdown/ETA 작업은 예정 시각부터 대기
+            eta = datetime.fromisoformat(eta) if isinstance(eta, str) else eta
+            published_at = max(published_at, eta.timestamp())
+        wait = max(0.0, time.time() - published_at)
+    _task_starts[task_id] = (time.perf_counter(), wait)
+
+@task_postrun.connect
+def task_postrun_handler(task_id=None, task=None, state=None, **kwargs):
+    started = _task_starts.pop(task_id, None)
+    if started is None or state is None:
+        return
+    try:
+        task_metrics.record(task.name, state, time.perf_counter() - started[0], started[1])
+    except redis.RedisError as e:
+        logging.warning(f"Task metrics not recorded for {task.name}[{task_id}]: {e}")
 
 @task_success.connect
 def task_success_handler(sender=None, result=None, **kwargs):
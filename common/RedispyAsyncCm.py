@@ -0,0 +1,832 @@
+import redis.asyncio as aioredis
+import redis
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+from datetime import datetime
+import asyncio
+import inspect
+import secrets
+import time
+import zlib
+from functools import wraps
+from contextlib import asynccontextmanager
+
+from .RedispyCm import (
+    RedisConfig, RedisSerializer, QueueMessage, RateLimitResult,
+    RATE_LIMIT_SCRIPTS, REQUEUE_SCRIPT, LOCK_ACQUIRE_SCRIPT, LOCK_RELEASE_SCRIPT, LOCK_EXTEND_SCRIPT,
+    make_cache_key, make_cache_entry, should_refresh,
+    PubSubDispatcher, Subscription, function_key_name, metrics, logger as _sync_logger,
+    CHUNK_GRACE_TTL, CHUNK_MANIFEST_MAX, parse_chunk_manifest, manifest_chunk_keys, split_chunks
+)
+
+# redis.asyncio 기반 비동기 Redis 프레임워크
+# 설정(RedisConfig), 키 규칙, 직렬화 포맷, Lua 스크립트를 동기 버전(RedispyCm)과 공유하므로
+# 같은 키 공간에서 동기/비동기 코드를 함께 사용할 수 있음 (예 : FastAPI 서비스 + Celery 워커)
+
+# 동기 모듈 로거의 하위 로거 : RedispyCm.configure_logging 설정을 그대로 따름
+logger = _sync_logger.getChild('asyncio')
+
+def _create_pool(config: RedisConfig, decode_responses: bool) -> aioredis.ConnectionPool:
+    return aioredis.ConnectionPool(
+        host=config.host,
+        port=config.port,
+        db=config.db,
+        decode_responses=decode_responses,
+        password=config.password,
+        max_connections=config.max_connections
+    )
+
+class AsyncRedisLock:
+    """비동기 분산 락 (RedisLock 과 같은 키, 펜싱 토큰 카운터, 해제 알림 채널 및 Lua 스크립트 사용)"""
+    def __init__(self, redis_client: aioredis.Redis, lock_name: str, timeout: int = 10,
+                 auto_renew: bool = False):
+        self.redis_client = redis_client
+        self.lock_name = f"lock:{lock_name}"
+        self.fence_name = f"{self.lock_name}:fence"
+        self.channel = f"{self.lock_name}:released"
+        self.timeout = timeout
+        self.auto_renew = auto_renew
+        self.lock_token: Optional[str] = None
+        self.fencing_token: Optional[int] = None
+        self._acquire = redis_client.register_script(LOCK_ACQUIRE_SCRIPT)
+        self._release = redis_client.register_script(LOCK_RELEASE_SCRIPT)
+        self._extend = redis_client.register_script(LOCK_EXTEND_SCRIPT)
+        self._renewer: Optional[asyncio.Task] = None
+
+    async def _try_acquire(self) -> int:
+        # 획득 성공시 0, 실패시 락의 남은 TTL(ms) 반환
+        token = secrets.token_hex(16)
+        fence, ttl = await self._acquire(keys=[self.lock_name, self.fence_name],
+                                         args=[token, int(self.timeout * 1000)])
+        if not fence:
+            return ttl
+        self.lock_token, self.fencing_token = token, int(fence)
+        if self.auto_renew:
+            self._renewer = asyncio.ensure_future(self._renew())
+        return 0
+
+    async def _wait(self, pubsub, ttl: int, deadline: Optional[float], retry_delay: Optional[float]) -> bool:
+        # 해제 알림 또는 TTL 만료까지 대기, 대기 기한이 지났으면 False
+        wait = ttl / 1000 if ttl > 0 else (0 if ttl == -2 else self.timeout)
+        if retry_delay:
+            wait = min(wait, retry_delay)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            wait = min(wait, remaining)
+        if wait > 0:
+            await pubsub.get_message(timeout=wait)
+        return True
+
+    @asynccontextmanager
+    async def _subscription(self):
+        pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        try:
+            yield pubsub
+        finally:
+            await pubsub.aclose()
+
+    @asynccontextmanager
+    async def acquire_lock(self, blocking: bool = True, retry_delay: Optional[float] = None,
+                           blocking_timeout: Optional[float] = None):
+        """락 획득 (async with 블록 종료시 해제, 인자는 RedisLock.acquire_lock 과 동일)"""
+        ttl = await self._try_acquire()
+        if ttl and blocking:
+            deadline = None if blocking_timeout is None else time.monotonic() + blocking_timeout
+            async with self._subscription() as pubsub:
+                while ttl:
+                    ttl = await self._try_acquire()
+                    if ttl and not await self._wait(pubsub, ttl, deadline, retry_delay):
+                        break
+        acquired = not ttl
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await self.release_lock()
+
+    async def wait_released(self, timeout: Optional[float] = None) -> bool:
+        """락이 해제(또는 만료)될 때까지 대기, timeout 내 해제되면 True"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        async with self._subscription() as pubsub:
+            while True:
+                ttl = await self.redis_client.pttl(self.lock_name)
+                if ttl == -2:
+                    return True
+                if not await self._wait(pubsub, ttl, deadline, None):
+                    return False
+
+    async def extend(self, timeout: Optional[float] = None) -> bool:
+        """보유 중인 락의 TTL 재설정, 락을 잃었으면 False"""
+        if self.lock_token is None:
+            return False
+        ttl_ms = int((timeout or self.timeout) * 1000)
+        return bool(await self._extend(keys=[self.lock_name], args=[self.lock_token, ttl_ms]))
+
+    async def _renew(self):
+        while True:
+            await asyncio.sleep(self.timeout / 3)
+            try:
+                if not await self.extend():
+                    logger.warning(f"Lock {self.lock_name} was lost before renewal")
+                    return
+            except redis.RedisError as e:
+                logger.error(f"Lock renewal failed for {self.lock_name}: {e}")
+
+    async def release_lock(self) -> bool:
+        """락 해제 (보유 토큰이 일치할 때만 삭제), 해제했으면 True"""
+        if self._renewer is not None:
+            self._renewer.cancel()
+            self._renewer = None
+        if self.lock_token is None:
+            return False
+        token, self.lock_token = self.lock_token, None
+        return bool(await self._release(keys=[self.lock_name], args=[token, self.channel]))
+
+class AsyncRedisCache:
+    """비동기 캐시 관리 (RedisCache 와 같은 키/항목 포맷, 코루틴 함수 지원)"""
+    def __init__(self, config: RedisConfig, redis_client: Optional[aioredis.Redis] = None):
+        self.config = config
+        self.client = redis_client or aioredis.Redis(connection_pool=_create_pool(config, False))
+        self.serializer = RedisSerializer.from_config(config)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refreshing: set = set()
+        self._tasks: set = set()
+
+    def cache_key(self, prefix: str, *args, **kwargs) -> str:
+        """캐시 키 생성"""
+        return make_cache_key(prefix, *args, **kwargs)
+
+    async def invalidate(self, *keys: str):
+        """캐시 키 삭제 및 동기 캐시들의 L1 무효화 메시지 발행"""
+        if not keys:
+            return
+        await self.client.delete(*keys)
+        await self.client.publish(self.config.invalidation_channel, self.serializer.dumps(list(keys)))
+
+    async def _get(self, cache_key: str) -> Optional[list]:
+        raw = await self.client.get(cache_key)
+        return None if raw is None else self.serializer.loads(raw)
+
+    async def _compute_and_store(self, cache_key: str, func: Callable, args: tuple, kwargs: dict,
+                                 timeout: int, stale_ttl: int) -> list:
+        start = time.perf_counter()
+        value = func(*args, **kwargs)
+        if inspect.isawaitable(value):
+            value = await value
+        entry = make_cache_entry(value, time.perf_counter() - start, timeout)
+        await self.client.setex(cache_key, timeout + stale_ttl, self.serializer.dumps(entry))
+        return entry
+
+    async def _single_flight(self, cache_key: str, compute: Callable[[], Awaitable[list]]) -> list:
+        # 이벤트 루프 내 동일 키 계산 공유
+        future = self._inflight.get(cache_key)
+        if future is not None:
+            return await asyncio.shield(future)
+        future = self._inflight[cache_key] = asyncio.get_running_loop().create_future()
+        try:
+            entry = await compute()
+            future.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()     # 대기자가 없을 때 경고 방지
+            raise
+        finally:
+            del self._inflight[cache_key]
+
+    async def _load(self, cache_key: str, compute: Callable[[], Awaitable[list]], lock_timeout: int) -> list:
+        # 캐시 미스 : 분산 락을 얻은 한 워커만 재계산
+        lock = AsyncRedisLock(self.client, f"cache:{cache_key}", lock_timeout)
+        deadline = time.monotonic() + lock_timeout
+        while True:
+            async with lock.acquire_lock(blocking=False) as acquired:
+                if acquired:
+                    return await compute()
+            await lock.wait_released(max(deadline - time.monotonic(), 0))
+            entry = await self._get(cache_key)
+            if entry is not None:
+                return entry
+            if time.monotonic() >= deadline:
+                return await compute()
+
+    def _refresh(self, cache_key: str, compute: Callable[[], Awaitable[list]], lock_timeout: int):
+        # 백그라운드 갱신 태스크 (락을 얻지 못하면 다른 워커가 갱신 중)
+        if cache_key in self._refreshing:
+            return
+        self._refreshing.add(cache_key)
+
+        async def task():
+            try:
+                lock = AsyncRedisLock(self.client, f"cache:{cache_key}", lock_timeout)
+                async with lock.acquire_lock(blocking=False) as acquired:
+                    if acquired:
+                        await compute()
+            except Exception as e:
+                logger.error(f"Cache refresh failed for {cache_key}: {e}")
+            finally:
+                self._refreshing.discard(cache_key)
+
+        refresh = asyncio.ensure_future(task())
+        self._tasks.add(refresh)
+        refresh.add_done_callback(self._tasks.discard)
+
+    def cached(self, timeout: int = 300, stale_ttl: int = 0,
+               early_refresh_beta: float = 1.0, lock_timeout: int = 10):
+        """비동기 캐시 데코레이터 (동기 함수와 코루틴 함수 모두 지원)"""
+        def decorator(func):
+            name = function_key_name(func)
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                cache_key = self.cache_key(name, *args, **kwargs)
+
+                async def compute() -> list:
+                    return await self._compute_and_store(cache_key, func, args, kwargs,
+                                                         timeout, stale_ttl)
+
+                entry = await self._get(cache_key)
+                metrics.inc('redis_cache_requests_total',
+                            {'function': name, 'result': 'miss' if entry is None else 'hit'})
+                if entry is None:
+                    entry = await self._single_flight(
+                        cache_key, lambda: self._load(cache_key, compute, lock_timeout))
+                    return entry[0]
+                if should_refresh(entry, early_refresh_beta):
+                    self._refresh(cache_key, compute, lock_timeout)
+                return entry[0]
+
+            async def invalidate(*args, **kwargs):
+                await self.invalidate(self.cache_key(name, *args, **kwargs))
+
+            wrapper.invalidate = invalidate
+            return wrapper
+        return decorator
+
+class AsyncRedisQueue:
+    """비동기 큐 관리 (RedisQueue 와 같은 키, 처리 중 목록, 임대 ZSET 사용)"""
+    def __init__(self, redis_client: aioredis.Redis, queue_name: str,
+                 serializer: Optional[RedisSerializer] = None,
+                 consumer_id: Optional[str] = None, visibility_timeout: int = 30,
+                 batch_size: int = 500):
+        self.redis_client = redis_client
+        self.queue_name = f"queue:{queue_name}"
+        self.serializer = serializer or RedisSerializer()
+        self.consumer_id = consumer_id or secrets.token_hex(8)
+        self.visibility_timeout = visibility_timeout
+        self.batch_size = batch_size
+        self.processing_name = f"{self.queue_name}:processing:{self.consumer_id}"
+        self.leases_name = f"{self.queue_name}:leases"
+        self._requeue = redis_client.register_script(REQUEUE_SCRIPT)
+
+    async def enqueue(self, item: Any):
+        """큐에 항목 추가"""
+        await self.redis_client.rpush(self.queue_name, self.serializer.dumps(item))
+
+    async def enqueue_many(self, items: List[Any]):
+        """여러 항목을 batch_size 단위 RPUSH 파이프라인으로 추가"""
+        payloads = [self.serializer.dumps(item) for item in items]
+        if not payloads:
+            return
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for i in range(0, len(payloads), self.batch_size):
+                pipe.rpush(self.queue_name, *payloads[i:i + self.batch_size])
+            await pipe.execute()
+
+    async def dequeue(self, timeout: int = 0) -> Optional[Any]:
+        """큐에서 항목 제거 및 반환"""
+        result = await self.redis_client.blpop(self.queue_name, timeout=timeout)
+        if result:
+            return self.serializer.loads(result[1])
+        return None
+
+    async def dequeue_batch(self, n: int, timeout: int = 0) -> List[QueueMessage]:
+        """최대 n 개 항목을 처리 중 목록으로 옮겨 반환"""
+        async def move(count: int) -> List[bytes]:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                self._lease(pipe)
+                for _ in range(count):
+                    pipe.lmove(self.queue_name, self.processing_name, 'LEFT', 'RIGHT')
+                return [raw for raw in (await pipe.execute())[1:] if raw is not None]
+
+        raws = await move(n)
+        if not raws and timeout is not None:
+            first = await self.redis_client.blmove(self.queue_name, self.processing_name,
+                                                   timeout, 'LEFT', 'RIGHT')
+            if first is None:
+                return []
+            raws = [first] + (await move(n - 1) if n > 1 else [])
+            await self._lease(self.redis_client)
+        return [QueueMessage(self.serializer.loads(raw), raw) for raw in raws]
+
+    async def ack(self, *messages: QueueMessage):
+        """처리 완료된 메시지를 처리 중 목록에서 제거"""
+        if not messages:
+            return
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for message in messages:
+                pipe.lrem(self.processing_name, 1, message.raw)
+            await pipe.execute()
+
+    async def extend_lease(self):
+        """처리 기한 연장"""
+        await self._lease(self.redis_client)
+
+    def _lease(self, client):
+        deadline = int((time.time() + self.visibility_timeout) * 1000)
+        return client.zadd(self.leases_name, {self.processing_name: deadline})
+
+    async def requeue_expired(self) -> int:
+        """처리 기한이 지난 항목을 큐로 되돌리고 개수 반환"""
+        return await self._requeue(keys=[self.leases_name, self.queue_name],
+                                   args=[int(time.time() * 1000)])
+
+    async def size(self) -> int:
+        """큐 크기 반환"""
+        return await self.redis_client.llen(self.queue_name)
+
+class AsyncRedisPubSub:
+    """비동기 발행/구독 관리 (콜백은 일반 함수 또는 코루틴 함수)"""
+    def __init__(self, redis_client: aioredis.Redis, serializer: Optional[RedisSerializer] = None):
+        self.redis_client = redis_client
+        self.pubsub = self.redis_client.pubsub()
+        self.serializer = serializer or RedisSerializer()
+        self._callbacks: Dict[str, Callable[[Any], Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def publish(self, channel: str, message: Any):
+        """메시지 발행"""
+        await self.redis_client.publish(channel, self.serializer.dumps(message))
+
+    async def subscribe(self, channel: str, callback: Callable[[Any], Any]):
+        """채널 구독"""
+        self._callbacks[channel] = callback
+        await self.pubsub.subscribe(channel)
+
+    async def listen(self):
+        """메시지 수신 (비동기 제너레이터)"""
+        async for message in self.pubsub.listen():
+            if message['type'] == 'message':
+                yield self.serializer.loads(message['data'])
+
+    async def _run(self):
+        async for message in self.pubsub.listen():
+            if message['type'] != 'message':
+                continue
+            channel = message['channel']
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            callback = self._callbacks.get(channel)
+            if callback is None:
+                continue
+            try:
+                result = callback(self.serializer.loads(message['data']))
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"PubSub callback failed on {channel}: {e}")
+
+    def start(self) -> asyncio.Task:
+        """구독 콜백을 실행하는 백그라운드 태스크 시작"""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        return self._task
+
+    async def stop(self):
+        """백그라운드 태스크 종료 및 구독 해제"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.pubsub.aclose()
+
+    def dispatcher(self, workers: int = 4, queue_size: int = 1000,
+                   overflow: str = 'drop_oldest') -> 'AsyncPubSubDispatcher':
+        """같은 클라이언트/직렬화 설정을 사용하는 비차단 디스패처 생성 (start() 로 시작)"""
+        return AsyncPubSubDispatcher(self.redis_client, self.serializer, workers, queue_size, overflow)
+
+class AsyncPubSubDispatcher:
+    """비동기 발행/구독 디스패처 (PubSubDispatcher 와 같은 구독 키 해시 분배, 배치, overflow 정책, 지표)
+
+    수신 태스크가 워커 태스크별 bounded 큐에 메시지를 분배하고, 콜백은 일반 함수 또는 코루틴 함수.
+    """
+    def __init__(self, redis_client: aioredis.Redis, serializer: Optional[RedisSerializer] = None,
+                 workers: int = 4, queue_size: int = 1000, overflow: str = 'drop_oldest'):
+        if overflow not in PubSubDispatcher.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.redis_client = redis_client
+        self.serializer = serializer or RedisSerializer()
+        self.overflow = overflow
+        self.pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        self._subscriptions: Dict[str, Subscription] = {}
+        self._queues = [asyncio.Queue(maxsize=queue_size) for _ in range(workers)]
+        self._tasks: List[asyncio.Task] = []
+        self._reader: Optional[asyncio.Task] = None
+        self._dispatched = 0
+        self._dropped = 0
+
+    async def subscribe(self, channel: str, callback: Callable, batch_size: int = 1,
+                        batch_interval: float = 0.05):
+        """채널 구독 (callback(message) 또는 batch_size > 1 이면 callback([message, ...]))"""
+        self._subscriptions[channel] = Subscription(channel, callback, False, batch_size, batch_interval)
+        await self.pubsub.subscribe(channel)
+
+    async def psubscribe(self, pattern: str, callback: Callable, batch_size: int = 1,
+                         batch_interval: float = 0.05):
+        """패턴 구독 (callback(channel, message) 또는 callback([(channel, message), ...]))"""
+        self._subscriptions[pattern] = Subscription(pattern, callback, True, batch_size, batch_interval)
+        await self.pubsub.psubscribe(pattern)
+
+    async def unsubscribe(self, channel: str):
+        self._subscriptions.pop(channel, None)
+        await self.pubsub.unsubscribe(channel)
+
+    async def punsubscribe(self, pattern: str):
+        self._subscriptions.pop(pattern, None)
+        await self.pubsub.punsubscribe(pattern)
+
+    def start(self) -> 'AsyncPubSubDispatcher':
+        """수신 태스크와 워커 태스크 시작"""
+        if self._reader is None:
+            self._tasks = [asyncio.ensure_future(self._work(q)) for q in self._queues]
+            self._reader = asyncio.ensure_future(self._read())
+        return self
+
+    async def stop(self):
+        """수신 중단, 워커 큐에 남은 메시지 처리 후 종료"""
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        for q in self._queues:
+            await q.put(None)
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
+        await self.pubsub.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        """백프레셔 지표 : 워커별 큐 적재량, 분배/버린 메시지 수"""
+        return {'queue_depth': [q.qsize() for q in self._queues],
+                'queue_capacity': self._queues[0].maxsize,
+                'dispatched': self._dispatched,
+                'dropped': self._dropped}
+
+    def _batch_interval(self, key: str) -> float:
+        subscription = self._subscriptions.get(key)
+        return subscription.batch_interval if subscription else 0
+
+    async def _read(self):
+        decode = PubSubDispatcher._decode
+        while True:
+            try:
+                message = await self.pubsub.get_message(timeout=0.5)
+            except redis.RedisError as e:
+                logger.error(f"PubSub dispatcher read failed: {e}")
+                await asyncio.sleep(1)
+                continue
+            if message is None or message['type'] not in ('message', 'pmessage'):
+                continue
+            key = decode(message['pattern'] if message['type'] == 'pmessage' else message['channel'])
+            item = (key, decode(message['channel']), message['data'], time.monotonic())
+            await self._dispatch(zlib.crc32(key.encode()) % len(self._queues), item)
+            # 버퍼에 쌓인 메시지는 I/O 대기 없이 읽히므로 워커 태스크에 실행 기회를 양보
+            await asyncio.sleep(0)
+
+    def _drop(self, item: tuple):
+        self._dropped += 1
+        metrics.inc('redis_pubsub_messages_total', {'subscription': item[0], 'result': 'dropped'})
+
+    async def _dispatch(self, worker: int, item: tuple):
+        q = self._queues[worker]
+        if self.overflow == 'block':
+            await q.put(item)
+        else:
+            try:
+                q.put_nowait(item)
+            except asyncio.QueueFull:
+                if self.overflow == 'drop_newest':
+                    self._drop(item)
+                    return
+                self._drop(q.get_nowait())
+                q.put_nowait(item)
+        self._dispatched += 1
+        metrics.inc('redis_pubsub_messages_total', {'subscription': item[0], 'result': 'dispatched'})
+        metrics.set_gauge('redis_pubsub_queue_depth', q.qsize(), {'worker': worker})
+
+    async def _work(self, q: asyncio.Queue):
+        # 배치 구간은 워커가 첫 메시지를 꺼낸 시점부터 계산
+        pending: Dict[str, List[tuple]] = {}
+        started: Dict[str, float] = {}
+        while True:
+            timeout = None
+            if pending:
+                due = min(started[key] + self._batch_interval(key) for key in pending)
+                timeout = max(due - time.monotonic(), 0)
+            try:
+                item = await asyncio.wait_for(q.get(), timeout)
+            except asyncio.TimeoutError:
+                item = ()
+            if item is None:
+                for key in list(pending):
+                    await self._invoke(key, pending.pop(key))
+                return
+            if item:
+                subscription = self._subscriptions.get(item[0])
+                if subscription is None:
+                    continue
+                if subscription.batch_size <= 1:
+                    await self._invoke(item[0], [item])
+                    continue
+                if item[0] not in pending:
+                    pending[item[0]], started[item[0]] = [], time.monotonic()
+                batch = pending[item[0]]
+                batch.append(item)
+                if len(batch) >= subscription.batch_size:
+                    await self._invoke(item[0], pending.pop(item[0]))
+            now = time.monotonic()
+            for key in [k for k in pending if now - started[k] >= self._batch_interval(k)]:
+                await self._invoke(key, pending.pop(key))
+
+    async def _invoke(self, key: str, items: List[tuple]):
+        subscription = self._subscriptions.get(key)
+        if subscription is None:
+            return
+        labels = {'subscription': key}
+        now = time.monotonic()
+        for item in items:
+            metrics.observe('redis_pubsub_lag_seconds', now - item[3], labels)
+        try:
+            messages = [self.serializer.loads(item[2]) for item in items]
+            if subscription.pattern:
+                messages = [(item[1], message) for item, message in zip(items, messages)]
+            if subscription.batch_size > 1:
+                result = subscription.callback(messages)
+            elif subscription.pattern:
+                result = subscription.callback(*messages[0])
+            else:
+                result = subscription.callback(messages[0])
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            metrics.inc('redis_pubsub_messages_total', {**labels, 'result': 'failed'}, len(items))
+            logger.error(f"PubSub callback failed on {key}: {e}")
+
+class AsyncRedisRateLimiter:
+    """비동기 속도 제한 관리 (RedisRateLimiter 와 같은 Lua 스크립트와 키 사용)"""
+    def __init__(self, redis_client: aioredis.Redis, key_prefix: str, limit: int, window: int,
+                 algorithm: str = 'fixed_window'):
+        if algorithm not in RATE_LIMIT_SCRIPTS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self.limit = limit
+        self.window = window
+        self.algorithm = algorithm
+        self._script = redis_client.register_script(RATE_LIMIT_SCRIPTS[algorithm])
+
+    @staticmethod
+    async def load_scripts(redis_client: aioredis.Redis):
+        """모든 속도 제한 스크립트를 서버에 미리 적재"""
+        for script in RATE_LIMIT_SCRIPTS.values():
+            await redis_client.script_load(script)
+
+    def _args(self) -> list:
+        return [self.limit, self.window * 1000, secrets.token_hex(8)]
+
+    @staticmethod
+    def _result(reply: list) -> RateLimitResult:
+        allowed, remaining, reset_ms = reply
+        return RateLimitResult(bool(allowed), max(int(remaining), 0), max(int(reset_ms), 0) / 1000)
+
+    async def check(self, identifier: str) -> RateLimitResult:
+        """요청 허용 여부, 남은 횟수, 초기화 시간 조회"""
+        key = f"{self.key_prefix}:{identifier}"
+        return self._result(await self._script(keys=[key], args=self._args()))
+
+    async def is_allowed(self, identifier: str) -> bool:
+        """요청 허용 여부 확인"""
+        return (await self.check(identifier)).allowed
+
+    async def check_many(self, identifiers: List[str]) -> List[RateLimitResult]:
+        """여러 식별자를 하나의 파이프라인으로 판정"""
+        async def run() -> list:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for identifier in identifiers:
+                    pipe.evalsha(self._script.sha, 1, f"{self.key_prefix}:{identifier}", *self._args())
+                return await pipe.execute()
+
+        try:
+            replies = await run()
+        except redis.exceptions.NoScriptError:
+            await self.redis_client.script_load(self._script.script)
+            replies = await run()
+        return [self._result(reply) for reply in replies]
+
+class AsyncRedisDataManager:
+    """비동기 데이터 관리 (RedisDataManager 와 같은 직렬화 포맷과 청크 저장 방식)"""
+    def __init__(self, redis_client: aioredis.Redis, serializer: Optional[RedisSerializer] = None,
+                 batch_size: int = 500, chunk_size: int = 0):
+        self.redis_client = redis_client
+        self.serializer = serializer or RedisSerializer()
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+
+    def _chunks(self, items: List[Any]):
+        for i in range(0, len(items), self.batch_size):
+            yield items[i:i + self.batch_size]
+
+    def _write(self, pipe, key: str, payload: bytes, ttl: Optional[int]):
+        if not self.chunk_size or len(payload) <= self.chunk_size:
+            pipe.set(key, payload, ex=ttl or None)
+            return
+        manifest, chunks = split_chunks(key, payload, self.chunk_size)
+        for name, chunk in chunks:
+            pipe.set(name, chunk, ex=ttl or None)
+        pipe.set(key, manifest, ex=ttl or None)
+
+    async def _stale_chunks(self, keys: List[str]) -> List[str]:
+        if not self.chunk_size or not keys:
+            return []
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.getrange(key, 0, CHUNK_MANIFEST_MAX)
+            prefixes = await pipe.execute(raise_on_error=False)
+        stale = []
+        for key, prefix in zip(keys, prefixes):
+            manifest = None if isinstance(prefix, Exception) else parse_chunk_manifest(prefix)
+            if manifest:
+                stale.extend(manifest_chunk_keys(key, manifest))
+        return stale
+
+    async def _read_chunks(self, key: str, manifest: Dict[str, Any], retries: int = 3) -> Optional[bytes]:
+        for _ in range(retries):
+            parts = []
+            for names in self._chunks(manifest_chunk_keys(key, manifest)):
+                parts.extend(await self.redis_client.mget(names))
+            if all(part is not None for part in parts):
+                return b''.join(parts)
+            data = await self.redis_client.get(key)
+            manifest = parse_chunk_manifest(data)
+            if manifest is None:
+                return data
+        logger.warning(f"Chunked value {key} kept changing while reading")
+        return None
+
+    async def _load(self, key: str, data: Optional[bytes]) -> Optional[Any]:
+        manifest = parse_chunk_manifest(data)
+        if manifest is not None:
+            data = await self._read_chunks(key, manifest)
+        return self.serializer.loads(data) if data else None
+
+    async def set_data(self, key: str, value: Any, expire: Optional[int] = None):
+        """데이터 저장"""
+        serialized = self.serializer.dumps(value)
+        if not self.chunk_size:
+            await self.redis_client.set(key, serialized, ex=expire or None)
+            return
+        stale = await self._stale_chunks([key])
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            self._write(pipe, key, serialized, expire)
+            for name in stale:
+                pipe.expire(name, CHUNK_GRACE_TTL)
+            await pipe.execute()
+
+    async def get_data(self, key: str) -> Optional[Any]:
+        """데이터 조회"""
+        return await self._load(key, await self.redis_client.get(key))
+
+    async def iter_chunks(self, key: str, prefetch: int = 4) -> AsyncIterator[bytes]:
+        """저장된 직렬화 데이터를 청크 단위로 반환 (RedisDataManager.iter_chunks 참고)"""
+        data = await self.redis_client.get(key)
+        manifest = parse_chunk_manifest(data)
+        if manifest is None:
+            if data:
+                yield data
+            return
+        names = manifest_chunk_keys(key, manifest)
+        for i in range(0, len(names), prefetch):
+            for name, chunk in zip(names[i:i + prefetch], await self.redis_client.mget(names[i:i + prefetch])):
+                if chunk is None:
+                    raise KeyError(f"Chunk {name} is missing (value was overwritten or expired)")
+                yield chunk
+
+    async def set_many(self, mapping: Dict[str, Any],
+                       expire: Union[int, Dict[str, int], None] = None, transaction: bool = False):
+        """여러 데이터 저장"""
+        for chunk in self._chunks(list(mapping.items())):
+            stale = await self._stale_chunks([key for key, _ in chunk])
+            async with self.redis_client.pipeline(transaction=transaction) as pipe:
+                for key, value in chunk:
+                    ttl = expire.get(key) if isinstance(expire, dict) else expire
+                    self._write(pipe, key, self.serializer.dumps(value), ttl)
+                for name in stale:
+                    pipe.expire(name, CHUNK_GRACE_TTL)
+                await pipe.execute()
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Optional[Any]]:
+        """여러 데이터 조회 (없는 키는 None)"""
+        result = {}
+        for chunk in self._chunks(list(keys)):
+            values = await self.redis_client.mget(chunk)
+            for key, data in zip(chunk, values):
+                result[key] = await self._load(key, data)
+        return result
+
+    async def delete_many(self, keys: List[str]) -> int:
+        """여러 데이터 삭제 후 삭제된 키 수 반환 (청크 값은 청크도 삭제)"""
+        chunks = list(self._chunks(list(keys)))
+        if not chunks:
+            return 0
+        stale = [name for chunk in chunks for name in await self._stale_chunks(chunk)]
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for chunk in chunks:
+                pipe.delete(*chunk)
+            for names in self._chunks(stale):
+                pipe.delete(*names)
+            return sum((await pipe.execute())[:len(chunks)])
+
+    async def increment(self, key: str, amount: int = 1) -> int:
+        """증가"""
+        return await self.redis_client.incrby(key, amount)
+
+    async def expire_at(self, key: str, timestamp: datetime):
+        """만료 시간 설정"""
+        await self.redis_client.expireat(key, int(timestamp.timestamp()))
+
+class AsyncRedisFramework:
+    """통합 비동기 Redis 프레임워크 (이벤트 루프 내에서 생성/사용)"""
+    def __init__(self, config: RedisConfig):
+        self.config = config
+        self.client = aioredis.Redis(connection_pool=_create_pool(config, config.decode_responses))
+        self.binary_client = aioredis.Redis(connection_pool=_create_pool(config, False))
+        self.serializer = RedisSerializer.from_config(config)
+
+        # 각 기능 초기화
+        self.cache = AsyncRedisCache(config, self.binary_client)
+        self.data_manager = AsyncRedisDataManager(self.binary_client, self.serializer, config.batch_size,
+                                                  config.chunk_size)
+        self.pubsub = AsyncRedisPubSub(self.binary_client, self.serializer)
+
+    async def initialize(self):
+        """속도 제한 스크립트 사전 적재 (애플리케이션 시작시 호출)"""
+        try:
+            await AsyncRedisRateLimiter.load_scripts(self.client)
+        except redis.RedisError as e:
+            logger.warning(f"Rate limit script preload failed: {e}")
+
+    async def close(self):
+        """연결 풀 정리 (애플리케이션 종료시 호출)"""
+        await self.client.aclose()
+        await self.binary_client.aclose()
+
+    async def ping(self) -> bool:
+        """연결 상태 확인"""
+        try:
+            return await self.client.ping()
+        except redis.ConnectionError:
+            return False
+
+    def create_lock(self, lock_name: str, timeout: int = 10, auto_renew: bool = False) -> AsyncRedisLock:
+        """락 생성"""
+        return AsyncRedisLock(self.client, lock_name, timeout, auto_renew)
+
+    def create_queue(self, queue_name: str, consumer_id: Optional[str] = None,
+                     visibility_timeout: int = 30) -> AsyncRedisQueue:
+        """큐 생성"""
+        return AsyncRedisQueue(self.binary_client, queue_name, self.serializer,
+                               consumer_id, visibility_timeout, self.config.batch_size)
+
+    def create_rate_limiter(self, key_prefix: str, limit: int, window: int,
+                            algorithm: str = 'fixed_window') -> AsyncRedisRateLimiter:
+        """속도 제한기 생성"""
+        return AsyncRedisRateLimiter(self.client, key_prefix, limit, window, algorithm)
+
+"""
+# 사용 예시 (FastAPI)
+redis_framework = AsyncRedisFramework(RedisConfig())
+
+@redis_framework.cache.cached(timeout=300)
+async def get_user_data(user_id: int) -> Dict[str, Any]:
+    return {"user_id": user_id, "name": "Test User"}
+
+@app.on_event("startup")
+async def startup():
+    await redis_framework.initialize()
+
+@app.get("/users/{user_id}")
+async def read_user(user_id: int):
+    limiter = redis_framework.create_rate_limiter("api_calls", 100, 3600)
+    if not await limiter.is_allowed(str(user_id)):
+        raise HTTPException(status_code=429)
+    return await get_user_data(user_id)
+"""
@@ -1,23 +1,244 @@
 import redis
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, Iterator, List, Optional, Union, Callable
 from datetime import datetime, timedelta
 import json
 import pickle
 import hashlib
 import logging
 import time
+import math
+import bisect
+import random
+import secrets
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import wraps
 from contextlib import contextmanager
+from collections import OrderedDict, deque
 import threading
-from dataclasses import dataclass
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    filename='redis_operations.log'
-)
+import queue
+import zlib
+import atexit
+from dataclasses import dataclass, replace
+
+# 선택적 의존성 : 설치된 경우에만 해당 직렬화/압축 포맷 사용 가능
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# 로깅 설정 : 라이브러리는 핸들러를 추가하지 않음 (출력이 필요하면 configure_logging 호출)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+def configure_logging(filename: Optional[str] = 'redis_operations.log',
+                      level: int = logging.INFO) -> logging.Handler:
+    """Redis 프레임워크 로그 출력 설정 (애플리케이션 시작 시 1회 호출, filename=None 이면 stderr)
+
+    import 시점에 basicConfig 로 루트 로거를 설정하던 방식을 대체.
+    하위 로거(비동기 모듈 등)도 같은 핸들러로 출력됨.
+    """
+    handler = logging.FileHandler(filename) if filename else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    return handler
+
+# 지연 시간(초) / 크기(bytes) 히스토그램 기본 버킷
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                   0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+class _Histogram:
+    """고정 버킷 히스토그램 (버킷별 개수는 누적하지 않고 저장, 출력 시 누적)"""
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds: tuple):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[tuple]:
+        result, total = [], 0
+        for bound, count in zip(self.bounds + (math.inf,), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+class RedisMetrics:
+    """컴포넌트별 카운터/게이지/지연 시간 히스토그램 수집
+
+    - 지표는 (이름, 레이블) 단위로 저장, snapshot() 은 dict, to_prometheus() 는 텍스트 포맷 반환
+    - 모듈 전역 인스턴스 metrics 를 모든 컴포넌트가 공유 (enabled=False 로 수집 중단)
+    """
+    HELP = {
+        'redis_cache_requests_total': 'Cache lookups by decorated function and result (l1_hit, hit, miss)',
+        'redis_serializer_seconds': 'Serializer dumps/loads latency',
+        'redis_serializer_payload_bytes': 'Serialized payload size',
+        'redis_lock_acquire_total': 'Lock acquisition attempts by result',
+        'redis_lock_wait_seconds': 'Time spent waiting for a lock until acquired',
+        'redis_queue_depth': 'Queue length observed on the last enqueue or size call',
+        'redis_queue_dequeue_seconds': 'Dequeue call latency including blocking wait',
+        'redis_queue_items_total': 'Queue items by operation',
+        'redis_rate_limit_total': 'Rate limit decisions by result',
+        'redis_counter_commands_saved_total': 'INCRBY commands avoided by CounterAggregator',
+    }
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[tuple, float]] = {}
+        self._gauges: Dict[str, Dict[tuple, float]] = {}
+        self._histograms: Dict[str, Dict[tuple, _Histogram]] = {}
+
+    @staticmethod
+    def _labels(labels: Optional[Dict[str, Any]]) -> tuple:
+        return tuple(sorted(labels.items())) if labels else ()
+
+    def inc(self, name: str, labels: Optional[Dict[str, Any]] = None, value: float = 1):
+        """카운터 증가"""
+        if not self.enabled:
+            return
+        key = self._labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None):
+        """게이지 값 설정"""
+        if not self.enabled:
+            return
+        key = self._labels(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None,
+                buckets: tuple = LATENCY_BUCKETS):
+        """히스토그램에 값 기록 (버킷은 지표 최초 기록 시 고정)"""
+        if not self.enabled:
+            return
+        key = self._labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, labels: Optional[Dict[str, Any]] = None):
+        """with 블록 실행 시간을 히스토그램에 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, labels)
+
+    def reset(self):
+        """수집된 지표 초기화"""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """데코레이터 함수별 캐시 조회 수와 적중률"""
+        stats: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            series = dict(self._counters.get('redis_cache_requests_total', {}))
+        for key, value in series.items():
+            labels = dict(key)
+            function = stats.setdefault(labels['function'], {'l1_hit': 0, 'hit': 0, 'miss': 0})
+            function[labels['result']] = function.get(labels['result'], 0) + value
+        for function in stats.values():
+            total = function['l1_hit'] + function['hit'] + function['miss']
+            function['hit_ratio'] = (function['l1_hit'] + function['hit']) / total if total else 0.0
+        return stats
+
+    def snapshot(self) -> Dict[str, Any]:
+        """전체 지표를 dict 로 반환 (히스토그램 버킷은 누적 개수)"""
+        with self._lock:
+            counters = {name: [{'labels': dict(key), 'value': value} for key, value in series.items()]
+                        for name, series in self._counters.items()}
+            gauges = {name: [{'labels': dict(key), 'value': value} for key, value in series.items()]
+                      for name, series in self._gauges.items()}
+            histograms = {
+                name: [{'labels': dict(key), 'count': h.count, 'sum': h.sum,
+                        'buckets': dict(h.cumulative())} for key, h in series.items()]
+                for name, series in self._histograms.items()
+            }
+        return {'counters': counters, 'gauges': gauges, 'histograms': histograms,
+                'cache': self.cache_stats()}
+
+    @staticmethod
+    def _format_labels(labels: Dict[str, Any], extra: str = '') -> str:
+        parts = []
+        for k, v in labels.items():
+            v = str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            parts.append(f'{k}="{v}"')
+        if extra:
+            parts.append(extra)
+        return '{' + ','.join(parts) + '}' if parts else ''
+
+    def to_prometheus(self, include_pools: bool = True) -> str:
+        """Prometheus 텍스트 포맷(0.0.4)으로 출력 (include_pools : 커넥션 풀 통계 포함)"""
+        snapshot = self.snapshot()
+        lines = []
+
+        def header(name: str, kind: str):
+            if name in self.HELP:
+                lines.append(f"# HELP {name} {self.HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for name, series in sorted(snapshot['counters'].items()):
+            header(name, 'counter')
+            lines.extend(f"{name}{self._format_labels(s['labels'])} {s['value']}" for s in series)
+        for name, series in sorted(snapshot['gauges'].items()):
+            header(name, 'gauge')
+            lines.extend(f"{name}{self._format_labels(s['labels'])} {s['value']}" for s in series)
+        for name, series in sorted(snapshot['histograms'].items()):
+            header(name, 'histogram')
+            for s in series:
+                for bound, count in s['buckets'].items():
+                    le = 'le="+Inf"' if bound == math.inf else f'le="{bound}"'
+                    lines.append(f"{name}_bucket{self._format_labels(s['labels'], le)} {count}")
+                lines.append(f"{name}_sum{self._format_labels(s['labels'])} {s['sum']}")
+                lines.append(f"{name}_count{self._format_labels(s['labels'])} {s['count']}")
+        if include_pools:
+            pools = RedisConnectionPool.all_stats()
+            for stat, name, kind in (('in_use', 'redis_pool_in_use', 'gauge'),
+                                     ('idle', 'redis_pool_idle', 'gauge'),
+                                     ('created_total', 'redis_pool_connections_created_total', 'counter'),
+                                     ('checkouts', 'redis_pool_checkouts_total', 'counter')):
+                header(name, kind)
+                for pool_name, pool_stats in pools.items():
+                    for pool_kind, values in pool_stats.items():
+                        labels = {'pool': pool_name, 'kind': pool_kind}
+                        lines.append(f"{name}{self._format_labels(labels)} {values[stat]}")
+        return '\n'.join(lines) + '\n'
+
+metrics = RedisMetrics()
 
 @dataclass
 class RedisConfig:
@@ -30,190 +251,2131 @@ class RedisConfig:
     retry_on_timeout: bool = True
     max_connections: int = 10
     password: Optional[str] = None
+    # 프로세스 내부(L1) 캐시 설정 : local_cache_size 가 0 이면 L1 비활성화
+    local_cache_size: int = 0
+    local_cache_ttl: int = 60
+    local_cache_policy: str = 'lru'     # 'lru' 또는 'lfu'
+    invalidation_channel: str = 'cache:invalidate'
+    # 직렬화 설정 : 'pickle' | 'msgpack' | 'orjson', 압축 : None | 'zlib' | 'zstd' | 'lz4'
+    serializer: str = 'pickle'
+    compression: Optional[str] = None
+    compression_threshold: int = 1024
+    # 대량 처리(get_many/set_many/delete_many) 시 한 번의 왕복에 보낼 키 수
+    batch_size: int = 500
+    # 큐 백엔드 : 'list' (RedisQueue) 또는 'stream' (RedisStreamQueue)
+    queue_backend: str = 'list'
+    # 연결 풀 대기 시간 : 지정시 max_connections 초과 요청은 예외 대신 최대 pool_timeout 초 대기
+    pool_timeout: Optional[float] = None
+    # RedisDataManager 청크 저장 : 직렬화 크기가 chunk_size(bytes)를 넘는 값은 여러 키로 분할 (0 이면 비활성화)
+    chunk_size: int = 0
+
+class _PoolTelemetry:
+    """연결 풀 계측 (사용 중/유휴 연결 수, 체크아웃 대기 시간, 연결 생성 속도)"""
+    def _init_telemetry(self):
+        self._stats_lock = threading.Lock()
+        self._in_use = 0
+        self._created_total = 0
+        self._created_at: deque = deque(maxlen=1000)
+        self._checkouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def make_connection(self):
+        connection = super().make_connection()
+        with self._stats_lock:
+            self._created_total += 1
+            self._created_at.append(time.monotonic())
+        return connection
+
+    def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+        connection = super().get_connection(*args, **kwargs)
+        wait = time.perf_counter() - start
+        with self._stats_lock:
+            self._in_use += 1
+            self._checkouts += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+        return connection
+
+    def release(self, connection):
+        super().release(connection)
+        with self._stats_lock:
+            self._in_use = max(self._in_use - 1, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 지표 스냅샷"""
+        with self._stats_lock:
+            now = time.monotonic()
+            recent = sum(1 for created in self._created_at if now - created <= 60)
+            # ConnectionPool 은 _created_connections, BlockingConnectionPool 은 _connections 로 관리
+            total = getattr(self, '_created_connections', None)
+            if total is None:
+                total = len(getattr(self, '_connections', []))
+            return {
+                'max_connections': self.max_connections,
+                'in_use': self._in_use,
+                'idle': max(total - self._in_use, 0),
+                'created_total': self._created_total,
+                'creation_rate_per_sec': recent / 60,
+                'checkouts': self._checkouts,
+                'checkout_wait_avg_ms': self._wait_total / self._checkouts * 1000 if self._checkouts else 0.0,
+                'checkout_wait_max_ms': self._wait_max * 1000,
+            }
+
+class InstrumentedConnectionPool(_PoolTelemetry, redis.ConnectionPool):
+    """계측 연결 풀 (연결 수 초과시 예외)"""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._init_telemetry()
+
+class InstrumentedBlockingConnectionPool(_PoolTelemetry, redis.BlockingConnectionPool):
+    """계측 연결 풀 (연결 수 초과시 대기)"""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._init_telemetry()
 
 class RedisConnectionPool:
-    """Redis 연결 풀 관리"""
-    _instance = None
+    """Redis 연결 풀 관리 (설정별 풀 레지스트리 : 같은 접속 설정은 같은 풀 공유)"""
+    _instances: Dict[tuple, 'RedisConnectionPool'] = {}
     _lock = threading.Lock()
 
+    @staticmethod
+    def _registry_key(config: RedisConfig) -> tuple:
+        return (config.host, config.port, config.db, config.password, config.decode_responses,
+                config.max_connections, config.pool_timeout)
+
     def __new__(cls, config: RedisConfig):
+        key = cls._registry_key(config)
+        with cls._lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance.config = config
+                instance.pool = cls._create_pool(config, config.decode_responses)
+                # 직렬화된 값(bytes)을 다루는 컴포넌트용 풀
+                instance.binary_pool = cls._create_pool(config, False)
+                cls._instances[key] = instance
+        return instance
+
+    @staticmethod
+    def _create_pool(config: RedisConfig, decode_responses: bool) -> redis.ConnectionPool:
+        kwargs = dict(
+            host=config.host,
+            port=config.port,
+            db=config.db,
+            decode_responses=decode_responses,
+            password=config.password,
+            max_connections=config.max_connections
+        )
+        if config.pool_timeout is not None:
+            return InstrumentedBlockingConnectionPool(timeout=config.pool_timeout, **kwargs)
+        return InstrumentedConnectionPool(**kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """이 설정의 풀 지표 (text / binary)"""
+        return {'text': self.pool.stats(), 'binary': self.binary_pool.stats()}
+
+    @classmethod
+    def all_stats(cls) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """레지스트리의 모든 풀 지표 (키 : host:port/db)"""
         with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance.pool = redis.ConnectionPool(
-                    host=config.host,
-                    port=config.port,
-                    db=config.db,
-                    decode_responses=config.decode_responses,
-                    password=config.password,
-                    max_connections=config.max_connections
-                )
-        return cls._instance
+            instances = list(cls._instances.values())
+        return {f"{i.config.host}:{i.config.port}/{i.config.db}": i.stats() for i in instances}
 
     def get_connection(self) -> redis.Redis:
         return redis.Redis(connection_pool=self.pool)
 
+    def get_binary_connection(self) -> redis.Redis:
+        """응답을 디코딩하지 않는(bytes) 연결 반환"""
+        return redis.Redis(connection_pool=self.binary_pool)
+
+class RedisSerializer:
+    """직렬화 및 압축 관리
+
+    저장 포맷 : 헤더 1바이트(상위 4비트 직렬화 포맷, 하위 4비트 압축 방식) + 본문.
+    헤더가 없는 기존 pickle 데이터(0x80 으로 시작)도 그대로 읽을 수 있어 신/구 포맷이 공존 가능.
+    """
+    FORMATS = {'pickle': 1, 'msgpack': 2, 'orjson': 3}
+    CODECS = {None: 0, 'zlib': 1, 'zstd': 2, 'lz4': 3}
+    PICKLE_PROTOCOL = 5
+
+    def __init__(self, format: str = 'pickle', compression: Optional[str] = None,
+                 compression_threshold: int = 1024):
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown serializer format: {format}")
+        if compression not in self.CODECS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self._check_available(self.FORMATS[format], self.CODECS[compression])
+        self.format = format
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self._format_id = self.FORMATS[format]
+        self._codec_id = self.CODECS[compression]
+        self._dumps_labels = {'op': 'dumps', 'format': format}
+        self._loads_labels = {'op': 'loads', 'format': format}
+
+    @classmethod
+    def from_config(cls, config: RedisConfig) -> 'RedisSerializer':
+        return cls(config.serializer, config.compression, config.compression_threshold)
+
+    def dumps(self, value: Any) -> bytes:
+        """직렬화 (threshold 이상 크기일 때만 압축)"""
+        start = time.perf_counter()
+        data = self._dumps(value)
+        self._record(self._dumps_labels, start, len(data))
+        return data
+
+    def loads(self, data: bytes) -> Any:
+        """역직렬화 (헤더에 기록된 포맷 기준이므로 설정과 다른 포맷도 읽음)"""
+        start = time.perf_counter()
+        value = self._loads(data)
+        self._record(self._loads_labels, start, len(data))
+        return value
+
+    @staticmethod
+    def _record(labels: Dict[str, str], start: float, size: int):
+        if metrics.enabled:
+            metrics.observe('redis_serializer_seconds', time.perf_counter() - start, labels)
+            metrics.observe('redis_serializer_payload_bytes', size, labels, SIZE_BUCKETS)
+
+    def _dumps(self, value: Any) -> bytes:
+        body = self._encode(self._format_id, value)
+        codec_id = 0
+        if self._codec_id and len(body) >= self.compression_threshold:
+            codec_id = self._codec_id
+            body = self._compress(codec_id, body)
+        return bytes(((self._format_id << 4) | codec_id,)) + body
+
+    def _loads(self, data: bytes) -> Any:
+        if data[0] == 0x80:     # 헤더 없는 기존 pickle 데이터
+            return pickle.loads(data)
+        format_id, codec_id = data[0] >> 4, data[0] & 0x0F
+        self._check_available(format_id, codec_id)
+        body = memoryview(data)[1:]
+        if codec_id:
+            body = self._decompress(codec_id, body)
+        return self._decode(format_id, body)
+
+    @staticmethod
+    def _check_available(format_id: int, codec_id: int):
+        if format_id not in (1, 2, 3) or codec_id not in (0, 1, 2, 3):
+            raise ValueError(f"Unknown serialization header: {format_id}/{codec_id}")
+        if {2: msgpack, 3: orjson}.get(format_id, pickle) is None or \
+                {2: zstandard, 3: lz4_frame}.get(codec_id, zlib) is None:
+            raise ImportError("msgpack / orjson / zstandard / lz4 package is required for this format")
+
+    def _encode(self, format_id: int, value: Any) -> bytes:
+        if format_id == 1:
+            return pickle.dumps(value, protocol=self.PICKLE_PROTOCOL)
+        if format_id == 2:
+            return msgpack.packb(value, use_bin_type=True)
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    @staticmethod
+    def _decode(format_id: int, body) -> Any:
+        if format_id == 1:
+            return pickle.loads(body)
+        if format_id == 2:
+            return msgpack.unpackb(body, raw=False, strict_map_key=False)
+        return orjson.loads(body)
+
+    @staticmethod
+    def _compress(codec_id: int, body: bytes) -> bytes:
+        if codec_id == 1:
+            return zlib.compress(body)
+        if codec_id == 2:
+            return zstandard.ZstdCompressor().compress(body)
+        return lz4_frame.compress(body)
+
+    @staticmethod
+    def _decompress(codec_id: int, body) -> bytes:
+        if codec_id == 1:
+            return zlib.decompress(body)
+        if codec_id == 2:
+            return zstandard.ZstdDecompressor().decompress(body)
+        return lz4_frame.decompress(body)
+
+_MISSING = object()
+
+class CacheKeyBuilder:
+    """캐시 키 생성기
+
+    인자를 타입 정보가 포함된 정규 바이트열로 인코딩한 뒤 비암호화 해시(xxh3-128, 미설치시 blake2b)로 요약.
+    str() 이 같은 서로 다른 값(1 과 '1' 등)이 같은 키가 되지 않음.
+    키 형태 : {prefix}:{name}:{hash} (name 은 보통 모듈.함수명)
+    """
+    # 이 크기 이상의 버퍼(ndarray 등)는 복사 없이 해시에 직접 전달
+    _DIRECT_UPDATE_SIZE = 4096
+    _SCALARS = frozenset((int, float, str, bytes, bool, type(None)))
+
+    def __init__(self, prefix: str = 'cache'):
+        self.prefix = prefix
+        self._encoders: Dict[type, Callable[[Any], Any]] = {}
+        self._defaults_loaded = False
+
+    def register(self, type_: type, encoder: Callable[[Any], Any]):
+        """사용자 타입 인코더 등록 : encoder(value) 는 값의 내용을 나타내는 bytes(또는 버퍼) 반환"""
+        self._encoders[type_] = encoder
+
+    def _register_defaults(self):
+        # numpy / pandas 는 설치된 경우에만 내용 기반 지문(fingerprint) 등록
+        # 해당 타입의 값이 처음 들어올 때 로드 (import 비용 회피), 사용자가 먼저 등록한 인코더는 유지
+        self._defaults_loaded = True
+        register = self._encoders.setdefault
+        try:
+            import numpy as np
+            register(np.ndarray, lambda a: (
+                f"{a.dtype.str}{a.shape}".encode(),
+                memoryview(np.ascontiguousarray(a)).cast('B') if a.dtype != object else pickle.dumps(a)))
+            register(np.generic, lambda v: f"{v.dtype.str}:{v!r}".encode())
+        except ImportError:
+            pass
+        try:
+            import pandas as pd
+            def frame(value):
+                # 행 해시(uint64) + 컬럼/인덱스 이름 + dtype 으로 내용 지문 생성
+                hashed = pd.util.hash_pandas_object(value, index=True).to_numpy()
+                columns = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+                dtypes = value.dtypes if isinstance(value, pd.DataFrame) else [value.dtype]
+                meta = repr((list(columns), [str(d) for d in dtypes], value.index.names))
+                return meta.encode(), memoryview(hashed).cast('B')
+            register(pd.DataFrame, frame)
+            register(pd.Series, frame)
+        except ImportError:
+            pass
+
+    def _hasher(self):
+        return xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+
+    def _encoder_for(self, value_type: type) -> Optional[Callable[[Any], Any]]:
+        if not self._defaults_loaded and value_type.__module__.split('.')[0] in ('numpy', 'pandas'):
+            self._register_defaults()
+        for base in value_type.__mro__:
+            encoder = self._encoders.get(base)
+            if encoder is not None:
+                return encoder
+        return None
+
+    def _encode(self, value: Any, buf: bytearray, hasher):
+        value_type = type(value)
+        if value is None:
+            buf += b'N'
+        elif value_type is bool:
+            buf += b'T' if value else b'F'
+        elif value_type is int:
+            buf += b'i%d;' % value
+        elif value_type is float:
+            buf += b'f' + repr(value).encode() + b';'
+        elif value_type is str:
+            data = value.encode('utf-8', 'surrogatepass')
+            buf += b's%d:' % len(data)
+            buf += data
+        elif value_type in (bytes, bytearray):
+            buf += b'b%d:' % len(value)
+            buf += value
+        elif value_type in (tuple, list):
+            buf += b'(%d:' % len(value) if value_type is tuple else b'[%d:' % len(value)
+            if set(map(type, value)) <= self._SCALARS:
+                # 스칼라만 담긴 컨테이너는 C 구현인 pickle 로 한 번에 인코딩 (타입 정보 포함)
+                self._add_bytes(pickle.dumps(value, protocol=5), buf, hasher)
+            else:
+                for item in value:
+                    self._encode(item, buf, hasher)
+        elif value_type is dict:
+            buf += b'{%d:' % len(value)
+            if set(map(type, value)) == {str} and set(map(type, value.values())) <= self._SCALARS:
+                self._add_bytes(pickle.dumps(sorted(value.items()), protocol=5), buf, hasher)
+            else:
+                for key, item in sorted(value.items(), key=lambda kv: self._canonical(kv[0])):
+                    self._encode(key, buf, hasher)
+                    self._encode(item, buf, hasher)
+        elif value_type in (set, frozenset):
+            buf += b'<%d:' % len(value)
+            for part in sorted(self._canonical(item) for item in value):
+                buf += part
+        else:
+            self._encode_object(value, value_type, buf, hasher)
+
+    def _encode_object(self, value: Any, value_type: type, buf: bytearray, hasher):
+        name = f"{value_type.__module__}.{value_type.__qualname__}".encode()
+        buf += b'x%d:' % len(name)
+        buf += name
+        encoder = self._encoder_for(value_type)
+        if encoder is None:
+            # 등록되지 않은 타입 : pickle 바이트열 (불가능하면 repr)
+            try:
+                parts = (pickle.dumps(value, protocol=5),)
+            except Exception:
+                parts = (repr(value).encode(),)
+        else:
+            parts = encoder(value)
+            if not isinstance(parts, tuple):
+                parts = (parts,)
+        for part in parts:
+            self._add_bytes(part, buf, hasher)
+
+    def _add_bytes(self, part, buf: bytearray, hasher):
+        # 길이 접두사 + 내용, 큰 버퍼는 복사 없이 해시에 직접 전달
+        size = part.nbytes if isinstance(part, memoryview) else len(part)
+        buf += b'%d:' % size
+        if size >= self._DIRECT_UPDATE_SIZE:
+            hasher.update(buf)
+            buf.clear()
+            hasher.update(part)
+        else:
+            buf += part
+
+    def _canonical(self, value: Any) -> bytes:
+        # dict 키, set 원소의 순서와 무관한 정렬 기준 (인코딩 해시)
+        hasher = self._hasher()
+        buf = bytearray()
+        self._encode(value, buf, hasher)
+        hasher.update(buf)
+        return hasher.digest()
+
+    def digest(self, args: tuple, kwargs: dict) -> str:
+        """인자 해시 (hex)"""
+        scalars = self._SCALARS
+        if set(map(type, args)) <= scalars and \
+                (not kwargs or set(map(type, kwargs.values())) <= scalars):
+            # 스칼라 인자만 있는 흔한 호출 : 한 번의 pickle + 해시 ('p' 접두사로 일반 인코딩과 구분)
+            data = b'p' + pickle.dumps((args, sorted(kwargs.items())), protocol=5)
+            if xxhash is not None:
+                return xxhash.xxh3_128_hexdigest(data)
+            return hashlib.blake2b(data, digest_size=16).hexdigest()
+        hasher = self._hasher()
+        buf = bytearray()
+        self._encode(args, buf, hasher)
+        if kwargs:
+            self._encode(kwargs, buf, hasher)
+        hasher.update(buf)
+        return hasher.hexdigest()
+
+    def build(self, name: str, args: tuple = (), kwargs: Optional[dict] = None) -> str:
+        """캐시 키 생성"""
+        return f"{self.prefix}:{name}:{self.digest(args, kwargs or {})}"
+
+# 동기/비동기 캐시가 공유하는 기본 키 생성기 (사용자 타입 인코더는 여기에 등록)
+default_key_builder = CacheKeyBuilder()
+
+def function_key_name(func: Callable) -> str:
+    """캐시 키에 쓰이는 함수 이름 (같은 이름의 다른 모듈 함수와 구분)"""
+    return f"{func.__module__}.{func.__qualname__}"
+
+def make_cache_key(prefix: str, *args, **kwargs) -> str:
+    """캐시 키 생성 (동기/비동기 캐시가 같은 키 공간을 쓰도록 공용 함수로 제공)"""
+    return default_key_builder.build(prefix, args, kwargs)
+
+def make_cache_entry(value: Any, delta: float, timeout: int, version: int = 0) -> list:
+    """캐시 항목 생성 : [값, 계산 소요 시간(초), 논리 만료 시각(epoch), 네임스페이스 버전]"""
+    return [value, delta, time.time() + timeout, version]
+
+def should_refresh(entry: list, beta: float) -> bool:
+    """갱신 필요 여부 판단
+
+    - 논리 만료 이후(stale-while-revalidate 구간)면 항상 갱신
+    - 만료 전이면 XFetch : 만료가 가까울수록, 계산이 오래 걸릴수록 높은 확률로 조기 갱신
+    """
+    delta, expires_at = entry[1], entry[2]
+    now = time.time()
+    if now >= expires_at:
+        return True
+    return beta > 0 and now - delta * beta * math.log(random.random() or 1e-12) >= expires_at
+
+class LocalCache:
+    """프로세스 내부(L1) 캐시 : 크기 제한, 항목별 TTL, LRU/LFU 퇴출"""
+    def __init__(self, max_size: int = 1024, policy: str = 'lru'):
+        if policy not in ('lru', 'lfu'):
+            raise ValueError("policy must be 'lru' or 'lfu'")
+        self.max_size = max_size
+        self.policy = policy
+        self._lock = threading.Lock()
+        # key -> [value, expires_at, freq]
+        self._entries: Dict[str, list] = {}
+        # LRU : 접근 순서 / LFU : 빈도별 접근 순서
+        self._order: OrderedDict = OrderedDict()
+        self._freq: Dict[int, OrderedDict] = {}
+        self._min_freq = 0
+
+    def get(self, key: str) -> Any:
+        """값 조회 (없거나 만료되면 _MISSING 반환)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            if entry[1] <= time.monotonic():
+                self._remove(key)
+                return _MISSING
+            self._touch(key, entry)
+            return entry[0]
+
+    def set(self, key: str, value: Any, ttl: float):
+        """값 저장"""
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            elif len(self._entries) >= self.max_size:
+                self._evict()
+            entry = [value, time.monotonic() + ttl, 0]
+            self._entries[key] = entry
+            self._touch(key, entry)
+
+    def delete(self, key: str):
+        """값 삭제"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+            self._order.clear()
+            self._freq.clear()
+            self._min_freq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _touch(self, key: str, entry: list):
+        if self.policy == 'lru':
+            self._order[key] = None
+            self._order.move_to_end(key)
+            return
+        freq = entry[2]
+        if freq:
+            bucket = self._freq[freq]
+            del bucket[key]
+            if not bucket:
+                del self._freq[freq]
+                if self._min_freq == freq:
+                    self._min_freq = freq + 1
+        else:
+            self._min_freq = 1
+        entry[2] = freq + 1
+        self._freq.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        if self.policy == 'lru':
+            del self._order[key]
+            return
+        bucket = self._freq[entry[2]]
+        del bucket[key]
+        if not bucket:
+            del self._freq[entry[2]]
+
+    def _evict(self):
+        # 만료 항목이 아니라 정책상 가장 우선순위가 낮은 항목 하나를 퇴출
+        if self.policy == 'lru':
+            key = next(iter(self._order))
+        else:
+            if self._min_freq not in self._freq:
+                self._min_freq = min(self._freq)
+            key = next(iter(self._freq[self._min_freq]))
+        self._remove(key)
+
 class RedisCache:
-    """캐시 관리 클래스"""
-    def __init__(self, config: RedisConfig):
+    """캐시 관리 클래스 (L1 : 프로세스 내부 캐시, L2 : Redis)"""
+    def __init__(self, config: RedisConfig, redis_client: Optional[redis.Redis] = None,
+                 key_builder: Optional[CacheKeyBuilder] = None):
+        self.config = config
         self.connection_pool = RedisConnectionPool(config)
-        self.client = self.connection_pool.get_connection()
+        self.client = redis_client or self.connection_pool.get_binary_connection()
+        self.serializer = RedisSerializer.from_config(config)
+        self.key_builder = key_builder or default_key_builder
+        self.local_cache: Optional[LocalCache] = None
+        self._listener = None
+        # 단일 실행(single-flight) : 프로세스 내 동일 키 재계산 공유 및 백그라운드 갱신
+        self._inflight: Dict[str, Future] = {}
+        self._refreshing: set = set()
+        self._inflight_lock = threading.Lock()
+        self._refresher = ThreadPoolExecutor(max_workers=4, thread_name_prefix='cache-refresh')
+        # 네임스페이스별 최신 버전 (L1 항목 유효성 판단용)
+        self._ns_versions: Dict[str, int] = {}
+
+        if config.local_cache_size > 0:
+            self.local_cache = LocalCache(config.local_cache_size, config.local_cache_policy)
+            # 타 프로세스의 무효화 메시지를 수신해 L1 에서 제거
+            self.pubsub = RedisPubSub(self.client, self.serializer)
+            self.pubsub.subscribe(config.invalidation_channel, self._on_invalidate)
+            self._listener = self.pubsub.run_in_thread()
 
     def cache_key(self, prefix: str, *args, **kwargs) -> str:
         """캐시 키 생성"""
-        key_parts = [prefix]
-        key_parts.extend(str(arg) for arg in args)
-        key_parts.extend(f"{k}:{v}" for k, v in sorted(kwargs.items()))
-        key = ":".join(key_parts)
-        return hashlib.md5(key.encode()).hexdigest()
-
-    def cached(self, timeout: int = 300):
-        """캐시 데코레이터"""
+        return self.key_builder.build(prefix, args, kwargs)
+
+    @staticmethod
+    def tag_key(tag: str) -> str:
+        return f"cache:tag:{tag}"
+
+    @staticmethod
+    def namespace_key(namespace: str) -> str:
+        return f"cache:ns:{namespace}"
+
+    def invalidate(self, *keys: str):
+        """캐시 키 삭제(batch_size 단위 파이프라인) 및 전체 프로세스의 L1 무효화"""
+        if not keys:
+            return
+        batch_size = self.config.batch_size
+        pipe = self.client.pipeline(transaction=False)
+        for i in range(0, len(keys), batch_size):
+            pipe.delete(*keys[i:i + batch_size])
+        pipe.execute()
+        # L1 을 쓰지 않는 프로세스(관리/쓰기 전용)도 다른 프로세스의 L1 을 무효화하도록 항상 발행
+        # 파이프라인 밖에서 발행 : 샤딩 클라이언트는 파이프라인 명령을 채널 이름의 샤드로 보내지만 구독은 primary 노드
+        self.client.publish(self.config.invalidation_channel, self.serializer.dumps(list(keys)))
+        if self.local_cache is not None:
+            for key in keys:
+                self.local_cache.delete(key)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """태그에 속한 모든 캐시 키 삭제 후 삭제 대상 키 수 반환"""
+        keys = set()
+        for tag in tags:
+            for key in self.client.sscan_iter(self.tag_key(tag), count=self.config.batch_size):
+                keys.add(key.decode() if isinstance(key, bytes) else key)
+        self.invalidate(*keys)
+        self.client.delete(*(self.tag_key(tag) for tag in tags))
+        return len(keys)
+
+    def invalidate_namespace(self, namespace: str) -> int:
+        """네임스페이스 버전 증가로 소속 캐시 전체를 O(1) 무효화 (이전 버전 항목은 TTL 로 소멸)"""
+        version = self.client.incr(self.namespace_key(namespace))
+        self._ns_versions[namespace] = version
+        self.client.publish(self.config.invalidation_channel,
+                            self.serializer.dumps({'namespace': namespace, 'version': version}))
+        return version
+
+    def close(self):
+        """무효화 수신 스레드 및 갱신 스레드 종료"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        self._refresher.shutdown(wait=False)
+
+    def _on_invalidate(self, message: Union[List[str], Dict[str, Any]]):
+        # 키 목록 또는 네임스페이스 버전 변경 메시지
+        if isinstance(message, dict):
+            namespace = message['namespace']
+            self._ns_versions[namespace] = max(self._ns_versions.get(namespace, 0), message['version'])
+            return
+        for key in message:
+            self.local_cache.delete(key)
+
+    def _get(self, cache_key: str, local_ttl: float, namespace: Optional[str] = None,
+             function: str = '') -> tuple:
+        # L1 조회 후 L2(Redis) 조회 : (캐시 항목 또는 _MISSING, 네임스페이스 버전) 반환
+        # 네임스페이스 버전은 캐시 키와 함께 MGET 으로 한 번에 조회하고, 이전 버전 항목은 미스로 처리
+        if self.local_cache is not None:
+            entry = self.local_cache.get(cache_key)
+            if entry is not _MISSING and \
+                    (namespace is None or entry[3] >= self._ns_versions.get(namespace, 0)):
+                metrics.inc('redis_cache_requests_total', {'function': function, 'result': 'l1_hit'})
+                return entry, entry[3]
+
+        version = 0
+        if namespace is None:
+            raw = self.client.get(cache_key)
+        else:
+            raw, version = self.client.mget([cache_key, self.namespace_key(namespace)])
+            version = int(version or 0)
+            self._ns_versions[namespace] = version
+        entry = _MISSING if raw is None else self.serializer.loads(raw)
+        if entry is _MISSING or entry[3] < version:
+            metrics.inc('redis_cache_requests_total', {'function': function, 'result': 'miss'})
+            return _MISSING, version
+        metrics.inc('redis_cache_requests_total', {'function': function, 'result': 'hit'})
+        self._set_local(cache_key, entry, local_ttl)
+        return entry, version
+
+    def _set_local(self, cache_key: str, entry: list, local_ttl: float):
+        # L1 에는 신선한(fresh) 항목만, 논리 만료 시각 이전까지만 보관
+        if self.local_cache is not None:
+            self.local_cache.set(cache_key, entry, min(local_ttl, entry[2] - time.time()))
+
+    def _compute_and_store(self, cache_key: str, func: Callable, args: tuple, kwargs: dict,
+                           timeout: int, stale_ttl: int, local_ttl: float,
+                           version: int = 0, tags: Optional[List[str]] = None) -> list:
+        # 계산 시간(delta)을 함께 저장해 XFetch 조기 갱신 확률 계산에 사용
+        start = time.perf_counter()
+        value = func(*args, **kwargs)
+        delta = time.perf_counter() - start
+        entry = make_cache_entry(value, delta, timeout, version)
+        ttl = timeout + stale_ttl
+        pipe = self.client.pipeline(transaction=False)
+        pipe.setex(cache_key, ttl, self.serializer.dumps(entry))
+        for tag in tags or ():
+            # 태그 집합은 소속 키 중 가장 긴 TTL 만큼 유지 (NX : TTL 없을 때 설정, GT : 더 길 때만 연장)
+            tag_key = self.tag_key(tag)
+            pipe.sadd(tag_key, cache_key)
+            pipe.expire(tag_key, ttl, nx=True)
+            pipe.expire(tag_key, ttl, gt=True)
+        pipe.execute()
+        self._set_local(cache_key, entry, local_ttl)
+        return entry
+
+    def _single_flight(self, cache_key: str, compute: Callable[[], list]) -> list:
+        """프로세스 내 동일 키 계산 공유 (선행 호출의 Future 결과를 함께 사용)"""
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            leader = future is None
+            if leader:
+                future = self._inflight[cache_key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            future.set_result(compute())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+        return future.result()
+
+    def _load(self, cache_key: str, compute: Callable[[], list], lock_timeout: int,
+              version: int = 0) -> list:
+        # 캐시 미스 : 분산 락을 얻은 한 워커만 재계산, 나머지는 락 해제 알림을 받은 뒤 저장된 결과 조회
+        lock = RedisLock(self.client, f"cache:{cache_key}", lock_timeout)
+        deadline = time.monotonic() + lock_timeout
+        while True:
+            with lock.acquire_lock(blocking=False) as acquired:
+                if acquired:
+                    return compute()
+            lock.wait_released(max(deadline - time.monotonic(), 0))
+            raw = self.client.get(cache_key)
+            if raw is not None:
+                entry = self.serializer.loads(raw)
+                if entry[3] >= version:
+                    return entry
+            if time.monotonic() >= deadline:
+                # 락 보유자가 응답하지 않으면 직접 계산
+                return compute()
+
+    def _refresh(self, cache_key: str, compute: Callable[[], list], lock_timeout: int):
+        # 백그라운드 갱신 : 락을 얻지 못하면 다른 워커가 갱신 중이므로 건너뜀
+        # 갱신 중 키는 _inflight 와 별도로 관리 (미스 호출이 갱신 작업의 결과를 기다리지 않도록)
+        with self._inflight_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+
+        def task():
+            try:
+                lock = RedisLock(self.client, f"cache:{cache_key}", lock_timeout)
+                with lock.acquire_lock(blocking=False) as acquired:
+                    if acquired:
+                        compute()
+            except Exception as e:
+                logger.error(f"Cache refresh failed for {cache_key}: {e}")
+            finally:
+                with self._inflight_lock:
+                    self._refreshing.discard(cache_key)
+
+        self._refresher.submit(task)
+
+    def cached(self, timeout: int = 300, local_ttl: Optional[int] = None,
+               stale_ttl: int = 0, early_refresh_beta: float = 1.0, lock_timeout: int = 10,
+               tags: Union[List[str], Callable[..., List[str]], None] = None,
+               namespace: Optional[str] = None):
+        """캐시 데코레이터
+
+        - L1 TTL 은 Redis TTL 을 넘지 않음
+        - 만료 직전에는 XFetch 확률(early_refresh_beta, 0 이면 비활성화)로 조기 갱신
+        - 만료 후 stale_ttl 초 동안은 이전 값을 반환하면서 백그라운드 갱신
+        - 캐시 미스시 한 워커만 재계산 (single-flight)
+        - tags : 태그 목록 또는 호출 인자로 태그 목록을 만드는 함수 (invalidate_tags 로 일괄 삭제)
+        - namespace : invalidate_namespace 로 소속 캐시 전체 무효화
+        """
+        l1_ttl = min(local_ttl or self.config.local_cache_ttl, timeout)
+
         def decorator(func):
+            name = function_key_name(func)
+            prefix = f"{namespace}:{name}" if namespace else name
+
             @wraps(func)
             def wrapper(*args, **kwargs):
-                cache_key = self.cache_key(func.__name__, *args, **kwargs)
-                result = self.client.get(cache_key)
-
-                if result is not None:
-                    return pickle.loads(result)
-
-                result = func(*args, **kwargs)
-                self.client.setex(
-                    cache_key,
-                    timeout,
-                    pickle.dumps(result)
-                )
-                return result
+                cache_key = self.cache_key(prefix, *args, **kwargs)
+                entry, version = self._get(cache_key, l1_ttl, namespace, name)
+
+                def compute() -> list:
+                    return self._compute_and_store(
+                        cache_key, func, args, kwargs, timeout, stale_ttl, l1_ttl, version,
+                        tags(*args, **kwargs) if callable(tags) else tags)
+
+                if entry is _MISSING:
+                    entry = self._single_flight(
+                        cache_key, lambda: self._load(cache_key, compute, lock_timeout, version))
+                    return entry[0]
+
+                if should_refresh(entry, early_refresh_beta):
+                    self._refresh(cache_key, compute, lock_timeout)
+                return entry[0]
+
+            def invalidate(*args, **kwargs):
+                self.invalidate(self.cache_key(prefix, *args, **kwargs))
+
+            wrapper.invalidate = invalidate
             return wrapper
         return decorator
 
+# 락 Lua 스크립트 : KEYS[1] = 락 키, ARGV[1] = 보유자 토큰
+# 획득 : 성공시 {펜싱 토큰, 0}, 실패시 {0, 남은 TTL(ms)} 반환 (KEYS[2] = 펜싱 토큰 카운터, ARGV[2] = TTL(ms))
+LOCK_ACQUIRE_SCRIPT = """
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    return {redis.call('INCR', KEYS[2]), 0}
+end
+return {0, redis.call('PTTL', KEYS[1])}
+"""
+# 해제 : 토큰이 일치할 때만 삭제하고 대기자에게 알림 (ARGV[2] = 알림 채널)
+LOCK_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    redis.call('PUBLISH', ARGV[2], KEYS[1])
+    return 1
+end
+return 0
+"""
+# 연장 : 토큰이 일치할 때만 TTL 재설정 (ARGV[2] = TTL(ms))
+LOCK_EXTEND_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
 class RedisLock:
-    """분산 락 관리"""
-    def __init__(self, redis_client: redis.Redis, lock_name: str, timeout: int = 10):
+    """분산 락 관리
+
+    - 획득할 때마다 임의 토큰 사용, 해제/연장은 토큰을 비교하는 Lua 스크립트로 원자적으로 처리
+    - 획득시 단조 증가하는 fencing_token 발급 : 보호 대상 저장소에 함께 전달해 만료된 보유자의 쓰기를 거부
+    - 대기 중에는 폴링 대신 해제 알림(pub/sub)을 기다리고, 알림이 없으면 락 TTL 만료 시점에 재시도
+    - auto_renew=True 이면 보유 중 timeout/3 주기로 TTL 연장 (긴 임계 구역용)
+    """
+    def __init__(self, redis_client: redis.Redis, lock_name: str, timeout: int = 10,
+                 auto_renew: bool = False):
         self.redis_client = redis_client
         self.lock_name = f"lock:{lock_name}"
+        self.fence_name = f"{self.lock_name}:fence"
+        self.channel = f"{self.lock_name}:released"
         self.timeout = timeout
-        self.lock_token = hashlib.md5(str(time.time()).encode()).hexdigest()
+        self.auto_renew = auto_renew
+        self.lock_token: Optional[str] = None
+        self.fencing_token: Optional[int] = None
+        self._acquire = redis_client.register_script(LOCK_ACQUIRE_SCRIPT)
+        self._release = redis_client.register_script(LOCK_RELEASE_SCRIPT)
+        self._extend = redis_client.register_script(LOCK_EXTEND_SCRIPT)
+        self._renewer: Optional[threading.Thread] = None
+        self._renew_stop = threading.Event()
+
+    @property
+    def _metric_labels(self) -> Dict[str, str]:
+        # 캐시 락(lock:cache:<key>)처럼 이름이 계속 바뀌는 락은 첫 구간으로 묶어 레이블 수 제한
+        return {'lock': self.lock_name.split(':')[1]}
+
+    def _node(self) -> redis.Redis:
+        # 해제 알림은 락 키가 있는 노드에서 발행되므로 샤딩 모드에서는 해당 샤드를 구독
+        if isinstance(self.redis_client, ShardedRedisClient):
+            return self.redis_client.get_client(self.lock_name)
+        return self.redis_client
+
+    def _try_acquire(self) -> int:
+        # 획득 성공시 0, 실패시 락의 남은 TTL(ms) 반환
+        token = secrets.token_hex(16)
+        fence, ttl = self._acquire(keys=[self.lock_name, self.fence_name],
+                                   args=[token, int(self.timeout * 1000)])
+        if not fence:
+            return ttl
+        self.lock_token, self.fencing_token = token, int(fence)
+        if self.auto_renew:
+            self._start_renewer()
+        return 0
+
+    def _wait(self, pubsub, ttl: int, deadline: Optional[float], retry_delay: Optional[float]) -> bool:
+        # 해제 알림 또는 TTL 만료까지 대기 (ttl : -2 키 없음, -1 TTL 없음), 대기 기한이 지났으면 False
+        wait = ttl / 1000 if ttl > 0 else (0 if ttl == -2 else self.timeout)
+        if retry_delay:
+            wait = min(wait, retry_delay)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            wait = min(wait, remaining)
+        if wait > 0:
+            pubsub.get_message(timeout=wait)
+        return True
 
     @contextmanager
-    def acquire_lock(self, blocking: bool = True, retry_delay: float = 0.1):
-        acquired = False
+    def _subscription(self):
+        pubsub = self._node().pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.channel)
         try:
-            while not acquired:
-                acquired = self.redis_client.set(
-                    self.lock_name,
-                    self.lock_token,
-                    nx=True,
-                    ex=self.timeout
-                )
-                if acquired:
-                    yield True
-                    break
-                if not blocking:
-                    yield False
-                    break
-                time.sleep(retry_delay)
+            yield pubsub
+        finally:
+            pubsub.close()
+
+    @contextmanager
+    def acquire_lock(self, blocking: bool = True, retry_delay: Optional[float] = None,
+                     blocking_timeout: Optional[float] = None):
+        """락 획득 (with 블록 종료시 해제)
+
+        blocking_timeout : 최대 대기 시간(초), 초과시 False
+        retry_delay : 해제 알림 없이 재시도하는 최대 간격 (기본 : 락의 남은 TTL)
+        """
+        start = time.perf_counter()
+        ttl = self._try_acquire()
+        if ttl and blocking:
+            # 구독 후 다시 시도해야 그 사이에 발행된 해제 알림을 놓치지 않음
+            deadline = None if blocking_timeout is None else time.monotonic() + blocking_timeout
+            with self._subscription() as pubsub:
+                while ttl:
+                    ttl = self._try_acquire()
+                    if ttl and not self._wait(pubsub, ttl, deadline, retry_delay):
+                        break
+        acquired = not ttl
+        if acquired:
+            metrics.observe('redis_lock_wait_seconds', time.perf_counter() - start, self._metric_labels)
+        result = 'acquired' if acquired else 'timeout' if blocking else 'busy'
+        metrics.inc('redis_lock_acquire_total', {**self._metric_labels, 'result': result})
+        try:
+            yield acquired
         finally:
             if acquired:
                 self.release_lock()
 
-    def release_lock(self):
-        """락 해제"""
-        if self.redis_client.get(self.lock_name) == self.lock_token:
-            self.redis_client.delete(self.lock_name)
+    def wait_released(self, timeout: Optional[float] = None) -> bool:
+        """락이 해제(또는 만료)될 때까지 대기, timeout 내 해제되면 True"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        node = self._node()
+        with self._subscription() as pubsub:
+            while True:
+                ttl = node.pttl(self.lock_name)
+                if ttl == -2:
+                    return True
+                if not self._wait(pubsub, ttl, deadline, None):
+                    return False
+
+    def extend(self, timeout: Optional[float] = None) -> bool:
+        """보유 중인 락의 TTL 을 timeout(기본 : 생성시 timeout)초로 재설정, 락을 잃었으면 False"""
+        if self.lock_token is None:
+            return False
+        ttl_ms = int((timeout or self.timeout) * 1000)
+        return bool(self._extend(keys=[self.lock_name], args=[self.lock_token, ttl_ms]))
+
+    def _start_renewer(self):
+        self._renew_stop.clear()
+
+        def run():
+            while not self._renew_stop.wait(self.timeout / 3):
+                try:
+                    if not self.extend():
+                        logger.warning(f"Lock {self.lock_name} was lost before renewal")
+                        return
+                except redis.RedisError as e:
+                    logger.error(f"Lock renewal failed for {self.lock_name}: {e}")
+
+        self._renewer = threading.Thread(target=run, name=f"renew-{self.lock_name}", daemon=True)
+        self._renewer.start()
+
+    def release_lock(self) -> bool:
+        """락 해제 (보유 토큰이 일치할 때만 삭제), 해제했으면 True"""
+        self._renew_stop.set()
+        if self._renewer is not None:
+            if self._renewer is not threading.current_thread():
+                self._renewer.join()
+            self._renewer = None
+        if self.lock_token is None:
+            return False
+        token, self.lock_token = self.lock_token, None
+        return bool(self._release(keys=[self.lock_name], args=[token, self.channel]))
+
+@dataclass
+class QueueMessage:
+    """dequeue_batch 로 꺼낸 메시지
+
+    raw 는 ack 식별자 : list 백엔드는 원본 payload, stream 백엔드는 메시지 ID.
+    """
+    item: Any
+    raw: bytes
+
+# 처리 기한(visibility timeout)이 지난 컨슈머의 처리 중 목록을 큐 앞쪽으로 되돌림
+# KEYS[1] = 임대(lease) ZSET, KEYS[2] = 큐, ARGV[1] = 현재 시각(ms)
+REQUEUE_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+local moved = 0
+for _, processing in ipairs(expired) do
+    while redis.call('LMOVE', processing, KEYS[2], 'RIGHT', 'LEFT') do
+        moved = moved + 1
+    end
+    redis.call('ZREM', KEYS[1], processing)
+end
+return moved
+"""
+
+class _QueueMetrics:
+    """큐 지표 기록 (깊이 게이지, dequeue 지연 시간, 처리 항목 수)"""
+    def _record_depth(self, depth: int):
+        metrics.set_gauge('redis_queue_depth', depth, {'queue': self.queue_name})
+
+    def _record_dequeue(self, start: float, count: int):
+        labels = {'queue': self.queue_name}
+        metrics.observe('redis_queue_dequeue_seconds', time.perf_counter() - start, labels)
+        if count:
+            metrics.inc('redis_queue_items_total', {**labels, 'op': 'dequeue'}, count)
+
+class RedisQueue(_QueueMetrics):
+    """큐 관리
 
-class RedisQueue:
-    """큐 관리"""
-    def __init__(self, redis_client: redis.Redis, queue_name: str):
+    dequeue_batch 로 꺼낸 항목은 컨슈머별 처리 중 목록으로 이동(LMOVE)되고 ack 전까지 보관됨.
+    visibility_timeout 이 지나도록 ack 되지 않은 항목은 requeue_expired 가 큐로 되돌림 (at-least-once).
+    """
+    def __init__(self, redis_client: redis.Redis, queue_name: str,
+                 serializer: Optional[RedisSerializer] = None,
+                 consumer_id: Optional[str] = None, visibility_timeout: int = 30,
+                 batch_size: int = 500):
         self.redis_client = redis_client
         self.queue_name = f"queue:{queue_name}"
+        self.serializer = serializer or RedisSerializer()
+        self.consumer_id = consumer_id or secrets.token_hex(8)
+        self.visibility_timeout = visibility_timeout
+        self.batch_size = batch_size
+        self.processing_name = f"{self.queue_name}:processing:{self.consumer_id}"
+        self.leases_name = f"{self.queue_name}:leases"
+        self._requeue = redis_client.register_script(REQUEUE_SCRIPT)
+        self._reaper: Optional[threading.Thread] = None
+        self._reaper_stop = threading.Event()
 
     def enqueue(self, item: Any):
         """큐에 항목 추가"""
-        self.redis_client.rpush(self.queue_name, pickle.dumps(item))
+        self._record_depth(self.redis_client.rpush(self.queue_name, self.serializer.dumps(item)))
+        metrics.inc('redis_queue_items_total', {'queue': self.queue_name, 'op': 'enqueue'})
+
+    def enqueue_many(self, items: List[Any]):
+        """여러 항목을 batch_size 단위 RPUSH 파이프라인으로 추가"""
+        payloads = [self.serializer.dumps(item) for item in items]
+        if not payloads:
+            return
+        pipe = self.redis_client.pipeline(transaction=False)
+        for i in range(0, len(payloads), self.batch_size):
+            pipe.rpush(self.queue_name, *payloads[i:i + self.batch_size])
+        self._record_depth(pipe.execute()[-1])
+        metrics.inc('redis_queue_items_total', {'queue': self.queue_name, 'op': 'enqueue'}, len(payloads))
 
     def dequeue(self, timeout: int = 0) -> Optional[Any]:
         """큐에서 항목 제거 및 반환"""
+        start = time.perf_counter()
         result = self.redis_client.blpop(self.queue_name, timeout=timeout)
+        self._record_dequeue(start, 1 if result else 0)
         if result:
-            return pickle.loads(result[1])
+            return self.serializer.loads(result[1])
         return None
 
+    def dequeue_batch(self, n: int, timeout: int = 0) -> List[QueueMessage]:
+        """최대 n 개 항목을 처리 중 목록으로 옮겨 반환 (큐가 비어 있으면 timeout 초 대기, 0 이면 무한 대기)"""
+        def move(count: int) -> List[bytes]:
+            pipe = self.redis_client.pipeline(transaction=False)
+            self._lease(pipe)
+            for _ in range(count):
+                pipe.lmove(self.queue_name, self.processing_name, 'LEFT', 'RIGHT')
+            return [raw for raw in pipe.execute()[1:] if raw is not None]
+
+        start = time.perf_counter()
+        raws = move(n)
+        if not raws and timeout is not None:
+            first = self.redis_client.blmove(self.queue_name, self.processing_name,
+                                             timeout, 'LEFT', 'RIGHT')
+            if first is None:
+                self._record_dequeue(start, 0)
+                return []
+            raws = [first] + (move(n - 1) if n > 1 else [])
+            self._lease(self.redis_client)
+        self._record_dequeue(start, len(raws))
+        return [QueueMessage(self.serializer.loads(raw), raw) for raw in raws]
+
+    def ack(self, *messages: QueueMessage):
+        """처리 완료된 메시지를 처리 중 목록에서 제거"""
+        if not messages:
+            return
+        pipe = self.redis_client.pipeline(transaction=False)
+        for message in messages:
+            pipe.lrem(self.processing_name, 1, message.raw)
+        pipe.execute()
+
+    def extend_lease(self):
+        """처리 기한 연장 (긴 작업 처리 중 주기적으로 호출)"""
+        self._lease(self.redis_client)
+
+    def _lease(self, client):
+        deadline = int((time.time() + self.visibility_timeout) * 1000)
+        client.zadd(self.leases_name, {self.processing_name: deadline})
+
+    def requeue_expired(self) -> int:
+        """처리 기한이 지난 항목을 큐로 되돌리고 개수 반환"""
+        return self._requeue(keys=[self.leases_name, self.queue_name],
+                             args=[int(time.time() * 1000)])
+
+    def start_reaper(self, interval: Optional[float] = None) -> threading.Thread:
+        """requeue_expired 를 주기적으로 실행하는 백그라운드 스레드 시작"""
+        interval = interval or max(self.visibility_timeout / 2, 1)
+
+        def run():
+            while not self._reaper_stop.wait(interval):
+                try:
+                    moved = self.requeue_expired()
+                    if moved:
+                        logger.warning(f"Requeued {moved} expired items on {self.queue_name}")
+                except redis.RedisError as e:
+                    logger.error(f"Queue reaper failed on {self.queue_name}: {e}")
+
+        self._reaper_stop.clear()
+        self._reaper = threading.Thread(target=run, name=f"reaper-{self.queue_name}", daemon=True)
+        self._reaper.start()
+        return self._reaper
+
+    def stop_reaper(self):
+        """리퍼 스레드 종료"""
+        self._reaper_stop.set()
+        if self._reaper is not None:
+            self._reaper.join()
+            self._reaper = None
+
     def size(self) -> int:
         """큐 크기 반환"""
-        return self.redis_client.llen(self.queue_name)
+        depth = self.redis_client.llen(self.queue_name)
+        self._record_depth(depth)
+        return depth
+
+class RedisStreamQueue(_QueueMetrics):
+    """Redis Streams 기반 큐 (컨슈머 그룹)
+
+    RedisQueue 와 같은 enqueue/dequeue/dequeue_batch/ack/size 인터페이스 제공.
+    ack 되지 않은 메시지는 그룹의 PEL 에 남고 claim_stuck(XAUTOCLAIM)으로 회수 가능.
+    """
+    def __init__(self, redis_client: redis.Redis, queue_name: str,
+                 serializer: Optional[RedisSerializer] = None,
+                 consumer_id: Optional[str] = None, visibility_timeout: int = 30,
+                 batch_size: int = 500, group: str = 'default', maxlen: Optional[int] = None):
+        self.redis_client = redis_client
+        self.queue_name = f"stream:{queue_name}"
+        self.serializer = serializer or RedisSerializer()
+        self.consumer_id = consumer_id or secrets.token_hex(8)
+        self.visibility_timeout = visibility_timeout
+        self.batch_size = batch_size
+        self.group = group
+        self.maxlen = maxlen
+        self._group_ready = False
+
+    def _ensure_group(self):
+        if self._group_ready:
+            return
+        try:
+            self.redis_client.xgroup_create(self.queue_name, self.group, id='0', mkstream=True)
+        except redis.ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+        self._group_ready = True
+
+    def _add(self, client, item: Any):
+        # maxlen 지정시 근사(~) 트리밍으로 스트림 길이 제한
+        client.xadd(self.queue_name, {'d': self.serializer.dumps(item)},
+                    maxlen=self.maxlen, approximate=True)
+
+    def enqueue(self, item: Any):
+        """큐에 항목 추가"""
+        self._add(self.redis_client, item)
+        metrics.inc('redis_queue_items_total', {'queue': self.queue_name, 'op': 'enqueue'})
+
+    def enqueue_many(self, items: List[Any]):
+        """여러 항목을 batch_size 단위 파이프라인으로 추가"""
+        for i in range(0, len(items), self.batch_size):
+            pipe = self.redis_client.pipeline(transaction=False)
+            for item in items[i:i + self.batch_size]:
+                self._add(pipe, item)
+            pipe.execute()
+        metrics.inc('redis_queue_items_total', {'queue': self.queue_name, 'op': 'enqueue'}, len(items))
+
+    def _read(self, count: int, timeout: Optional[int], noack: bool = False) -> List[QueueMessage]:
+        self._ensure_group()
+        block = None if timeout is None else int(timeout * 1000)
+        start = time.perf_counter()
+        reply = self.redis_client.xreadgroup(self.group, self.consumer_id, {self.queue_name: '>'},
+                                             count=count, block=block, noack=noack)
+        self._record_dequeue(start, len(reply[0][1]) if reply else 0)
+        if not reply:
+            return []
+        return [QueueMessage(self.serializer.loads(fields[b'd']), message_id)
+                for message_id, fields in reply[0][1]]
+
+    def dequeue(self, timeout: int = 0) -> Optional[Any]:
+        """큐에서 항목 제거 및 반환 (NOACK : PEL 에 남기지 않음)"""
+        messages = self._read(1, timeout, noack=True)
+        return messages[0].item if messages else None
+
+    def dequeue_batch(self, n: int, timeout: int = 0) -> List[QueueMessage]:
+        """최대 n 개 메시지 수신 (ack 전까지 그룹의 PEL 에 보관)"""
+        return self._read(n, timeout)
+
+    def ack(self, *messages: QueueMessage):
+        """처리 완료 메시지 확인 (XACK)"""
+        if messages:
+            self.redis_client.xack(self.queue_name, self.group, *(m.raw for m in messages))
+
+    def claim_stuck(self, count: int = 100) -> List[QueueMessage]:
+        """visibility_timeout 이상 처리되지 않은 메시지를 현재 컨슈머로 회수 (XAUTOCLAIM)"""
+        self._ensure_group()
+        reply = self.redis_client.xautoclaim(self.queue_name, self.group, self.consumer_id,
+                                             min_idle_time=self.visibility_timeout * 1000,
+                                             count=count)
+        return [QueueMessage(self.serializer.loads(fields[b'd']), message_id)
+                for message_id, fields in reply[1] if fields]
+
+    def replay(self, start: str = '-', end: str = '+', count: Optional[int] = None) -> List[QueueMessage]:
+        """스트림에 남아 있는 메시지 재조회 (그룹 상태와 무관, XRANGE)"""
+        return [QueueMessage(self.serializer.loads(fields[b'd']), message_id)
+                for message_id, fields in self.redis_client.xrange(self.queue_name, start, end, count)]
+
+    def pending(self) -> Dict[str, Any]:
+        """그룹의 미확인(PEL) 메시지 요약"""
+        self._ensure_group()
+        return self.redis_client.xpending(self.queue_name, self.group)
+
+    def lag(self) -> Dict[str, Dict[str, Any]]:
+        """그룹별 지연 지표 (pending : 미확인 수, lag : 아직 전달되지 않은 수)"""
+        stats = {}
+        for info in self.redis_client.xinfo_groups(self.queue_name):
+            name = info['name'].decode() if isinstance(info['name'], bytes) else info['name']
+            stats[name] = {
+                'consumers': info['consumers'],
+                'pending': info['pending'],
+                'lag': info.get('lag'),
+                'last_delivered_id': info['last-delivered-id'],
+            }
+        return stats
+
+    def size(self) -> int:
+        """스트림 길이 반환"""
+        depth = self.redis_client.xlen(self.queue_name)
+        self._record_depth(depth)
+        return depth
 
 class RedisPubSub:
     """발행/구독 관리"""
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(self, redis_client: redis.Redis, serializer: Optional[RedisSerializer] = None):
         self.redis_client = redis_client
         self.pubsub = self.redis_client.pubsub()
+        self.serializer = serializer or RedisSerializer()
 
     def publish(self, channel: str, message: Any):
         """메시지 발행"""
-        self.redis_client.publish(channel, pickle.dumps(message))
+        self.redis_client.publish(channel, self.serializer.dumps(message))
 
     def subscribe(self, channel: str, callback: Callable[[Any], None]):
         """채널 구독"""
         self.pubsub.subscribe(**{channel: lambda message:
-            callback(pickle.loads(message['data'])) if message['type'] == 'message' else None})
+            callback(self.serializer.loads(message['data'])) if message['type'] == 'message' else None})
+
+    def run_in_thread(self, sleep_time: float = 0.01):
+        """백그라운드 스레드에서 구독 콜백 실행 (stop() 으로 종료)"""
+        return self.pubsub.run_in_thread(sleep_time=sleep_time, daemon=True)
 
     def start_listening(self):
         """메시지 수신 시작"""
         for message in self.pubsub.listen():
             if message['type'] == 'message':
-                yield pickle.loads(message['data'])
+                yield self.serializer.loads(message['data'])
+
+    def dispatcher(self, workers: int = 4, queue_size: int = 1000,
+                   overflow: str = 'drop_oldest') -> 'PubSubDispatcher':
+        """같은 클라이언트/직렬화 설정을 사용하는 비차단 디스패처 생성 (start() 로 시작)"""
+        return PubSubDispatcher(self.redis_client, self.serializer, workers, queue_size, overflow)
+
+@dataclass
+class Subscription:
+    """디스패처 구독 정보 (pattern=True 이면 psubscribe, 콜백은 (채널, 메시지) 로 호출)"""
+    key: str
+    callback: Callable
+    pattern: bool = False
+    batch_size: int = 1         # 1 초과시 콜백에 메시지 목록 전달
+    batch_interval: float = 0.05
+
+class PubSubDispatcher:
+    """발행/구독 메시지 디스패처
+
+    - 수신 스레드가 메시지를 읽어 워커별 bounded 큐에 넣고, 워커 스레드가 역직렬화 후 콜백 실행
+    - 구독 키(채널 또는 패턴) 해시로 워커를 고정하므로 같은 구독의 메시지는 순서대로 처리됨
+    - batch_size > 1 인 구독은 batch_size 개 또는 batch_interval 초 단위로 모아 한 번에 콜백 호출
+    - 워커 큐가 가득 차면 overflow 정책 적용 : 'drop_oldest'(기본), 'drop_newest', 'block'(수신 스레드 대기)
+    - 지표 : redis_pubsub_messages_total(result=dispatched/dropped/failed), redis_pubsub_lag_seconds, redis_pubsub_queue_depth
+    """
+    OVERFLOW_POLICIES = ('drop_oldest', 'drop_newest', 'block')
+
+    def __init__(self, redis_client: redis.Redis, serializer: Optional[RedisSerializer] = None,
+                 workers: int = 4, queue_size: int = 1000, overflow: str = 'drop_oldest'):
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.redis_client = redis_client
+        self.serializer = serializer or RedisSerializer()
+        self.overflow = overflow
+        self.pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        self._subscriptions: Dict[str, Subscription] = {}
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in range(workers)]
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._dispatched = 0
+        self._dropped = 0
+
+    def subscribe(self, channel: str, callback: Callable, batch_size: int = 1,
+                  batch_interval: float = 0.05):
+        """채널 구독 (callback(message) 또는 batch_size > 1 이면 callback([message, ...]))"""
+        self._subscriptions[channel] = Subscription(channel, callback, False, batch_size, batch_interval)
+        self.pubsub.subscribe(channel)
+
+    def psubscribe(self, pattern: str, callback: Callable, batch_size: int = 1,
+                   batch_interval: float = 0.05):
+        """패턴 구독 (callback(channel, message) 또는 callback([(channel, message), ...]))"""
+        self._subscriptions[pattern] = Subscription(pattern, callback, True, batch_size, batch_interval)
+        self.pubsub.psubscribe(pattern)
+
+    def unsubscribe(self, channel: str):
+        self._subscriptions.pop(channel, None)
+        self.pubsub.unsubscribe(channel)
+
+    def punsubscribe(self, pattern: str):
+        self._subscriptions.pop(pattern, None)
+        self.pubsub.punsubscribe(pattern)
+
+    def start(self) -> 'PubSubDispatcher':
+        """수신 스레드와 워커 스레드 시작"""
+        if self._threads:
+            return self
+        self._stop.clear()
+        self._threads = [threading.Thread(target=self._work, args=(q,), name=f"pubsub-worker-{i}", daemon=True)
+                         for i, q in enumerate(self._queues)]
+        self._threads.append(threading.Thread(target=self._read, name="pubsub-reader", daemon=True))
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """수신 중단, 워커 큐에 남은 메시지 처리 후 종료"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self.pubsub.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """백프레셔 지표 : 워커별 큐 적재량, 분배/버린 메시지 수"""
+        return {'queue_depth': [q.qsize() for q in self._queues],
+                'queue_capacity': self._queues[0].maxsize,
+                'dispatched': self._dispatched,
+                'dropped': self._dropped}
+
+    @staticmethod
+    def _decode(value: Union[str, bytes]) -> str:
+        return value.decode() if isinstance(value, bytes) else value
+
+    def _batch_interval(self, key: str) -> float:
+        subscription = self._subscriptions.get(key)
+        return subscription.batch_interval if subscription else 0
+
+    def _read(self):
+        while not self._stop.is_set():
+            try:
+                message = self.pubsub.get_message(timeout=0.5)
+            except redis.RedisError as e:
+                logger.error(f"PubSub dispatcher read failed: {e}")
+                self._stop.wait(1)
+                continue
+            if message is None or message['type'] not in ('message', 'pmessage'):
+                continue
+            key = self._decode(message['pattern'] if message['type'] == 'pmessage' else message['channel'])
+            item = (key, self._decode(message['channel']), message['data'], time.monotonic())
+            self._dispatch(zlib.crc32(key.encode()) % len(self._queues), item)
+        for q in self._queues:
+            q.put(None)     # 워커 종료 신호 (남은 메시지 뒤에 위치)
+
+    def _drop(self, item: tuple):
+        self._dropped += 1
+        metrics.inc('redis_pubsub_messages_total', {'subscription': item[0], 'result': 'dropped'})
+
+    def _dispatch(self, worker: int, item: tuple):
+        q = self._queues[worker]
+        if self.overflow == 'block':
+            q.put(item)
+        else:
+            try:
+                q.put_nowait(item)
+            except queue.Full:
+                if self.overflow == 'drop_newest':
+                    self._drop(item)
+                    return
+                # 워커만 꺼내가므로 가장 오래된 항목을 버리면 바로 빈 자리가 생김
+                try:
+                    self._drop(q.get_nowait())
+                except queue.Empty:
+                    pass
+                q.put(item)
+        self._dispatched += 1
+        metrics.inc('redis_pubsub_messages_total', {'subscription': item[0], 'result': 'dispatched'})
+        metrics.set_gauge('redis_pubsub_queue_depth', q.qsize(), {'worker': worker})
+
+    def _work(self, q: queue.Queue):
+        # 구독별 배치 대기 메시지 : 배치 구간은 워커가 첫 메시지를 꺼낸 시점부터 계산
+        # (수신 시각 기준이면 큐가 밀렸을 때 배치가 모이지 않고 1건씩 호출됨)
+        pending: Dict[str, List[tuple]] = {}
+        started: Dict[str, float] = {}
+        while True:
+            timeout = None
+            if pending:
+                due = min(started[key] + self._batch_interval(key) for key in pending)
+                timeout = max(due - time.monotonic(), 0)
+            try:
+                item = q.get(timeout=timeout)
+            except queue.Empty:
+                item = ()
+            if item is None:
+                for key in list(pending):
+                    self._invoke(key, pending.pop(key))
+                return
+            if item:
+                subscription = self._subscriptions.get(item[0])
+                if subscription is None:
+                    continue
+                if subscription.batch_size <= 1:
+                    self._invoke(item[0], [item])
+                    continue
+                if item[0] not in pending:
+                    pending[item[0]], started[item[0]] = [], time.monotonic()
+                batch = pending[item[0]]
+                batch.append(item)
+                if len(batch) >= subscription.batch_size:
+                    self._invoke(item[0], pending.pop(item[0]))
+            now = time.monotonic()
+            for key in [k for k in pending if now - started[k] >= self._batch_interval(k)]:
+                self._invoke(key, pending.pop(key))
+
+    def _invoke(self, key: str, items: List[tuple]):
+        subscription = self._subscriptions.get(key)
+        if subscription is None:
+            return
+        labels = {'subscription': key}
+        now = time.monotonic()
+        for item in items:
+            metrics.observe('redis_pubsub_lag_seconds', now - item[3], labels)
+        try:
+            messages = [self.serializer.loads(item[2]) for item in items]
+            if subscription.pattern:
+                messages = [(item[1], message) for item, message in zip(items, messages)]
+            if subscription.batch_size > 1:
+                subscription.callback(messages)
+            elif subscription.pattern:
+                subscription.callback(*messages[0])
+            else:
+                subscription.callback(messages[0])
+        except Exception as e:
+            metrics.inc('redis_pubsub_messages_total', {**labels, 'result': 'failed'}, len(items))
+            logger.error(f"PubSub callback failed on {key}: {e}")
+
+# 속도 제한 Lua 스크립트 : KEYS[1] = 키, ARGV = [limit, window(ms), 고유 토큰]
+# 모두 {허용 여부(1/0), 남은 횟수, 초기화까지 남은 시간(ms)} 반환
+_RATE_LIMIT_NOW = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+"""
+
+RATE_LIMIT_SCRIPTS = {
+    # 고정 윈도우 : 윈도우 시작 시점에 만료되는 카운터
+    'fixed_window': """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+local ttl = redis.call('PTTL', KEYS[1])
+if current > tonumber(ARGV[1]) then
+    return {0, 0, ttl}
+end
+return {1, tonumber(ARGV[1]) - current, ttl}
+""",
+    # 슬라이딩 윈도우 로그 : 윈도우 내 요청 시각을 ZSET 으로 보관 (정확, 요청 수만큼 메모리 사용)
+    'sliding_window_log': _RATE_LIMIT_NOW + """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, now .. ':' .. ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    count = count + 1
+    allowed = 1
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+local reset = window
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window - now
+end
+return {allowed, limit - count, reset}
+""",
+    # 슬라이딩 윈도우 카운터 : 이전/현재 윈도우 카운터를 경과 비율로 가중 (근사, 고정 메모리)
+    'sliding_window_counter': _RATE_LIMIT_NOW + """
+local start = now - (now % window)
+local h = redis.call('HMGET', KEYS[1], 'start', 'cur', 'prev')
+local prev_start = tonumber(h[1])
+local cur = tonumber(h[2]) or 0
+local prev = tonumber(h[3]) or 0
+if prev_start ~= start then
+    if prev_start == start - window then prev = cur else prev = 0 end
+    cur = 0
+end
+local elapsed = now - start
+local estimated = prev * (window - elapsed) / window + cur
+local allowed = 0
+if estimated + 1 <= limit then
+    cur = cur + 1
+    estimated = estimated + 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'start', start, 'cur', cur, 'prev', prev)
+redis.call('PEXPIRE', KEYS[1], window * 2)
+return {allowed, math.floor(limit - estimated), window - elapsed}
+""",
+    # 토큰 버킷 : window 동안 limit 개 토큰이 균등하게 충전, 최대 limit 개까지 누적 (버스트 허용)
+    'token_bucket': _RATE_LIMIT_NOW + """
+local h = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(h[1]) or limit
+local ts = tonumber(h[2]) or now
+tokens = math.min(limit, tokens + math.max(0, now - ts) * limit / window)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], window)
+local reset = 0
+if tokens < 1 then
+    reset = math.ceil((1 - tokens) * window / limit)
+end
+return {allowed, math.floor(tokens), reset}
+""",
+}
+
+@dataclass
+class RateLimitResult:
+    """속도 제한 판정 결과"""
+    allowed: bool
+    remaining: int
+    reset_after: float      # 제한 초기화(또는 다음 허용)까지 남은 시간(초)
 
 class RedisRateLimiter:
-    """속도 제한 관리"""
-    def __init__(self, redis_client: redis.Redis, key_prefix: str, limit: int, window: int):
+    """속도 제한 관리 (알고리즘별 Lua 스크립트로 한 번의 EVALSHA 에서 판정)"""
+    def __init__(self, redis_client: redis.Redis, key_prefix: str, limit: int, window: int,
+                 algorithm: str = 'fixed_window'):
+        if algorithm not in RATE_LIMIT_SCRIPTS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
         self.redis_client = redis_client
         self.key_prefix = key_prefix
         self.limit = limit
         self.window = window
+        self.algorithm = algorithm
+        self._script = redis_client.register_script(RATE_LIMIT_SCRIPTS[algorithm])
+
+    @staticmethod
+    def load_scripts(redis_client: redis.Redis):
+        """모든 속도 제한 스크립트를 서버에 미리 적재 (SCRIPT LOAD)"""
+        for script in RATE_LIMIT_SCRIPTS.values():
+            redis_client.script_load(script)
+
+    def _args(self) -> list:
+        return [self.limit, self.window * 1000, secrets.token_hex(8)]
+
+    def _record(self, result: RateLimitResult) -> RateLimitResult:
+        metrics.inc('redis_rate_limit_total', {'limiter': self.key_prefix,
+                                               'result': 'allowed' if result.allowed else 'limited'})
+        return result
+
+    @staticmethod
+    def _result(reply: list) -> RateLimitResult:
+        allowed, remaining, reset_ms = reply
+        return RateLimitResult(bool(allowed), max(int(remaining), 0), max(int(reset_ms), 0) / 1000)
+
+    def check(self, identifier: str) -> RateLimitResult:
+        """요청 허용 여부, 남은 횟수, 초기화 시간 조회"""
+        key = f"{self.key_prefix}:{identifier}"
+        return self._record(self._result(self._script(keys=[key], args=self._args())))
 
     def is_allowed(self, identifier: str) -> bool:
         """요청 허용 여부 확인"""
-        key = f"{self.key_prefix}:{identifier}"
-        current = self.redis_client.get(key)
+        return self.check(identifier).allowed
+
+    def check_many(self, identifiers: List[str]) -> List[RateLimitResult]:
+        """여러 식별자를 하나의 파이프라인으로 판정"""
+        def run() -> list:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for identifier in identifiers:
+                pipe.evalsha(self._script.sha, 1, f"{self.key_prefix}:{identifier}", *self._args())
+            return pipe.execute()
+
+        try:
+            replies = run()
+        except redis.exceptions.NoScriptError:
+            # 서버 재시작 등으로 스크립트가 사라진 경우 재적재 후 재시도
+            self.redis_client.script_load(self._script.script)
+            replies = run()
+        return [self._record(self._result(reply)) for reply in replies]
+
+class _ByteSink(bytearray):
+    # 해시 객체 대신 인코딩 바이트열 자체를 누적 (hasher 인터페이스 : update, digest)
+    def update(self, data):
+        self += data
+
+    def digest(self) -> bytes:
+        return bytes(self)
+
+class _StableKeyBuilder(CacheKeyBuilder):
+    # xxhash 설치 여부와 무관한 정규 인코딩 : dict 키/set 원소 정렬 기준도 해시가 아닌 인코딩 바이트열
+    def _hasher(self):
+        return _ByteSink()
+
+_stable_key_builder = _StableKeyBuilder()
+# 사용자 타입 인코더는 기본 키 생성기와 공유
+_stable_key_builder._encoders = default_key_builder._encoders
+
+def _item_bytes(item: Any) -> bytes:
+    # 확률적 자료구조의 항목 식별 바이트열 (타입 정보 포함 : 1 과 '1', 'a' 와 b'a' 는 다른 항목)
+    if type(item) is str:
+        # 흔한 문자열 항목 : CacheKeyBuilder._encode 와 같은 바이트열을 직접 생성
+        data = item.encode('utf-8', 'surrogatepass')
+        return b's%d:' % len(data) + data
+    return _stable_key_builder._canonical(item)
+
+def _hash_pair(item: Any) -> tuple:
+    # 항목의 128비트 해시를 두 64비트 값으로 분할 (이중 해싱 h1 + i*h2 로 여러 해시 함수 대체)
+    # 프로세스/설치 패키지와 무관하게 같은 위치를 가리켜야 하므로 표준 라이브러리 blake2b 만 사용
+    digest = hashlib.blake2b(_item_bytes(item), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+def _pin_client(redis_client: redis.Redis, key: str) -> redis.Redis:
+    # 단일 키 구조 : 샤딩 모드에서는 키의 샤드 클라이언트를 직접 사용 (BITFIELD 빌더, 파이프라인 호환)
+    if isinstance(redis_client, ShardedRedisClient):
+        return redis_client.get_client(key)
+    return redis_client
 
-        if not current:
-            self.redis_client.setex(key, self.window, 1)
-            return True
+class RedisBloomFilter:
+    """블룸 필터 (BITFIELD u1 비트 배열)
 
-        if int(current) >= self.limit:
+    capacity 개 저장 시 거짓 양성 확률이 error_rate 가 되도록 비트 수(m)와 해시 수(k)를 계산.
+    add 는 BITFIELD SET 의 이전 비트 값으로 신규 여부를 함께 반환 (한 항목당 명령 1개).
+    """
+    MAX_BITS = 2 ** 32      # Redis 문자열 최대 크기(512MB)
+
+    def __init__(self, redis_client: redis.Redis, key: str, capacity: int,
+                 error_rate: float = 0.01, batch_size: int = 500):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate in (0, 1)")
+        self.key = key
+        self.redis_client = _pin_client(redis_client, key)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.batch_size = batch_size
+        self.size, self.hash_count = self.optimal_size(capacity, error_rate)
+
+    @classmethod
+    def optimal_size(cls, capacity: int, error_rate: float) -> tuple:
+        """(비트 수 m, 해시 수 k) : m = -n ln p / (ln 2)^2, k = m/n ln 2"""
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        if size > cls.MAX_BITS:
+            raise ValueError(f"Bloom filter needs {size} bits, exceeds Redis string limit")
+        return size, max(1, round(size / capacity * math.log(2)))
+
+    def _offsets(self, item: Any) -> List[int]:
+        h1, h2 = _hash_pair(item)
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def _run(self, items: List[Any], op: str) -> List[List[int]]:
+        replies = []
+        for i in range(0, len(items), self.batch_size):
+            pipe = self.redis_client.pipeline(transaction=False)
+            for item in items[i:i + self.batch_size]:
+                bitfield = pipe.bitfield(self.key)
+                for offset in self._offsets(item):
+                    if op == 'set':
+                        bitfield.set('u1', offset, 1)
+                    else:
+                        bitfield.get('u1', offset)
+                bitfield.execute()
+            replies.extend(pipe.execute())
+        return replies
+
+    def add(self, item: Any) -> bool:
+        """항목 추가, 새로 추가된 항목이면 True (이미 있었을 가능성이 있으면 False)"""
+        return self.add_many([item])[0]
+
+    def add_many(self, items: List[Any]) -> List[bool]:
+        """여러 항목을 batch_size 단위 파이프라인으로 추가"""
+        return [not all(bits) for bits in self._run(list(items), 'set')]
+
+    def contains(self, item: Any) -> bool:
+        """포함 여부 (False 는 확실히 없음, True 는 error_rate 확률로 거짓 양성)"""
+        return self.contains_many([item])[0]
+
+    def contains_many(self, items: List[Any]) -> List[bool]:
+        """여러 항목 포함 여부를 batch_size 단위 파이프라인으로 조회"""
+        return [all(bits) for bits in self._run(list(items), 'get')]
+
+    def __contains__(self, item: Any) -> bool:
+        return self.contains(item)
+
+    def clear(self):
+        self.redis_client.delete(self.key)
+
+class RedisHyperLogLog:
+    """HyperLogLog 고유 개수 추정 (PFADD/PFCOUNT/PFMERGE)
+
+    Redis 구현은 키당 최대 12KB, 표준 오차 0.81% 로 고정 (오차율로 크기를 조정할 수 없음).
+    """
+    ERROR_RATE = 0.0081
+
+    def __init__(self, redis_client: redis.Redis, key: str, batch_size: int = 500):
+        self.key = key
+        self.redis_client = _pin_client(redis_client, key)
+        self.batch_size = batch_size
+
+    def add(self, *items: Any) -> bool:
+        """항목 추가, 추정값이 바뀌었으면 True"""
+        return self.add_many(items)
+
+    def add_many(self, items: List[Any]) -> bool:
+        """여러 항목을 batch_size 단위 PFADD 파이프라인으로 추가"""
+        items = list(items)
+        if not items:
             return False
+        pipe = self.redis_client.pipeline(transaction=False)
+        for i in range(0, len(items), self.batch_size):
+            pipe.pfadd(self.key, *items[i:i + self.batch_size])
+        return any(pipe.execute())
 
-        self.redis_client.incr(key)
-        return True
+    def count(self, *other_keys: str) -> int:
+        """고유 개수 추정 (other_keys 지정시 합집합 추정, 같은 샤드의 키만 가능)"""
+        return self.redis_client.pfcount(self.key, *other_keys)
+
+    def merge(self, *source_keys: str):
+        """다른 HyperLogLog 들을 이 키로 병합 (PFMERGE)"""
+        self.redis_client.pfmerge(self.key, *source_keys)
+
+    def clear(self):
+        self.redis_client.delete(self.key)
+
+# 상위 항목 갱신 : 추정값은 단조 증가하므로 더 큰 값으로만 갱신(GT) 후 상위 k 개만 남기고 탈락 항목의 원본도 삭제
+# KEYS[1] = 상위 항목 ZSET, KEYS[2] = 항목 원본 HASH, ARGV[1] = k, 이후 (추정값, 항목 바이트열, 직렬화된 항목) 반복
+TOPK_UPDATE_SCRIPT = """
+local k = tonumber(ARGV[1])
+for i = 2, #ARGV, 3 do
+    redis.call('ZADD', KEYS[1], 'GT', ARGV[i], ARGV[i + 1])
+    redis.call('HSET', KEYS[2], ARGV[i + 1], ARGV[i + 2])
+end
+local evicted = redis.call('ZRANGE', KEYS[1], 0, -(k + 1))
+if #evicted > 0 then
+    redis.call('ZREMRANGEBYRANK', KEYS[1], 0, -(k + 1))
+    redis.call('HDEL', KEYS[2], unpack(evicted))
+end
+return #evicted
+"""
+
+class RedisCountMinSketch:
+    """Count-Min 스케치 빈도 추정 및 상위 항목(heavy hitters)
+
+    - 폭 w = ceil(e / error_rate), 깊이 d = ceil(ln(1 / (1 - confidence)))
+      추정값은 confidence 확률로 실제값 + error_rate * 전체 합 이하 (과대 추정만 발생)
+    - 카운터는 BITFIELD u32 배열(포화 연산)로 저장, INCRBY 응답의 최소값이 곧 추정값
+    - top_k > 0 이면 추정값 기준 상위 k 개 항목을 {key}:topk ZSET 으로 유지
+      (멤버는 해시와 같은 항목 바이트열, 원본 항목은 {key}:topk:items HASH 에 직렬화해 보관)
+    """
+    def __init__(self, redis_client: redis.Redis, key: str, error_rate: float = 0.001,
+                 confidence: float = 0.99, top_k: int = 0, batch_size: int = 500,
+                 serializer: Optional[RedisSerializer] = None):
+        if not 0 < error_rate < 1 or not 0 < confidence < 1:
+            raise ValueError("error_rate and confidence must be in (0, 1)")
+        self.key = key
+        self.topk_key = f"{key}:topk"
+        self.topk_items_key = f"{key}:topk:items"
+        self.redis_client = _pin_client(redis_client, key)
+        self.serializer = serializer or RedisSerializer()
+        self._update_topk = self.redis_client.register_script(TOPK_UPDATE_SCRIPT)
+        self.width = math.ceil(math.e / error_rate)
+        self.depth = math.ceil(math.log(1 / (1 - confidence)))
+        self.top_k = top_k
+        self.batch_size = batch_size
+
+    def _counters(self, item: Any) -> List[int]:
+        h1, h2 = _hash_pair(item)
+        return [row * self.width + (h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def _run(self, counts: Dict[Any, int]) -> Dict[Any, int]:
+        # amount 0 이면 조회(GET), 아니면 증가(INCRBY) 후 항목별 최소값 반환
+        items = list(counts.items())
+        estimates = {}
+        for i in range(0, len(items), self.batch_size):
+            chunk = items[i:i + self.batch_size]
+            pipe = self.redis_client.pipeline(transaction=False)
+            for item, amount in chunk:
+                bitfield = pipe.bitfield(self.key, default_overflow='SAT')
+                for index in self._counters(item):
+                    if amount:
+                        bitfield.incrby('u32', f"#{index}", amount)
+                    else:
+                        bitfield.get('u32', f"#{index}")
+                bitfield.execute()
+            for (item, _), values in zip(chunk, pipe.execute()):
+                estimates[item] = min(values)
+        return estimates
+
+    def increment(self, item: Any, amount: int = 1) -> int:
+        """빈도 증가 후 추정값 반환"""
+        return self.increment_many({item: amount})[item]
+
+    def increment_many(self, items: Union[List[Any], Dict[Any, int]]) -> Dict[Any, int]:
+        """여러 항목 빈도 증가 (목록은 프로세스 내에서 먼저 합산), 항목별 추정값 반환"""
+        counts = dict(items) if isinstance(items, dict) else {}
+        if not isinstance(items, dict):
+            for item in items:
+                counts[item] = counts.get(item, 0) + 1
+        estimates = self._run({item: amount for item, amount in counts.items() if amount})
+        if self.top_k > 0 and estimates:
+            updates = list(estimates.items())
+            for i in range(0, len(updates), self.batch_size):
+                args = [self.top_k]
+                for item, count in updates[i:i + self.batch_size]:
+                    args += [count, _item_bytes(item), self.serializer.dumps(item)]
+                self._update_topk(keys=[self.topk_key, self.topk_items_key], args=args)
+        return estimates
+
+    def estimate(self, item: Any) -> int:
+        """빈도 추정값 조회"""
+        return self.estimate_many([item])[item]
+
+    def estimate_many(self, items: List[Any]) -> Dict[Any, int]:
+        return self._run({item: 0 for item in items})
+
+    def top(self, n: Optional[int] = None) -> List[tuple]:
+        """상위 항목 [(항목, 추정 빈도), ...] (top_k 지정시에만 유지됨)"""
+        if n is None:
+            n = self.top_k
+        if n <= 0:
+            return []
+        rows = self.redis_client.zrevrange(self.topk_key, 0, n - 1, withscores=True)
+        if not rows:
+            return []
+        payloads = self.redis_client.hmget(self.topk_items_key, [member for member, _ in rows])
+        # 조회 사이에 다른 프로세스가 탈락시킨 항목은 제외
+        return [(self.serializer.loads(payload), int(score))
+                for (_, score), payload in zip(rows, payloads) if payload is not None]
+
+    def clear(self):
+        self.redis_client.delete(self.key, self.topk_key, self.topk_items_key)
+
+class CounterAggregator:
+    """증가 연산 쓰기 지연(write-behind) 집계
+
+    - increment 는 프로세스 내에서 키별로 합산만 하고, 키 수가 max_keys 에 도달하거나
+      flush_interval 초가 지나면 키별 INCRBY 한 번씩을 하나의 파이프라인으로 전송
+    - sample_rate < 1 이면 근사 모드 : 호출의 sample_rate 비율만 1/sample_rate 배로 반영 (기대값 보존)
+    - with 블록 종료, close(), 프로세스 종료(atexit) 시 남은 값 전송
+    - 전송 실패시 합산값을 버리지 않고 다음 flush 에서 재시도
+    """
+    def __init__(self, redis_client: redis.Redis, max_keys: int = 1000, flush_interval: float = 1.0,
+                 sample_rate: float = 1.0, batch_size: int = 500):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        self.redis_client = redis_client
+        self.max_keys = max_keys
+        self.flush_interval = flush_interval
+        self.sample_rate = sample_rate
+        self.batch_size = batch_size
+        self._pending: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._increments = 0
+        self._commands = 0
+        self._reported = 0      # 지표에 반영한 increment 호출 수
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._run, name="counter-flusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def __enter__(self) -> 'CounterAggregator':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def increment(self, key: str, amount: int = 1):
+        """증가량 합산 (Redis 전송은 flush 시점)"""
+        with self._lock:
+            self._increments += 1
+            if self.sample_rate < 1:
+                if random.random() >= self.sample_rate:
+                    return
+                amount = amount / self.sample_rate
+            self._pending[key] = self._pending.get(key, 0) + amount
+            full = len(self._pending) >= self.max_keys
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """합산된 증가량 전송 후 전송한 명령 수 반환"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            counts = {key: self._round(value) for key, value in pending.items()}
+            counts = {key: value for key, value in counts.items() if value}
+            if not counts:
+                return 0
+            items = list(counts.items())
+            try:
+                for i in range(0, len(items), self.batch_size):
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    for key, value in items[i:i + self.batch_size]:
+                        pipe.incrby(key, value)
+                    pipe.execute()
+                    # 전송된 배치는 재시도 대상에서 제외
+                    for key, _ in items[i:i + self.batch_size]:
+                        del counts[key]
+            except redis.RedisError as e:
+                logger.error(f"Counter flush failed, keeping {len(counts)} keys for retry: {e}")
+                with self._lock:
+                    for key, value in counts.items():
+                        self._pending[key] = self._pending.get(key, 0) + value
+                return 0
+            with self._lock:
+                self._commands += len(items)
+                calls, self._reported = self._increments - self._reported, self._increments
+            metrics.inc('redis_counter_commands_saved_total', value=calls - len(items))
+            return len(items)
+
+    @staticmethod
+    def _round(value: float) -> int:
+        # 근사 모드의 소수 합산값은 확률적 반올림으로 기대값을 유지
+        whole = math.floor(value)
+        return whole + (1 if random.random() < value - whole else 0)
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Counter flusher failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """increment 호출 수, 실제 전송 명령 수, 절감한 명령 수, 대기 중인 키 수"""
+        with self._lock:
+            return {'increments': self._increments, 'commands': self._commands,
+                    'commands_saved': self._increments - self._commands,
+                    'pending_keys': len(self._pending)}
+
+    def close(self):
+        """주기 전송 중단 및 남은 값 전송"""
+        self._stop.set()
+        if self._flusher.is_alive() and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        atexit.unregister(self.close)
+        self.flush()
+
+# 청크 저장 : chunk_size 보다 큰 값은 {key}:chunk:{버전}:{i} 키들로 나눠 저장하고 원래 키에는 manifest 저장
+# manifest = 0x00 헤더 + JSON (직렬화 헤더(0x10 이상), 기존 pickle(0x80) 과 구분)
+# 버전 토큰이 쓰기마다 달라 읽는 도중 덮어써도 다른 버전 청크가 섞이지 않음
+CHUNK_MANIFEST_HEADER = b'\x00'
+CHUNK_GRACE_TTL = 60        # 덮어쓴/삭제한 값의 이전 청크 유지 시간 (진행 중인 reader 보호)
+CHUNK_MANIFEST_MAX = 256    # manifest 최대 크기 (GETRANGE 로 앞부분만 읽어 판별)
+
+def chunk_key(key: str, version: str, index: int) -> str:
+    return f"{key}:chunk:{version}:{index}"
+
+def parse_chunk_manifest(data: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    """청크 manifest 이면 {'v': 버전, 'n': 청크 수, 'size': 전체 크기}, 아니면 None"""
+    if not data or data[:1] != CHUNK_MANIFEST_HEADER:
+        return None
+    return json.loads(bytes(data[1:]))
+
+def manifest_chunk_keys(key: str, manifest: Dict[str, Any]) -> List[str]:
+    return [chunk_key(key, manifest['v'], i) for i in range(manifest['n'])]
+
+def split_chunks(key: str, payload: bytes, chunk_size: int) -> tuple:
+    """(manifest bytes, [(청크 키, 청크)]) : 청크는 payload 를 복사하지 않는 memoryview"""
+    version = secrets.token_hex(4)
+    view = memoryview(payload)
+    count = math.ceil(len(payload) / chunk_size)
+    manifest = {'v': version, 'n': count, 'size': len(payload)}
+    chunks = [(chunk_key(key, version, i), view[i * chunk_size:(i + 1) * chunk_size])
+              for i in range(count)]
+    return CHUNK_MANIFEST_HEADER + json.dumps(manifest).encode(), chunks
 
 class RedisDataManager:
-    """데이터 관리"""
-    def __init__(self, redis_client: redis.Redis):
+    """데이터 관리
+
+    chunk_size > 0 이면 직렬화 크기가 chunk_size 를 넘는 값은 여러 키로 나눠 저장 (큰 단일 값의
+    SET/GET 이 Redis 를 오래 점유하지 않도록). 읽기는 chunk_size 설정과 무관하게 항상 청크 값을 인식.
+    """
+    def __init__(self, redis_client: redis.Redis, serializer: Optional[RedisSerializer] = None,
+                 batch_size: int = 500, chunk_size: int = 0):
         self.redis_client = redis_client
+        self.serializer = serializer or RedisSerializer()
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+
+    def _chunks(self, items: List[Any]):
+        for i in range(0, len(items), self.batch_size):
+            yield items[i:i + self.batch_size]
+
+    def _write(self, pipe, key: str, payload: bytes, ttl: Optional[int]):
+        # 청크를 먼저, manifest 를 마지막에 기록 (파이프라인 내 순서 유지)
+        if not self.chunk_size or len(payload) <= self.chunk_size:
+            pipe.set(key, payload, ex=ttl or None)
+            return
+        manifest, chunks = split_chunks(key, payload, self.chunk_size)
+        for name, chunk in chunks:
+            pipe.set(name, chunk, ex=ttl or None)
+        pipe.set(key, manifest, ex=ttl or None)
+
+    def _stale_chunks(self, keys: List[str]) -> List[str]:
+        # 덮어쓰거나 삭제할 키들의 기존 청크 키 (manifest 는 작으므로 GETRANGE 로 앞부분만 조회)
+        if not self.chunk_size or not keys:
+            return []
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.getrange(key, 0, CHUNK_MANIFEST_MAX)
+        stale = []
+        for key, prefix in zip(keys, pipe.execute(raise_on_error=False)):
+            manifest = None if isinstance(prefix, Exception) else parse_chunk_manifest(prefix)
+            if manifest:
+                stale.extend(manifest_chunk_keys(key, manifest))
+        return stale
+
+    def _read_chunks(self, key: str, manifest: Dict[str, Any], retries: int = 3) -> Optional[bytes]:
+        # 청크를 batch_size 단위 MGET 으로 읽어 결합, 도중에 값이 바뀌었으면 manifest 를 다시 읽어 재시도
+        for _ in range(retries):
+            parts = []
+            for names in self._chunks(manifest_chunk_keys(key, manifest)):
+                parts.extend(self.redis_client.mget(names))
+            if all(part is not None for part in parts):
+                return b''.join(parts)
+            data = self.redis_client.get(key)
+            manifest = parse_chunk_manifest(data)
+            if manifest is None:
+                return data
+        logger.warning(f"Chunked value {key} kept changing while reading")
+        return None
+
+    def _load(self, key: str, data: Optional[bytes]) -> Optional[Any]:
+        manifest = parse_chunk_manifest(data)
+        if manifest is not None:
+            data = self._read_chunks(key, manifest)
+        return self.serializer.loads(data) if data else None
 
     def set_data(self, key: str, value: Any, expire: Optional[int] = None):
         """데이터 저장"""
-        serialized = pickle.dumps(value)
-        if expire:
-            self.redis_client.setex(key, expire, serialized)
-        else:
-            self.redis_client.set(key, serialized)
+        serialized = self.serializer.dumps(value)
+        if not self.chunk_size:
+            if expire:
+                self.redis_client.setex(key, expire, serialized)
+            else:
+                self.redis_client.set(key, serialized)
+            return
+        stale = self._stale_chunks([key])
+        pipe = self.redis_client.pipeline(transaction=False)
+        self._write(pipe, key, serialized, expire)
+        for name in stale:
+            pipe.expire(name, CHUNK_GRACE_TTL)
+        pipe.execute()
 
     def get_data(self, key: str) -> Optional[Any]:
         """데이터 조회"""
+        return self._load(key, self.redis_client.get(key))
+
+    def iter_chunks(self, key: str, prefetch: int = 4) -> Iterator[bytes]:
+        """저장된 직렬화 데이터를 청크 단위로 반환 (전체 값을 메모리에 올리지 않음, 예 : 파일로 기록)
+
+        청크로 나뉘지 않은 값은 한 번에 반환. 읽는 도중 값이 덮어써져 이전 청크가 사라지면 KeyError.
+        """
         data = self.redis_client.get(key)
-        return pickle.loads(data) if data else None
+        manifest = parse_chunk_manifest(data)
+        if manifest is None:
+            if data:
+                yield data
+            return
+        names = manifest_chunk_keys(key, manifest)
+        for i in range(0, len(names), prefetch):
+            for name, chunk in zip(names[i:i + prefetch], self.redis_client.mget(names[i:i + prefetch])):
+                if chunk is None:
+                    raise KeyError(f"Chunk {name} is missing (value was overwritten or expired)")
+                yield chunk
+
+    def set_many(self, mapping: Dict[str, Any],
+                 expire: Union[int, Dict[str, int], None] = None, transaction: bool = False):
+        """여러 데이터 저장 (batch_size 단위 파이프라인, expire 는 공통 TTL 또는 키별 TTL)"""
+        for chunk in self._chunks(list(mapping.items())):
+            stale = self._stale_chunks([key for key, _ in chunk])
+            pipe = self.redis_client.pipeline(transaction=transaction)
+            for key, value in chunk:
+                ttl = expire.get(key) if isinstance(expire, dict) else expire
+                self._write(pipe, key, self.serializer.dumps(value), ttl)
+            for name in stale:
+                pipe.expire(name, CHUNK_GRACE_TTL)
+            pipe.execute()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[Any]]:
+        """여러 데이터 조회 (batch_size 단위 MGET, 없는 키는 None)"""
+        result = {}
+        for chunk in self._chunks(list(keys)):
+            values = self.redis_client.mget(chunk)
+            for key, data in zip(chunk, values):
+                result[key] = self._load(key, data)
+        return result
+
+    def delete_many(self, keys: List[str]) -> int:
+        """여러 데이터 삭제 후 삭제된 키 수 반환 (청크 값은 청크도 삭제)"""
+        chunks = list(self._chunks(list(keys)))
+        if not chunks:
+            return 0
+        stale = [name for chunk in chunks for name in self._stale_chunks(chunk)]
+        pipe = self.redis_client.pipeline(transaction=False)
+        for chunk in chunks:
+            pipe.delete(*chunk)
+        for names in self._chunks(stale):
+            pipe.delete(*names)
+        return sum(pipe.execute()[:len(chunks)])
 
     def increment(self, key: str, amount: int = 1) -> int:
         """증가"""
         return self.redis_client.incrby(key, amount)
 
+    def counter_aggregator(self, max_keys: int = 1000, flush_interval: float = 1.0,
+                           sample_rate: float = 1.0) -> CounterAggregator:
+        """increment 를 모아서 전송하는 쓰기 지연 집계기 (이벤트 카운터 등 대량 증가용)"""
+        return CounterAggregator(self.redis_client, max_keys, flush_interval, sample_rate, self.batch_size)
+
     def expire_at(self, key: str, timestamp: datetime):
         """만료 시간 설정"""
         self.redis_client.expireat(key, int(timestamp.timestamp()))
 
+    def bloom_filter(self, key: str, capacity: int, error_rate: float = 0.01) -> RedisBloomFilter:
+        """중복 확인용 블룸 필터 (capacity, error_rate 로 크기 결정)"""
+        return RedisBloomFilter(self.redis_client, key, capacity, error_rate, self.batch_size)
+
+    def hyperloglog(self, key: str) -> RedisHyperLogLog:
+        """고유 개수 추정용 HyperLogLog"""
+        return RedisHyperLogLog(self.redis_client, key, self.batch_size)
+
+    def count_min_sketch(self, key: str, error_rate: float = 0.001, confidence: float = 0.99,
+                         top_k: int = 0) -> RedisCountMinSketch:
+        """빈도 추정용 Count-Min 스케치 (top_k > 0 이면 상위 항목 유지)"""
+        return RedisCountMinSketch(self.redis_client, key, error_rate, confidence, top_k, self.batch_size,
+                                   self.serializer)
+
 class RedisHealthCheck:
     """헬스 체크"""
     def __init__(self, redis_client: redis.Redis):
@@ -222,7 +2384,10 @@ class RedisHealthCheck:
     def check_connection(self) -> bool:
         """연결 상태 확인"""
         try:
-            return self.redis_client.ping()
+            result = self.redis_client.ping()
+            if isinstance(result, dict):    # 샤딩 클라이언트 : 모든 노드 응답 필요
+                return all(result.values())
+            return result
         except redis.ConnectionError:
             return False
 
@@ -230,29 +2395,264 @@ class RedisHealthCheck:
         """Redis 서버 정보 조회"""
         return self.redis_client.info()
 
+class ConsistentHashRing:
+    """가상 노드 기반 일관성 해시 링 (노드 추가/제거시 일부 키만 재배치)"""
+    def __init__(self, nodes: List[str], vnodes: int = 160):
+        self.vnodes = vnodes
+        self._ring: List[tuple] = []
+        for node in nodes:
+            self.add_node(node)
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        # 프로세스 간 동일한 값을 보장하는 해시 (내장 hash() 는 실행마다 달라짐)
+        return int.from_bytes(hashlib.md5(value.encode()).digest()[:8], 'big')
+
+    @staticmethod
+    def hash_tag(key: str) -> str:
+        """Redis Cluster 규칙의 해시 태그 : key 에 {tag} 가 있으면 tag 로만 배치"""
+        start = key.find('{')
+        if start != -1:
+            end = key.find('}', start + 1)
+            if end > start + 1:
+                return key[start + 1:end]
+        return key
+
+    def add_node(self, node: str):
+        for i in range(self.vnodes):
+            bisect.insort(self._ring, (self._hash(f"{node}#{i}"), node))
+
+    def remove_node(self, node: str):
+        self._ring = [point for point in self._ring if point[1] != node]
+
+    def get_node(self, key: Union[str, bytes]) -> str:
+        if isinstance(key, bytes):
+            key = key.decode()
+        position = self._hash(self.hash_tag(key))
+        index = bisect.bisect(self._ring, (position, '')) % len(self._ring)
+        return self._ring[index][1]
+
+class ShardedScript:
+    """샤딩 클라이언트용 Lua 스크립트 (첫 번째 키의 샤드에서 EVALSHA)"""
+    def __init__(self, sharded_client: 'ShardedRedisClient', script: str):
+        self.registered_client = sharded_client
+        self.script = script
+        self.sha = hashlib.sha1(script.encode()).hexdigest()
+
+    def __call__(self, keys: Optional[List[str]] = None, args: Optional[list] = None, client=None):
+        keys = keys or []
+        args = args or []
+        client = client or self.registered_client
+        try:
+            return client.evalsha(self.sha, len(keys), *keys, *args)
+        except redis.exceptions.NoScriptError:
+            self.registered_client.script_load(self.script)
+            return client.evalsha(self.sha, len(keys), *keys, *args)
+
+class ShardedPipeline:
+    """샤딩 파이프라인 : 명령을 샤드별로 모아 병렬 실행 후 원래 순서로 결과 반환"""
+    def __init__(self, sharded_client: 'ShardedRedisClient', transaction: bool = False):
+        self.sharded_client = sharded_client
+        self.transaction = transaction
+        # (명령 이름, 인자, 키워드 인자)
+        self._commands: List[tuple] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._commands = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def __getattr__(self, name: str):
+        def command(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+        return command
+
+    def execute(self, raise_on_error: bool = True) -> list:
+        # 샤드별 (결과 위치, 명령) 목록 구성 : 다중 키 합산 명령은 샤드별로 쪼개 합산
+        # raise_on_error=False 면 redis-py 파이프라인과 같이 실패한 명령 자리에 예외 객체 반환
+        client = self.sharded_client
+        per_node: Dict[str, List[tuple]] = {}
+        results: list = [0] * len(self._commands)
+        for index, (name, args, kwargs) in enumerate(self._commands):
+            if name in client.MULTI_KEY_SUM:
+                for node, keys in client.group_keys(args).items():
+                    per_node.setdefault(node, []).append((index, name, keys, kwargs, True))
+            else:
+                node = client.ring.get_node(client.command_key(name, args, kwargs))
+                per_node.setdefault(node, []).append((index, name, args, kwargs, False))
+        self._commands = []
+
+        def run(node: str) -> list:
+            pipe = client.clients[node].pipeline(transaction=self.transaction)
+            for _, name, args, kwargs, _ in per_node[node]:
+                getattr(pipe, name)(*args, **kwargs)
+            return pipe.execute(raise_on_error=raise_on_error)
+
+        for node, replies in zip(per_node, client.executor.map(run, per_node)):
+            for (index, _, _, _, summed), reply in zip(per_node[node], replies):
+                if summed and isinstance(results[index], Exception):
+                    continue    # 다른 샤드에서 이미 실패한 합산 명령
+                if summed and not isinstance(reply, Exception):
+                    results[index] += reply
+                else:
+                    results[index] = reply
+        return results
+
+class ShardedRedisClient:
+    """일관성 해시 기반 클라이언트 측 샤딩
+
+    redis.Redis 와 같은 방식으로 사용 (RedisCache, RedisDataManager, RedisRateLimiter 에 그대로 전달 가능).
+    단일 키 명령은 키의 샤드로, MGET/DELETE 등 다중 키 명령은 샤드별로 병렬 실행.
+    여러 키를 원자적으로 다루는 명령(Lua, LMOVE 등)은 해시 태그로 같은 샤드에 배치해야 함.
+    Pub/Sub 은 첫 번째 노드를 사용.
+    """
+    MULTI_KEY_SUM = {'delete', 'unlink', 'exists', 'touch'}
+    ALL_NODES = {'ping', 'flushdb', 'script_flush', 'info', 'dbsize'}
+
+    def __init__(self, configs: List[RedisConfig], vnodes: int = 160,
+                 decode_responses: Optional[bool] = None, max_workers: Optional[int] = None):
+        if not configs:
+            raise ValueError("at least one shard config is required")
+        self.clients: Dict[str, redis.Redis] = {}
+        for config in configs:
+            node = f"{config.host}:{config.port}/{config.db}"
+            if decode_responses is not None:
+                config = replace(config, decode_responses=decode_responses)
+            self.clients[node] = RedisConnectionPool(config).get_connection()
+        self.ring = ConsistentHashRing(list(self.clients), vnodes)
+        self.primary = next(iter(self.clients.values()))
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or len(self.clients),
+                                           thread_name_prefix='redis-shard')
+
+    @staticmethod
+    def command_key(name: str, args: tuple, kwargs: dict):
+        # EVAL/EVALSHA 는 (script, numkeys, key1, ...) 형태이므로 첫 번째 키 기준
+        if name in ('eval', 'evalsha'):
+            return args[2] if args[1] else ''
+        if args:
+            return args[0]
+        return kwargs.get('name') or kwargs.get('key') or ''
+
+    def get_client(self, key: Union[str, bytes]) -> redis.Redis:
+        """키가 배치된 샤드의 클라이언트 반환"""
+        return self.clients[self.ring.get_node(key)]
+
+    def group_keys(self, keys) -> Dict[str, List[str]]:
+        """키 목록을 샤드별로 분류"""
+        groups: Dict[str, List[str]] = {}
+        for key in keys:
+            groups.setdefault(self.ring.get_node(key), []).append(key)
+        return groups
+
+    def __getattr__(self, name: str):
+        if name in self.ALL_NODES:
+            return lambda *args, **kwargs: {node: getattr(client, name)(*args, **kwargs)
+                                            for node, client in self.clients.items()}
+
+        def command(*args, **kwargs):
+            client = self.get_client(self.command_key(name, args, kwargs))
+            return getattr(client, name)(*args, **kwargs)
+        return command
+
+    def _fan_out(self, name: str, keys) -> Dict[str, Any]:
+        groups = self.group_keys(keys)
+        replies = self.executor.map(lambda node: getattr(self.clients[node], name)(*groups[node]), groups)
+        return dict(zip(groups, replies))
+
+    def mget(self, keys, *args) -> list:
+        """샤드별 MGET 병렬 실행 후 요청 순서대로 결과 반환"""
+        keys = list(keys) + list(args)
+        groups = self.group_keys(keys)
+        replies = self.executor.map(lambda node: self.clients[node].mget(groups[node]), groups)
+        values: Dict[Any, Any] = {}
+        for node, reply in zip(groups, replies):
+            values.update(zip(groups[node], reply))
+        return [values[key] for key in keys]
+
+    def delete(self, *keys) -> int:
+        return sum(self._fan_out('delete', keys).values())
+
+    def unlink(self, *keys) -> int:
+        return sum(self._fan_out('unlink', keys).values())
+
+    def exists(self, *keys) -> int:
+        return sum(self._fan_out('exists', keys).values())
+
+    def pipeline(self, transaction: bool = False) -> ShardedPipeline:
+        return ShardedPipeline(self, transaction)
+
+    def register_script(self, script: str) -> ShardedScript:
+        return ShardedScript(self, script)
+
+    def script_load(self, script: str) -> str:
+        """모든 샤드에 스크립트 적재"""
+        return [client.script_load(script) for client in self.clients.values()][0]
+
+    def publish(self, channel: str, message: Any) -> int:
+        return self.primary.publish(channel, message)
+
+    def pubsub(self, **kwargs):
+        return self.primary.pubsub(**kwargs)
+
 class RedisFramework:
-    """통합 Redis 프레임워크"""
-    def __init__(self, config: RedisConfig):
+    """통합 Redis 프레임워크 (shards 지정시 일관성 해시 샤딩 모드)"""
+    def __init__(self, config: RedisConfig, shards: Optional[List[RedisConfig]] = None):
         self.config = config
-        self.client = RedisConnectionPool(config).get_connection()
+        if shards:
+            self.client = ShardedRedisClient(shards, decode_responses=config.decode_responses)
+            self.binary_client = ShardedRedisClient(shards, decode_responses=False)
+        else:
+            connection_pool = RedisConnectionPool(config)
+            self.client = connection_pool.get_connection()
+            # 직렬화된 값을 저장하는 컴포넌트는 bytes 응답 클라이언트 사용
+            self.binary_client = connection_pool.get_binary_connection()
+        self.serializer = RedisSerializer.from_config(config)
 
         # 각 기능 초기화
-        self.cache = RedisCache(config)
-        self.data_manager = RedisDataManager(self.client)
-        self.pubsub = RedisPubSub(self.client)
+        self.cache = RedisCache(config, self.binary_client)
+        self.data_manager = RedisDataManager(self.binary_client, self.serializer, config.batch_size,
+                                             config.chunk_size)
+        self.pubsub = RedisPubSub(self.binary_client, self.serializer)
         self.health_check = RedisHealthCheck(self.client)
+        self.metrics = metrics
 
-    def create_lock(self, lock_name: str, timeout: int = 10) -> RedisLock:
+        # 속도 제한 스크립트 사전 적재 (실패해도 EVALSHA 시 NOSCRIPT 로 재적재)
+        try:
+            RedisRateLimiter.load_scripts(self.client)
+        except redis.RedisError as e:
+            logger.warning(f"Rate limit script preload failed: {e}")
+
+    def create_lock(self, lock_name: str, timeout: int = 10, auto_renew: bool = False) -> RedisLock:
         """락 생성"""
-        return RedisLock(self.client, lock_name, timeout)
+        return RedisLock(self.client, lock_name, timeout, auto_renew)
 
-    def create_queue(self, queue_name: str) -> RedisQueue:
-        """큐 생성"""
-        return RedisQueue(self.client, queue_name)
+    def create_queue(self, queue_name: str, consumer_id: Optional[str] = None,
+                     visibility_timeout: int = 30, backend: Optional[str] = None,
+                     **stream_options) -> Union[RedisQueue, RedisStreamQueue]:
+        """큐 생성 (backend 미지정시 RedisConfig.queue_backend 사용, stream_options : group, maxlen)"""
+        backend = backend or self.config.queue_backend
+        # 샤딩 모드 : 큐와 처리 중 목록 등 관련 키가 모두 큐 이름의 샤드에 위치하도록 고정
+        client = self.binary_client
+        if isinstance(client, ShardedRedisClient):
+            client = client.get_client(queue_name)
+        if backend == 'stream':
+            return RedisStreamQueue(client, queue_name, self.serializer,
+                                    consumer_id, visibility_timeout, self.config.batch_size,
+                                    **stream_options)
+        if backend != 'list':
+            raise ValueError(f"Unknown queue backend: {backend}")
+        return RedisQueue(client, queue_name, self.serializer,
+                          consumer_id, visibility_timeout, self.config.batch_size)
 
-    def create_rate_limiter(self, key_prefix: str, limit: int, window: int) -> RedisRateLimiter:
+    def create_rate_limiter(self, key_prefix: str, limit: int, window: int,
+                            algorithm: str = 'fixed_window') -> RedisRateLimiter:
         """속도 제한기 생성"""
-        return RedisRateLimiter(self.client, key_prefix, limit, window)
+        return RedisRateLimiter(self.client, key_prefix, limit, window, algorithm)
 
 """
 # 사용 예시
@@ -264,6 +2664,9 @@ def example_usage():
         db=0
     )
 
+    # 로그 파일 설정 (import 시 자동 설정하지 않음)
+    configure_logging('redis_operations.log')
+
     # 프레임워크 초기화
     redis_framework = RedisFramework(config)
 
@@ -290,12 +2693,23 @@ def example_usage():
     redis_framework.pubsub.subscribe("my_channel", message_handler)
     redis_framework.pubsub.publish("my_channel", {"event": "update"})
 
+    # 비차단 디스패처 : 느린 콜백이 다른 채널을 막지 않음 (패턴 구독, 배치 콜백)
+    dispatcher = redis_framework.pubsub.dispatcher(workers=4, queue_size=1000)
+    dispatcher.subscribe("my_channel", message_handler)
+    dispatcher.psubscribe("events:*", lambda channel, message: print(channel, message))
+    dispatcher.subscribe("metrics", lambda messages: print(len(messages)), batch_size=100)
+    dispatcher.start()
+
     # 속도 제한 사용 예시
     rate_limiter = redis_framework.create_rate_limiter("api_calls", 100, 3600)
     if rate_limiter.is_allowed("user_123"):
         # API 호출 처리
         pass
 
+    # 지표 조회 (함수별 캐시 적중률 등) 및 Prometheus 엔드포인트용 텍스트
+    print(redis_framework.metrics.snapshot()['cache'])
+    print(redis_framework.metrics.to_prometheus())
+
 if __name__ == "__main__":
     example_usage()
 """
\ No newline at end of file
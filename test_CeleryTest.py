@@ -1,5 +1,45 @@
 import unittest
-from common.CeleryCm import RedisManager
+import numpy as np
+import pandas as pd
+import os
+import tempfile
+import time
+import redis
+from datetime import datetime
+from unittest import mock
+from common import CeleryCm
+from common.CeleryCm import (RedisManager, ChunkedDataFrame, partial_aggregate, combine_aggregates,
+                             csv_byte_ranges, read_chunk)
+
+# Redis 서버가 필요한 동작 테스트는 fakeredis(Lua 지원) 로 실행
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+def fake_redis_manager() -> RedisManager:
+    """fakeredis 서버에 연결된 RedisManager (Lua 스크립트 등록 포함)"""
+    server = fakeredis.FakeServer()
+    with mock.patch('redis.Redis', lambda connection_pool=None, **kwargs: fakeredis.FakeRedis(server=server)):
+        return RedisManager(db=15)
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class EagerTaskTestCase(unittest.TestCase):
+    """작업을 eager 모드로 실행하고 상태/지표는 fakeredis 에 기록"""
+    tasks = ()
+
+    def setUp(self):
+        self.manager = fake_redis_manager()
+        for task in self.tasks:
+            patcher = mock.patch.object(task, 'redis_manager', self.manager)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(CeleryCm.task_metrics, 'redis_manager', self.manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        eager = CeleryCm.app.conf.task_always_eager
+        CeleryCm.app.conf.task_always_eager = True
+        self.addCleanup(setattr, CeleryCm.app.conf, 'task_always_eager', eager)
 
 class TestRedisManagerSetUp(unittest.TestCase):
     def setUp(self):
@@ -17,5 +57,382 @@ class TestRedisManagerSetUp(unittest.TestCase):
         redis_password = os.getenv('REDIS_PASSWORD', 'default_password')
         self.assertEqual(self.redis_manager.redis_client.connection_pool.connection_kwargs['password'], redis_password)
 
+    def test_connection_pool_waits_instead_of_failing(self):
+        # 공유 인스턴스는 모든 작업의 신호 처리기가 사용 : 기본 연결 수(10)가 아닌 넉넉한 블로킹 풀
+        pool = self.redis_manager.redis_client.connection_pool
+        self.assertIsInstance(pool, redis.BlockingConnectionPool)
+        self.assertEqual((pool.max_connections, pool.timeout),
+                         (RedisManager.MAX_CONNECTIONS, RedisManager.POOL_TIMEOUT))
+        pool = RedisManager(db=15, max_connections=200, pool_timeout=1.5).redis_client.connection_pool
+        self.assertEqual((pool.max_connections, pool.timeout), (200, 1.5))
+
+class TestChunkedAggregates(unittest.TestCase):
+    def setUp(self):
+        # 큰 오프셋 + 작은 분산 : sum/sumsq 방식이면 분산이 0 또는 음수로 계산되는 데이터
+        rng = np.random.default_rng(1)
+        self.df = pd.DataFrame({'g': rng.integers(0, 3, 1000), 'x': 1e9 + rng.random(1000)})
+        self.agg = {'x': ['sum', 'count', 'min', 'max', 'mean', 'var', 'std']}
+
+    def combine(self, group_by):
+        chunks = [self.df.iloc[i:i + 250] for i in range(0, len(self.df), 250)]
+        partials = pd.concat([partial_aggregate(chunk, group_by, self.agg) for chunk in chunks])
+        return combine_aggregates(partials, group_by, self.agg)
+
+    def test_matches_pandas_groupby_for_offset_data(self):
+        pd.testing.assert_frame_equal(self.combine('g'), self.df.groupby('g').agg(self.agg), rtol=1e-6)
+
+    def test_whole_column(self):
+        result = self.combine(None)
+        self.assertAlmostEqual(result[('x', 'var')].iloc[0], self.df['x'].var(), delta=1e-6)
+        self.assertAlmostEqual(result[('x', 'mean')].iloc[0], self.df['x'].mean(), delta=1e-6)
+
+    def test_rejects_non_decomposable_aggregate(self):
+        with self.assertRaises(ValueError):
+            partial_aggregate(self.df, 'g', {'x': ['median']})
+
+class TestCsvByteRanges(unittest.TestCase):
+    def setUp(self):
+        # 결측은 마지막 줄에만 있어 청크별 추론이면 앞 청크는 int64/bool, 마지막 청크는 float/object 가 되는 데이터
+        self.path = os.path.join(tempfile.mkdtemp(), 'data.csv')
+        with open(self.path, 'w') as f:
+            f.write('k,flag,name\n')
+            for i in range(5000):
+                f.write(f"{i},{'true' if i % 2 else 'false'},n{i}\n")
+            f.write(',,\n')
+
+    def test_chunks_share_dtypes_and_rows(self):
+        sources = csv_byte_ranges(self.path, 10000)
+        chunks = [read_chunk(source) for source in sources]
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(len({tuple(map(str, chunk.dtypes)) for chunk in chunks}), 1)
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 5001)
+        self.assertEqual(list(pd.concat(chunks)['k'].iloc[:3]), [0, 1, 2])
+
+    def test_usecols_and_row_options(self):
+        chunks = [read_chunk(source) for source in csv_byte_ranges(self.path, 10000, usecols=['k', 'name'])]
+        self.assertEqual(list(chunks[-1].columns), ['k', 'name'])
+        with self.assertRaises(ValueError):
+            csv_byte_ranges(self.path, 10000, skiprows=2)
+
 if __name__ == '__main__':
     unittest.main()
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestTaskMonitor(unittest.TestCase):
+    def setUp(self):
+        self.manager = fake_redis_manager()
+        self.monitor = CeleryCm.TaskMonitor(self.manager)
+        self.now = float(int(time.time()))     # datetime 변환 후에도 같은 점수가 되도록 초 단위
+
+    def set_status(self, task_id, status, at, **fields):
+        with mock.patch.object(CeleryCm.time, 'time', return_value=self.now + at):
+            self.manager.set_task_status(task_id, {'status': status, **fields})
+
+    def test_status_change_moves_task_between_indexes(self):
+        self.set_status('a', 'PENDING', 0)
+        self.set_status('b', 'PENDING', 1)
+        self.set_status('a', 'SUCCESS', 2, result='3')
+        self.assertEqual(self.monitor.status_counts(), {'PENDING': 1, 'SUCCESS': 1})
+        self.assertEqual(self.monitor.list_tasks('PENDING'), ['b'])
+        self.assertEqual(self.monitor.list_tasks(), ['a', 'b'])     # 최근 갱신 순
+        self.assertEqual(self.monitor.get_task_info('a')['result'], '3')
+
+    def test_list_and_count_with_time_range_and_paging(self):
+        for i in range(10):
+            self.set_status(f"t{i}", 'SUCCESS' if i % 2 else 'FAILURE', i)
+        self.assertEqual(self.monitor.count_tasks(), 10)
+        self.assertEqual(self.monitor.count_tasks('SUCCESS', start=self.now + 4), 3)
+        self.assertEqual(self.monitor.list_tasks(offset=2, limit=3), ['t7', 't6', 't5'])
+        self.assertEqual(self.monitor.list_tasks('FAILURE', end=self.now + 4, newest_first=False),
+                         ['t0', 't2', 't4'])
+        start = datetime.fromtimestamp(self.now + 8)
+        self.assertEqual(self.monitor.list_tasks(start=start), ['t9', 't8'])
+
+    def test_iter_tasks_with_equal_scores(self):
+        # 같은 갱신 시각이 배치 경계에 걸쳐도 누락/중복 없이 순회
+        for i in range(7):
+            self.set_status(f"t{i}", 'SUCCESS', 0)
+        for i in range(7, 10):
+            self.set_status(f"t{i}", 'SUCCESS', 1)
+        self.assertEqual(sorted(self.monitor.iter_tasks(batch_size=3)), sorted(f"t{i}" for i in range(10)))
+        self.assertEqual(list(self.monitor.iter_tasks(batch_size=3))[-3:], ['t7', 't8', 't9'])
+
+    def test_rebuild_indexes_from_existing_hashes(self):
+        client = self.manager.redis_client
+        client.hset('task_status:old1', mapping={'status': 'SUCCESS', 'updated_at': self.now})
+        client.hset('task_status:old2', mapping={'status': 'FAILURE'})
+        self.assertEqual(self.monitor.count_tasks(), 0)
+        self.assertEqual(self.manager.rebuild_task_indexes(batch_size=1), 2)
+        self.assertEqual(self.monitor.status_counts(), {'SUCCESS': 1, 'FAILURE': 1})
+        self.assertEqual(self.monitor.list_tasks('SUCCESS'), ['old1'])
+
+class TestTaskStatusWrites(EagerTaskTestCase):
+    tasks = (CeleryCm.sample_task,)
+
+    def test_ttl_expires_hash_and_prunes_old_index_entries(self):
+        now = time.time()
+        with mock.patch.object(CeleryCm.time, 'time', return_value=now - 200):
+            self.manager.set_task_status('old', {'status': 'SUCCESS'}, ttl=100)
+        self.manager.set_task_status('new', {'status': 'SUCCESS'}, ttl=100)
+        client = self.manager.redis_client
+        self.assertTrue(0 < client.ttl('task_status:new') <= 100)
+        self.assertEqual(client.zrange(RedisManager.TIME_INDEX, 0, -1), [b'new'])
+        self.assertEqual(client.zrange(RedisManager.status_index_key('SUCCESS'), 0, -1), [b'new'])
+
+    def test_set_task_statuses_in_one_pipeline(self):
+        with mock.patch.object(self.manager.redis_client, 'pipeline',
+                               wraps=self.manager.redis_client.pipeline) as pipeline:
+            self.manager.set_task_statuses({'a': {'status': 'SUCCESS', 'result': None}, 'b': {'status': 'FAILURE'}})
+        self.assertEqual(pipeline.call_count, 1)
+        self.assertEqual(self.manager.get_task_status('a')['status'], 'SUCCESS')
+        self.assertNotIn('result', self.manager.get_task_status('a'))      # None 값은 기록하지 않음
+        self.assertEqual(CeleryCm.TaskMonitor(self.manager).status_counts(), {'SUCCESS': 1, 'FAILURE': 1})
+
+    def test_success_status_keeps_small_results_and_caps_large_ones(self):
+        result = CeleryCm.sample_task.apply(args=(1, 2))
+        status = self.manager.get_task_status(result.id)
+        self.assertEqual((status['status'], status['result']), ('SUCCESS', '3'))
+        self.assertTrue(0 < self.manager.redis_client.ttl(f"task_status:{result.id}")
+                        <= CeleryCm.app.conf.TASK_STATUS_TTL)
+        max_bytes = CeleryCm.app.conf.TASK_STATUS_MAX_RESULT_BYTES
+        CeleryCm.app.conf.TASK_STATUS_MAX_RESULT_BYTES = 10
+        self.addCleanup(setattr, CeleryCm.app.conf, 'TASK_STATUS_MAX_RESULT_BYTES', max_bytes)
+        result = CeleryCm.sample_task.apply(args=('x' * 20, 'y'))
+        status = self.manager.get_task_status(result.id)
+        self.assertNotIn('result', status)
+        self.assertEqual((status['result_location'], status['result_size']), ('backend', '23'))
+
+class TestTaskMetrics(EagerTaskTestCase):
+    tasks = (CeleryCm.sample_task,)
+
+    def setUp(self):
+        super().setUp()
+        self.metrics = CeleryCm.TaskMetrics(self.manager, buckets=(0.1, 1.0, 10.0))
+
+    def test_percentile_interpolates_within_bucket(self):
+        # 버킷 개수 [0~0.1: 50, 0.1~1: 40, 1~10: 10, 10 초과: 0]
+        counts = [50, 40, 10, 0]
+        self.assertAlmostEqual(self.metrics.percentile(counts, 0.5), 0.1)
+        self.assertAlmostEqual(self.metrics.percentile(counts, 0.25), 0.05)
+        self.assertAlmostEqual(self.metrics.percentile(counts, 0.7), 0.1 + 0.9 * 20 / 40)
+        self.assertAlmostEqual(self.metrics.percentile(counts, 0.95), 1.0 + 9.0 * 5 / 10)
+        self.assertEqual(self.metrics.percentile([0, 0, 0, 3], 0.5), 10.0)   # 마지막 경계 초과분
+        self.assertIsNone(self.metrics.percentile([0, 0, 0, 0], 0.5))
+
+    def test_summary_aggregates_recorded_tasks(self):
+        for run_time in (0.05, 0.05, 0.5, 5.0):
+            self.metrics.record('t', 'SUCCESS', run_time, 0.01)
+        self.metrics.record('t', 'FAILURE', 0.5)
+        summary = self.metrics.summary('t', window=60)
+        self.assertEqual(summary['counts'], {'success': 4, 'failure': 1})
+        self.assertGreater(summary['throughput'], 0)
+        self.assertEqual(summary['run']['count'], 5)
+        self.assertAlmostEqual(summary['run']['mean'], 6.1 / 5)
+        self.assertAlmostEqual(summary['run']['p50'], 0.1 + 0.9 * 0.5 / 2)
+        self.assertEqual(summary['wait']['count'], 4)
+        self.assertEqual(self.metrics.names(), ['t'])
+
+    def test_signals_record_eager_task_runs(self):
+        CeleryCm.sample_task.apply(args=(1, 2))
+        CeleryCm.sample_task.apply(args=(2, 2))
+        summary = CeleryCm.TaskMonitor(self.manager).task_metrics()[CeleryCm.sample_task.name]
+        self.assertEqual(summary['counts'], {'success': 2})
+        self.assertEqual(summary['run']['count'], 2)
+        self.assertEqual(summary['wait']['count'], 0)     # 브로커를 거치지 않아 발행 시각 없음
+
+# 재시도 테스트용 작업 : fail_times 번 실패 후 성공
+flaky_calls = []
+
+@CeleryCm.app.task(base=CeleryCm.BaseTask, bind=True, name='test_CeleryTest.flaky')
+@CeleryCm.retry_with_backoff(max_retries=2, base_delay=1, jitter=False, dont_retry_for=(KeyError,))
+def flaky(self, fail_times: int, exc_type: str = 'ValueError'):
+    flaky_calls.append(self.request.retries)
+    if len(flaky_calls) <= fail_times:
+        raise {'ValueError': ValueError, 'KeyError': KeyError}[exc_type]('boom')
+    return len(flaky_calls)
+
+class TestRetryWithBackoff(EagerTaskTestCase):
+    tasks = (flaky,)
+
+    def setUp(self):
+        super().setUp()
+        flaky_calls.clear()
+
+    def test_retries_then_succeeds_without_stale_error(self):
+        with mock.patch.object(flaky, 'retry', wraps=flaky.retry) as retry:
+            result = flaky.apply(args=(2,))
+        self.assertEqual(flaky_calls, [0, 1, 2])
+        self.assertEqual([call.kwargs['countdown'] for call in retry.call_args_list], [1, 2])
+        status = self.manager.get_task_status(result.id)
+        self.assertEqual(status['status'], 'SUCCESS')
+        self.assertEqual(status['retries'], '2')
+        self.assertEqual(status['last_error'], 'boom')
+        self.assertNotIn('error', status)
+
+    def test_gives_up_after_max_retries(self):
+        result = flaky.apply(args=(5,))
+        self.assertEqual(flaky_calls, [0, 1, 2])
+        status = self.manager.get_task_status(result.id)
+        self.assertEqual(status['status'], 'FAILURE')
+        self.assertEqual(status['error'], 'boom')
+
+    def test_dont_retry_for_fails_immediately(self):
+        result = flaky.apply(args=(1, 'KeyError'))
+        self.assertEqual(flaky_calls, [0])
+        self.assertIsInstance(result.result, KeyError)
+        self.assertEqual(self.manager.get_task_status(result.id)['status'], 'FAILURE')
+
+# 배치 테스트용 작업 : 처리 함수는 테스트별로 batch_handler 를 교체
+def batch_handler(items):
+    return [item.args[0] * 2 for item in items]
+
+@CeleryCm.app.task(base=CeleryCm.BatchTask, bind=True, name='test_CeleryTest.batch_double', batch_size=3)
+def batch_double(self, items):
+    return batch_handler(items)
+
+class WorkerCrash(BaseException):
+    """처리 도중 워커 프로세스가 죽는 상황 (except Exception 으로 잡히지 않음)"""
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestBatchTask(unittest.TestCase):
+    def setUp(self):
+        self.manager = fake_redis_manager()
+        self.redis = self.manager.redis_client
+        self.backend = mock.Mock()
+        # flush 메시지는 발행하지 않고 기록만, flush() 는 테스트에서 직접 호출
+        self.published = mock.patch('celery.app.task.Task.apply_async').start()
+        mock.patch.object(batch_double, 'redis_manager', self.manager).start()
+        self.addCleanup(mock.patch.stopall)
+        batch_double.backend = self.backend
+        self.addCleanup(setattr, batch_double, 'backend', None)    # None 이면 app.backend 사용
+
+    def stored(self):
+        return {call.args[0]: (call.args[1], call.args[2]) for call in self.backend.store_result.call_args_list}
+
+    def test_flush_processes_one_batch_and_removes_items(self):
+        ids = [batch_double.delay(i).id for i in range(5)]
+        # 첫 항목은 batch_interval 후 flush 예약, batch_size 번째 항목은 즉시 flush
+        self.assertEqual([call.kwargs.get('countdown') for call in self.published.call_args_list],
+                         [batch_double.batch_interval, None])
+        self.assertEqual(batch_double.flush(), 3)
+        self.assertEqual(self.stored(), {task_id: (i * 2, 'SUCCESS') for i, task_id in enumerate(ids[:3])})
+        self.assertEqual(self.manager.get_task_status(ids[0])['status'], 'SUCCESS')
+        self.assertEqual(batch_double.flush(), 2)
+        self.assertEqual(batch_double.flush(), 0)
+        self.assertEqual(self.redis.keys('batch:*'), [])
+
+    def test_failed_run_marks_every_item_failed(self):
+        ids = [batch_double.delay(i).id for i in range(2)]
+        with mock.patch(f"{__name__}.batch_handler", side_effect=ValueError('bad batch')):
+            with self.assertRaises(ValueError):
+                batch_double.flush()
+        self.assertEqual({task_id: state for task_id, (_, state) in self.stored().items()},
+                         {task_id: 'FAILURE' for task_id in ids})
+        self.assertEqual(self.redis.keys('batch:*'), [])
+
+    def test_items_survive_worker_crash(self):
+        ids = [batch_double.delay(i).id for i in range(4)]
+        with mock.patch(f"{__name__}.batch_handler", side_effect=WorkerCrash):
+            with self.assertRaises(WorkerCrash):
+                batch_double.flush()
+        self.assertEqual(self.redis.llen(batch_double.batch_key), 1)
+        self.assertEqual(batch_double.recover(), 0)        # visibility timeout 전에는 되돌리지 않음
+        self.published.reset_mock()
+        with mock.patch.object(batch_double, 'batch_visibility_timeout', 0):
+            self.assertEqual(batch_double.flush(), 3)      # 장애 항목을 버퍼 앞으로 되돌린 뒤 처리
+        self.assertEqual(self.published.call_count, 1)     # 되돌린 항목용 flush 예약
+        self.assertEqual(batch_double.flush(), 1)
+        self.assertEqual(self.stored(), {task_id: (i * 2, 'SUCCESS') for i, task_id in enumerate(ids)})
+        self.assertEqual(self.redis.keys('batch:*'), [])
+
+    def test_rejects_publish_options(self):
+        for options in ({'countdown': 5}, {'queue': 'slow'}):
+            with self.assertRaises(ValueError):
+                batch_double.apply_async((1,), **options)
+        self.assertEqual(self.redis.llen(batch_double.batch_key), 0)
+
+class TestChunkedDataFrame(EagerTaskTestCase):
+    tasks = (CeleryCm.dataframe_aggregate_chunk, CeleryCm.dataframe_combine_aggregates,
+             CeleryCm.dataframe_transform_chunk, CeleryCm.dataframe_transform_with_stats,
+             CeleryCm.dataframe_collect, CeleryCm.dataframe_cleanup)
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({'city': rng.choice(['a', 'b', 'c'], 5000), 'x': rng.random(5000) * 100})
+        self.df.loc[::7, 'x'] = np.nan
+        self.work_dir = tempfile.mkdtemp()
+        self.chunked = ChunkedDataFrame(self.work_dir, chunk_rows=1234, chunk_bytes=20000)
+
+    def job_dirs(self):
+        return sorted(name.split('-')[0] for name in os.listdir(self.work_dir))
+
+    def test_group_matches_pandas_and_removes_input_chunks(self):
+        agg = {'x': ['sum', 'count', 'min', 'max', 'mean', 'std']}
+        result = pd.read_parquet(self.chunked.group(self.df, 'city', agg).get())
+        expected = self.df.groupby('city').agg(agg)
+        expected.columns = [f"{col}_{func}" for col, func in expected.columns]
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+        self.assertEqual(self.job_dirs(), ['group'])
+        self.assertEqual(os.listdir(os.path.dirname(self.chunked.group(self.df, 'city', agg).get())),
+                         ['result.parquet'])
+
+    def test_transform_matches_pandas_for_csv_and_dataframe(self):
+        path = os.path.join(tempfile.mkdtemp(), 'data.csv')
+        self.df.to_csv(path, index=False)
+        for data in (path, self.df):
+            for operation in ('log_transform', 'standardize', 'normalize'):
+                paths = self.chunked.transform(data, ['x'], operation).get()
+                result = pd.concat([pd.read_parquet(p) for p in paths], ignore_index=True)
+                expected = self.chunked.pandas.data_transformation_d(self.df, ['x'], operation)
+                pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+        self.assertEqual(self.job_dirs(), ['transform'] * 6)     # 분할 입력과 통계 파일은 남지 않음
+        self.assertTrue(os.path.exists(path))                   # 원본 CSV 는 삭제하지 않음
+
+    def test_rejects_unsupported_operation(self):
+        with self.assertRaises(ValueError):
+            self.chunked.transform(self.df, ['x'], 'binning')
+        with self.assertRaises(ValueError):
+            self.chunked.group(self.df, 'city', {'x': ['median']})
+
+
+class TestTaskDedup(EagerTaskTestCase):
+    tasks = (CeleryCm.sample_task,)
+
+    def test_claim_states(self):
+        fingerprint = RedisManager.task_fingerprint('t', (1,), {})
+        self.assertEqual(self.manager.claim_task(fingerprint, 'a', 't', 60), ('miss', 'a'))
+        self.assertEqual(self.manager.claim_task(fingerprint, 'a', 't', 60), ('own', 'a'))
+        self.assertEqual(self.manager.claim_task(fingerprint, 'b', 't', 60), ('coalesced', 'a'))
+        self.assertEqual(self.manager.claim_task(fingerprint, 'b', 't', 60, 'rejected'), ('rejected', 'a'))
+        self.manager.finish_task(fingerprint, 'b', 60)      # 선점하지 않은 작업의 완료는 무시
+        self.assertEqual(self.manager.claim_task(fingerprint, 'c', 't', 60), ('coalesced', 'a'))
+        self.manager.finish_task(fingerprint, 'a', 60)
+        self.assertEqual(self.manager.claim_task(fingerprint, 'c', 't', 60), ('hit', 'a'))
+        self.manager.finish_task(fingerprint, 'a', 0)      # 결과 보관 중이 아니므로 그대로 유지
+        self.assertEqual(self.manager.claim_task(fingerprint, 'c', 't', 60), ('hit', 'a'))
+        stats = self.manager.redis_client.hgetall(RedisManager.DEDUP_STATS)
+        self.assertEqual({k.decode(): int(v) for k, v in stats.items()},
+                         {'t|miss': 1, 't|coalesced': 2, 't|rejected': 1, 't|hit': 2})
+
+    def test_completed_call_returns_existing_result(self):
+        first = CeleryCm.sample_task.delay(1, 2)
+        self.assertEqual(first.get(), 3)
+        self.assertEqual(CeleryCm.sample_task.delay(1, 2).id, first.id)
+        self.assertNotEqual(CeleryCm.sample_task.delay(2, 2).id, first.id)
+
+    def test_reject_raises_with_running_task_id(self):
+        fingerprint = RedisManager.task_fingerprint(CeleryCm.sample_task.name, (1, 2), {})
+        self.manager.claim_task(fingerprint, 'running', CeleryCm.sample_task.name, 60)
+        with mock.patch.object(CeleryCm.sample_task, 'dedup', 'reject'):
+            with self.assertRaises(CeleryCm.DuplicateTaskError) as ctx:
+                CeleryCm.sample_task.delay(1, 2)
+        self.assertEqual(ctx.exception.task_id, 'running')
+
+    def test_publish_failure_releases_claim(self):
+        with mock.patch('celery.app.task.Task.apply_async', side_effect=ConnectionError('broker down')):
+            with self.assertRaises(ConnectionError):
+                CeleryCm.sample_task.delay(1, 2)
+        fingerprint = RedisManager.task_fingerprint(CeleryCm.sample_task.name, (1, 2), {})
+        self.assertIsNone(self.manager.redis_client.get(fingerprint))
+        self.assertEqual(CeleryCm.sample_task.delay(1, 2).get(), 3)
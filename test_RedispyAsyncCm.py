@@ -0,0 +1,138 @@
+import unittest
+import asyncio
+import time
+from common.RedispyCm import RedisCache, RedisConfig, RedisDataManager, RedisLock
+from common.RedispyAsyncCm import (AsyncRedisCache, AsyncRedisLock, AsyncRedisQueue, AsyncRedisRateLimiter,
+                                   AsyncRedisDataManager)
+
+# Redis 서버가 필요한 동작 테스트는 fakeredis(Lua 지원) 로 실행
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class AsyncRedisTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # 동기/비동기 클라이언트가 같은 서버(키 공간)를 공유
+        self.server = fakeredis.FakeServer()
+        self.client = fakeredis.FakeAsyncRedis(server=self.server)
+        self.sync_client = fakeredis.FakeRedis(server=self.server)
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+class TestAsyncRedisCache(AsyncRedisTestCase):
+    async def test_concurrent_misses_compute_once(self):
+        cache = AsyncRedisCache(RedisConfig(), self.client)
+        calls = []
+
+        @cache.cached(timeout=60)
+        async def slow_square(x):
+            calls.append(x)
+            await asyncio.sleep(0.1)
+            return x * x
+
+        self.assertEqual(await asyncio.gather(*(slow_square(3) for _ in range(5))), [9] * 5)
+        self.assertEqual(calls, [3])
+        await slow_square.invalidate(3)
+        self.assertEqual(await slow_square(3), 9)
+        self.assertEqual(calls, [3, 3])
+
+    async def test_sync_and_async_caches_share_entries(self):
+        calls = []
+
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        sync_cache = RedisCache(RedisConfig(), self.sync_client)
+        self.addCleanup(sync_cache.close)
+        async_square = AsyncRedisCache(RedisConfig(), self.client).cached(timeout=60)(square)
+        sync_square = sync_cache.cached(timeout=60)(square)
+        self.assertEqual(await async_square(4), 16)
+        self.assertEqual(sync_square(4), 16)    # 같은 키/항목 포맷 : 비동기 쪽이 저장한 값을 그대로 사용
+        self.assertEqual(calls, [4])
+
+    async def test_stale_value_served_while_revalidating(self):
+        cache = AsyncRedisCache(RedisConfig(), self.client)
+        values = {'x': 1}
+
+        @cache.cached(timeout=1, stale_ttl=30, early_refresh_beta=0)
+        def read(key):
+            return values[key]
+
+        self.assertEqual(await read('x'), 1)
+        values['x'] = 2
+        await asyncio.sleep(1.1)
+        self.assertEqual(await read('x'), 1)
+        await asyncio.gather(*cache._tasks)
+        self.assertEqual(await read('x'), 2)
+
+class TestAsyncRedisLock(AsyncRedisTestCase):
+    async def test_exclusive_with_fencing_tokens(self):
+        first = AsyncRedisLock(self.client, 'job', timeout=5)
+        second = AsyncRedisLock(self.client, 'job', timeout=5)
+        async with first.acquire_lock() as acquired:
+            self.assertTrue(acquired)
+            async with second.acquire_lock(blocking=False) as other:
+                self.assertFalse(other)
+            # 동기 락과 같은 키를 사용
+            with RedisLock(self.sync_client, 'job').acquire_lock(blocking=False) as sync_acquired:
+                self.assertFalse(sync_acquired)
+        async with second.acquire_lock(blocking=False) as acquired:
+            self.assertTrue(acquired)
+            self.assertEqual(second.fencing_token, first.fencing_token + 1)
+
+    async def test_waiter_wakes_on_release(self):
+        holder = AsyncRedisLock(self.client, 'job', timeout=30)
+        waiter = AsyncRedisLock(self.client, 'job', timeout=30)
+
+        async def release_soon():
+            await asyncio.sleep(0.1)
+            await holder.release_lock()
+
+        async with holder.acquire_lock():
+            start = time.monotonic()
+            release = asyncio.ensure_future(release_soon())
+            async with waiter.acquire_lock(blocking_timeout=5) as acquired:
+                self.assertTrue(acquired)
+            await release
+        self.assertLess(time.monotonic() - start, 2)    # TTL(30초) 만료가 아니라 해제 알림으로 획득
+
+class TestAsyncRedisQueue(AsyncRedisTestCase):
+    async def test_batch_ack_and_requeue(self):
+        crashed = AsyncRedisQueue(self.client, 'jobs', consumer_id='crashed', visibility_timeout=0)
+        await crashed.enqueue_many(['a', 'b', 'c'])
+        self.assertEqual([m.item for m in await crashed.dequeue_batch(2)], ['a', 'b'])
+        await asyncio.sleep(0.01)
+        worker = AsyncRedisQueue(self.client, 'jobs', consumer_id='worker')
+        self.assertEqual(await worker.requeue_expired(), 2)
+        messages = await worker.dequeue_batch(3)
+        self.assertEqual([m.item for m in messages], ['a', 'b', 'c'])
+        await worker.ack(*messages)
+        self.assertEqual(await worker.size(), 0)
+        self.assertEqual(await self.client.llen(worker.processing_name), 0)
+
+class TestAsyncRedisRateLimiter(AsyncRedisTestCase):
+    async def test_limit_and_check_many(self):
+        limiter = AsyncRedisRateLimiter(self.client, 'rl', limit=2, window=60, algorithm='token_bucket')
+        self.assertEqual([await limiter.is_allowed('a') for _ in range(3)], [True, True, False])
+        await self.client.script_flush()
+        self.assertEqual([r.allowed for r in await limiter.check_many(['a', 'b'])], [False, True])
+
+class TestAsyncRedisDataManager(AsyncRedisTestCase):
+    async def test_chunked_values_readable_by_sync_manager(self):
+        manager = AsyncRedisDataManager(self.client, batch_size=2, chunk_size=1000)
+        large = {'rows': list(range(3000))}
+        await manager.set_many({'big': large, 'small': 1, 'other': 2}, expire={'small': 30})
+        self.assertEqual(await manager.get_many(['big', 'small', 'missing']),
+                         {'big': large, 'small': 1, 'missing': None})
+        self.assertEqual(RedisDataManager(self.sync_client).get_data('big'), large)
+        self.assertEqual(len([chunk async for chunk in manager.iter_chunks('big')]),
+                         len([chunk for chunk in RedisDataManager(self.sync_client).iter_chunks('big')]))
+        self.assertEqual(await manager.delete_many(['big', 'small', 'other']), 3)
+        self.assertEqual(await self.client.keys(), [])
+
+if __name__ == '__main__':
+    unittest.main()
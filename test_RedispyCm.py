@@ -0,0 +1,752 @@
+import unittest
+import time
+import threading
+import redis
+import pickle
+from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from common.RedispyCm import (LocalCache, RedisSerializer, ConsistentHashRing, CacheKeyBuilder,
+                              RedisMetrics, RedisBloomFilter, RedisHyperLogLog, split_chunks, parse_chunk_manifest,
+                              RedisCache, RedisConfig, RedisDataManager, ShardedRedisClient, function_key_name,
+                              make_cache_entry, should_refresh, RATE_LIMIT_SCRIPTS, RedisRateLimiter,
+                              RedisQueue, RedisStreamQueue, RedisConnectionPool,
+                              InstrumentedConnectionPool, InstrumentedBlockingConnectionPool, RedisLock,
+                              RedisPubSub, PubSubDispatcher, CounterAggregator,
+                              _MISSING, _hash_pair)
+
+# Redis 서버가 필요한 동작 테스트는 fakeredis(Lua 지원) 로 실행
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+class TestLocalCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = LocalCache(max_size=2, policy='lru')
+        cache.set('a', 1, 10)
+        cache.set('b', 2, 10)
+        cache.get('a')          # b 가 가장 오래 사용되지 않은 항목이 됨
+        cache.set('c', 3, 10)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIs(cache.get('b'), _MISSING)
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_lfu_eviction(self):
+        cache = LocalCache(max_size=2, policy='lfu')
+        cache.set('a', 1, 10)
+        cache.get('a')
+        cache.get('a')
+        cache.set('b', 2, 10)
+        cache.set('c', 3, 10)   # 사용 빈도가 가장 낮은 b 퇴출
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIs(cache.get('b'), _MISSING)
+
+    def test_ttl_expiry(self):
+        cache = LocalCache(max_size=2)
+        cache.set('a', None, 0.01)
+        self.assertIsNone(cache.get('a'))
+        time.sleep(0.02)
+        self.assertIs(cache.get('a'), _MISSING)
+        self.assertEqual(len(cache), 0)
+
+class TestRedisSerializer(unittest.TestCase):
+    def test_round_trip_with_compression(self):
+        serializer = RedisSerializer('pickle', 'zlib', compression_threshold=10)
+        value = {'rows': list(range(100))}
+        data = serializer.dumps(value)
+        self.assertEqual(data[0], 0x11)    # pickle + zlib 헤더
+        self.assertEqual(serializer.loads(data), value)
+
+    def test_reads_legacy_pickle(self):
+        # 헤더 없이 저장된 기존 데이터도 읽을 수 있어야 함
+        self.assertEqual(RedisSerializer().loads(pickle.dumps([1, 2])), [1, 2])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            RedisSerializer('yaml')
+
+class TestConsistentHashRing(unittest.TestCase):
+    def test_hash_tag_routes_to_same_node(self):
+        ring = ConsistentHashRing(['node1', 'node2', 'node3'])
+        self.assertEqual(ring.get_node('user:{123}:profile'), ring.get_node('user:{123}:orders'))
+        self.assertEqual(ConsistentHashRing.hash_tag('a{}b'), 'a{}b')
+
+    def test_remove_node_moves_only_its_keys(self):
+        ring = ConsistentHashRing(['node1', 'node2', 'node3'])
+        before = {f'key{i}': ring.get_node(f'key{i}') for i in range(1000)}
+        ring.remove_node('node3')
+        for key, node in before.items():
+            if node != 'node3':
+                self.assertEqual(ring.get_node(key), node)
+
+class TestCacheKeyBuilder(unittest.TestCase):
+    def setUp(self):
+        self.builder = CacheKeyBuilder()
+
+    def test_distinguishes_values_with_same_str(self):
+        self.assertNotEqual(self.builder.build('m.f', (1,)), self.builder.build('m.f', ('1',)))
+        self.assertNotEqual(self.builder.build('m.f', ([1, [2]],)), self.builder.build('m.f', ([1, ['2']],)))
+
+    def test_order_independent_for_dicts_and_sets(self):
+        first = self.builder.build('m.f', ({'a': 1, 'b': {2, 3}},))
+        second = self.builder.build('m.f', ({'b': {3, 2}, 'a': 1},))
+        self.assertEqual(first, second)
+
+    def test_readable_prefix(self):
+        self.assertTrue(self.builder.build('module.func', (1,)).startswith('cache:module.func:'))
+
+class TestRedisMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = RedisMetrics()
+
+    def test_cache_hit_ratio(self):
+        for result in ('l1_hit', 'hit', 'hit', 'miss'):
+            self.metrics.inc('redis_cache_requests_total', {'function': 'm.f', 'result': result})
+        self.assertEqual(self.metrics.cache_stats()['m.f']['hit_ratio'], 0.75)
+
+    def test_prometheus_histogram_is_cumulative(self):
+        self.metrics.observe('redis_lock_wait_seconds', 0.002, {'lock': 'job'})
+        self.metrics.observe('redis_lock_wait_seconds', 3, {'lock': 'job'})
+        text = self.metrics.to_prometheus(include_pools=False)
+        self.assertIn('# TYPE redis_lock_wait_seconds histogram', text)
+        self.assertIn('redis_lock_wait_seconds_bucket{lock="job",le="0.0025"} 1', text)
+        self.assertIn('redis_lock_wait_seconds_bucket{lock="job",le="+Inf"} 2', text)
+        self.assertIn('redis_lock_wait_seconds_count{lock="job"} 2', text)
+
+    def test_disabled(self):
+        self.metrics.enabled = False
+        self.metrics.inc('redis_rate_limit_total')
+        self.assertEqual(self.metrics.snapshot()['counters'], {})
+
+class TestBloomFilterSizing(unittest.TestCase):
+    def test_optimal_size(self):
+        size, hash_count = RedisBloomFilter.optimal_size(1_000_000, 0.01)
+        self.assertEqual(size, 9585059)     # 약 1.14MB
+        self.assertEqual(hash_count, 7)
+
+    def test_rejects_size_over_redis_limit(self):
+        with self.assertRaises(ValueError):
+            RedisBloomFilter.optimal_size(10 ** 10, 0.001)
+
+class TestItemHashing(unittest.TestCase):
+    # 비트/카운터 위치는 프로세스와 설치 패키지(xxhash)에 무관해야 여러 워커가 같은 필터를 공유 가능
+    ITEM = {'tags': {'a', 'b'}, 'id': (1, 2.5)}
+
+    def test_positions_pinned(self):
+        self.assertEqual(_hash_pair(1), (12336428237079420942, 6382445286800576319))
+        self.assertEqual(_hash_pair(self.ITEM), (11612060316476004228, 11826259708396862763))
+        self.assertNotEqual(_hash_pair(1), _hash_pair('1'))
+
+    def test_independent_of_xxhash(self):
+        expected = _hash_pair(self.ITEM)
+        with mock.patch('common.RedispyCm.xxhash', None):
+            self.assertEqual(_hash_pair(self.ITEM), expected)
+
+class TestChunkedStorage(unittest.TestCase):
+    def test_split_and_manifest(self):
+        payload = bytes(range(256)) * 10
+        manifest, chunks = split_chunks('key', payload, 1000)
+        info = parse_chunk_manifest(manifest)
+        self.assertEqual((info['n'], info['size']), (3, 2560))
+        self.assertEqual(b''.join(bytes(chunk) for _, chunk in chunks), payload)
+        self.assertTrue(chunks[0][0].startswith(f"key:chunk:{info['v']}:"))
+
+    def test_serialized_values_are_not_manifests(self):
+        self.assertIsNone(parse_chunk_manifest(RedisSerializer().dumps({'a': 1})))
+        self.assertIsNone(parse_chunk_manifest(pickle.dumps([1])))
+
+class TestRedisConnectionPool(unittest.TestCase):
+    def test_registry_shares_pools_per_connection_settings(self):
+        # 연결 풀은 지연 연결이므로 실제 접속 없음
+        pool = RedisConnectionPool(RedisConfig(db=3))
+        self.assertIs(RedisConnectionPool(RedisConfig(db=3, local_cache_size=10, serializer='orjson')), pool)
+        self.assertIsNot(RedisConnectionPool(RedisConfig(db=4)), pool)
+        self.assertIsInstance(RedisConnectionPool(RedisConfig(db=3, pool_timeout=1)).pool,
+                              InstrumentedBlockingConnectionPool)
+        self.assertEqual(RedisConnectionPool.all_stats()['localhost:6379/3']['binary']['max_connections'], 10)
+
+    @unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+    def test_telemetry_counts_checkouts_and_waits(self):
+        connection_class = getattr(fakeredis, 'FakeRedisConnection', None) or fakeredis.FakeConnection
+        pool = InstrumentedBlockingConnectionPool(connection_class=connection_class,
+                                                  server=fakeredis.FakeServer(), max_connections=1, timeout=2)
+        connection = pool.get_connection('PING')
+        self.assertEqual((pool.stats()['in_use'], pool.stats()['idle']), (1, 0))
+        threading.Timer(0.1, pool.release, (connection,)).start()
+        pool.release(pool.get_connection('PING'))      # 반환될 때까지 대기
+        stats = pool.stats()
+        self.assertEqual((stats['in_use'], stats['idle'], stats['created_total'], stats['checkouts']), (0, 1, 1, 2))
+        self.assertGreater(stats['checkout_wait_max_ms'], 50)
+
+        client = redis.Redis(connection_pool=InstrumentedConnectionPool(
+            connection_class=connection_class, server=fakeredis.FakeServer()))
+        for _ in range(3):
+            client.ping()
+        stats = client.connection_pool.stats()
+        self.assertEqual((stats['created_total'], stats['checkouts'], stats['in_use']), (1, 3, 0))
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestRedisCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = RedisCache(RedisConfig(), fakeredis.FakeRedis())
+        self.addCleanup(self.cache.close)
+
+    def test_invalidate_without_l1_notifies_other_processes(self):
+        # L1 을 쓰지 않는 쓰기 프로세스의 무효화도 다른 프로세스의 L1 에서 제거되어야 함
+        server = fakeredis.FakeServer()
+        reader = RedisCache(RedisConfig(local_cache_size=10), fakeredis.FakeRedis(server=server))
+        writer = RedisCache(RedisConfig(), fakeredis.FakeRedis(server=server))
+        self.addCleanup(reader.close)
+        self.addCleanup(writer.close)
+        values = {'x': 1}
+
+        @reader.cached(timeout=60)
+        def read(key):
+            return values[key]
+
+        self.assertEqual(read('x'), 1)
+        values['x'] = 2
+        writer.invalidate(reader.cache_key(function_key_name(read.__wrapped__), 'x'))
+        deadline = time.monotonic() + 2
+        while len(reader.local_cache) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(read('x'), 2)
+
+    def test_miss_during_background_refresh(self):
+        # 만료 후 stale 값 반환과 함께 갱신이 진행 중일 때 무효화된 키의 미스 호출도 값을 반환해야 함
+        calls = []
+
+        @self.cache.cached(timeout=1, stale_ttl=30, early_refresh_beta=0)
+        def double(x):
+            calls.append(x)
+            if len(calls) > 1:
+                time.sleep(0.3)
+            return x * 2
+
+        self.assertEqual(double(1), 2)
+        time.sleep(1.1)
+        self.assertEqual(double(1), 2)      # stale 반환 + 백그라운드 갱신 시작
+        double.invalidate(1)
+        self.assertEqual(double(1), 2)
+
+    def test_concurrent_misses_compute_once(self):
+        # 같은 서버를 쓰는 두 프로세스(캐시 인스턴스) x 4 스레드 동시 미스 : 계산은 1회
+        server = fakeredis.FakeServer()
+        caches = [RedisCache(RedisConfig(), fakeredis.FakeRedis(server=server)) for _ in range(2)]
+        calls = []
+
+        def slow_square(x):
+            calls.append(x)
+            time.sleep(0.2)
+            return x * x
+
+        functions = []
+        for cache in caches:
+            self.addCleanup(cache.close)
+            functions.append(cache.cached(timeout=60)(slow_square))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: functions[i % 2](3), range(8)))
+        self.assertEqual(results, [9] * 8)
+        self.assertEqual(calls, [3])
+
+    def test_stale_value_served_while_revalidating(self):
+        values = {'x': 1}
+
+        @self.cache.cached(timeout=1, stale_ttl=30, early_refresh_beta=0)
+        def read(key):
+            time.sleep(0.2)
+            return values[key]
+
+        self.assertEqual(read('x'), 1)
+        values['x'] = 2
+        time.sleep(1.1)
+        start = time.monotonic()
+        self.assertEqual(read('x'), 1)      # 만료 후에는 기존 값을 바로 반환하고 백그라운드 갱신
+        self.assertLess(time.monotonic() - start, 0.1)
+        deadline = time.monotonic() + 2
+        while read('x') != 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(read('x'), 2)
+
+    def test_xfetch_early_refresh(self):
+        fresh = make_cache_entry('v', 0.01, 60)
+        self.assertFalse(should_refresh(fresh, 0))
+        self.assertTrue(should_refresh(make_cache_entry('v', 0.01, -1), 0))    # 논리 만료 후
+        slow = make_cache_entry('v', 10, 5)     # 계산 10초, 만료까지 5초 : 조기 갱신 확률이 높음
+        with mock.patch('random.random', return_value=0.5):
+            self.assertTrue(should_refresh(slow, 1.0))
+            self.assertFalse(should_refresh(fresh, 1.0))
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestRedisDataManagerBulk(unittest.TestCase):
+    def setUp(self):
+        self.client = fakeredis.FakeRedis()
+        self.manager = RedisDataManager(self.client, batch_size=2)
+
+    def test_set_get_delete_many_in_batches(self):
+        mapping = {f'k{i}': {'i': i} for i in range(5)}
+        with mock.patch.object(self.client, 'pipeline', wraps=self.client.pipeline) as pipeline:
+            self.manager.set_many(mapping, expire=60)
+        self.assertEqual(pipeline.call_count, 3)       # batch_size 2 : 2 + 2 + 1
+        with mock.patch.object(self.client, 'mget', wraps=self.client.mget) as mget:
+            result = self.manager.get_many(list(mapping) + ['missing'])
+        self.assertEqual(mget.call_count, 3)
+        self.assertEqual(result, {**mapping, 'missing': None})
+        self.assertTrue(0 < self.client.ttl('k0') <= 60)
+        self.assertEqual(self.manager.delete_many(['k0', 'k1', 'k2', 'missing']), 3)
+        self.assertEqual(sorted(self.client.keys()), [b'k3', b'k4'])
+        self.assertEqual(self.manager.delete_many([]), 0)
+
+    def test_per_key_expire_and_transaction(self):
+        self.manager.set_many({'a': 1, 'b': 2, 'c': 3}, expire={'a': 30}, transaction=True)
+        self.assertTrue(0 < self.client.ttl('a') <= 30)
+        self.assertEqual(self.client.ttl('b'), -1)
+        self.assertEqual(self.manager.get_many(['a', 'b', 'c']), {'a': 1, 'b': 2, 'c': 3})
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestRedisRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.client = fakeredis.FakeRedis()
+
+    def test_each_algorithm_enforces_limit(self):
+        for algorithm in RATE_LIMIT_SCRIPTS:
+            limiter = RedisRateLimiter(self.client, f"rl:{algorithm}", limit=3, window=60, algorithm=algorithm)
+            results = [limiter.check('user1') for _ in range(4)]
+            self.assertEqual([r.allowed for r in results], [True, True, True, False], algorithm)
+            self.assertEqual([r.remaining for r in results], [2, 1, 0, 0], algorithm)
+            self.assertTrue(0 < results[-1].reset_after <= 60, algorithm)
+            self.assertTrue(limiter.is_allowed('user2'), algorithm)     # 식별자별 독립
+
+    def test_sliding_log_and_token_bucket_recover_over_time(self):
+        log = RedisRateLimiter(self.client, 'rl:log', limit=2, window=1, algorithm='sliding_window_log')
+        bucket = RedisRateLimiter(self.client, 'rl:bucket', limit=2, window=1, algorithm='token_bucket')
+        for limiter in (log, bucket):
+            self.assertEqual([limiter.is_allowed('u') for _ in range(3)], [True, True, False])
+        time.sleep(0.6)     # 토큰 버킷은 0.5초마다 1개 충전, 슬라이딩 로그는 윈도우 전체가 지나야 함
+        self.assertEqual([bucket.is_allowed('u') for _ in range(2)], [True, False])
+        self.assertFalse(log.is_allowed('u'))
+        time.sleep(0.5)
+        self.assertTrue(log.is_allowed('u'))
+
+    def test_check_many_reloads_flushed_scripts(self):
+        limiter = RedisRateLimiter(self.client, 'rl:many', limit=1, window=60)
+        self.assertTrue(limiter.check('a').allowed)
+        self.client.script_flush()
+        results = limiter.check_many(['a', 'b', 'b'])
+        self.assertEqual([r.allowed for r in results], [False, True, False])
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            RedisRateLimiter(self.client, 'rl', 1, 1, algorithm='leaky')
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestRedisQueue(unittest.TestCase):
+    def setUp(self):
+        self.client = fakeredis.FakeRedis()
+
+    def queue(self, consumer_id: str, visibility_timeout: int = 30) -> RedisQueue:
+        return RedisQueue(self.client, 'jobs', consumer_id=consumer_id,
+                          visibility_timeout=visibility_timeout, batch_size=2)
+
+    def test_batch_dequeue_and_ack(self):
+        queue = self.queue('c1')
+        queue.enqueue_many([{'n': i} for i in range(5)])
+        self.assertEqual(queue.size(), 5)
+        messages = queue.dequeue_batch(3)
+        self.assertEqual([m.item for m in messages], [{'n': 0}, {'n': 1}, {'n': 2}])
+        self.assertEqual(queue.size(), 2)
+        queue.ack(*messages[:2])
+        self.assertEqual(self.client.llen(queue.processing_name), 1)
+        self.assertEqual(queue.requeue_expired(), 0)     # 처리 기한 전
+        self.assertEqual(queue.dequeue(), {'n': 3})
+
+    def test_unacked_items_are_requeued_after_visibility_timeout(self):
+        crashed = self.queue('crashed', visibility_timeout=0)
+        crashed.enqueue_many(['a', 'b', 'c'])
+        self.assertEqual([m.item for m in crashed.dequeue_batch(2)], ['a', 'b'])
+        time.sleep(0.01)
+        other = self.queue('other')
+        self.assertEqual(other.requeue_expired(), 2)
+        self.assertEqual([m.item for m in other.dequeue_batch(3)], ['a', 'b', 'c'])     # 원래 순서로 앞쪽에 복귀
+        self.assertEqual(self.client.llen(crashed.processing_name), 0)
+
+    def test_empty_queue_returns_after_timeout(self):
+        self.assertEqual(self.queue('c1').dequeue_batch(5, timeout=1), [])
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestRedisStreamQueue(unittest.TestCase):
+    def setUp(self):
+        self.client = fakeredis.FakeRedis()
+
+    def queue(self, consumer_id: str, **kwargs) -> RedisStreamQueue:
+        return RedisStreamQueue(self.client, 'events', consumer_id=consumer_id, **kwargs)
+
+    def test_consumer_group_delivery_and_ack(self):
+        first, second = self.queue('c1'), self.queue('c2')
+        first.enqueue_many(list(range(4)))
+        a = first.dequeue_batch(2)
+        b = second.dequeue_batch(5)
+        self.assertEqual([m.item for m in a + b], [0, 1, 2, 3])    # 그룹 내 컨슈머끼리 나눠 받음
+        first.ack(*a)
+        self.assertEqual(first.pending()['pending'], 2)
+        self.assertEqual(first.lag()['default']['pending'], 2)
+        self.assertEqual(first.size(), 4)
+        self.assertEqual([m.item for m in first.replay()], [0, 1, 2, 3])
+
+    def test_claim_stuck_messages(self):
+        crashed = self.queue('crashed')
+        crashed.enqueue('job')
+        self.assertEqual(crashed.dequeue_batch(1)[0].item, 'job')
+        self.assertEqual(self.queue('c2', visibility_timeout=60).claim_stuck(), [])
+        claimed = self.queue('c2', visibility_timeout=0).claim_stuck()
+        self.assertEqual([m.item for m in claimed], ['job'])
+        self.queue('c2').ack(*claimed)
+        self.assertEqual(crashed.pending()['pending'], 0)
+
+    def test_dequeue_without_ack(self):
+        queue = self.queue('c1')
+        queue.enqueue_many(['a', 'b'])
+        self.assertEqual(queue.dequeue(timeout=None), 'a')
+        self.assertEqual(queue.pending()['pending'], 0)      # NOACK 은 PEL 에 남지 않음
+        other = self.queue('c2', group='audit')              # 다른 그룹은 처음부터 다시 수신
+        self.assertEqual([m.item for m in other.dequeue_batch(5, timeout=None)], ['a', 'b'])
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestCacheInvalidation(unittest.TestCase):
+    def setUp(self):
+        self.server = fakeredis.FakeServer()
+        self.client = fakeredis.FakeRedis(server=self.server)
+        self.cache = RedisCache(RedisConfig(), self.client)
+        self.addCleanup(self.cache.close)
+        self.calls = []
+
+    def test_invalidate_tags(self):
+        @self.cache.cached(timeout=60, tags=lambda user_id: [f'user:{user_id}'])
+        def profile(user_id):
+            self.calls.append(('profile', user_id))
+            return {'id': user_id}
+
+        @self.cache.cached(timeout=60, tags=['users'])
+        def user_count():
+            self.calls.append(('count',))
+            return 2
+
+        profile(1), profile(2), user_count()
+        self.assertEqual(self.cache.invalidate_tags('user:1'), 1)
+        self.assertFalse(self.client.exists(RedisCache.tag_key('user:1')))
+        profile(1), profile(2), user_count()
+        self.assertEqual(self.calls, [('profile', 1), ('profile', 2), ('count',), ('profile', 1)])
+        self.assertTrue(0 < self.client.ttl(RedisCache.tag_key('users')) <= 60)
+        self.assertEqual(self.cache.invalidate_tags('user:2', 'users', 'unknown'), 2)
+
+    def test_invalidate_namespace_reaches_other_l1_caches(self):
+        reader = RedisCache(RedisConfig(local_cache_size=10), fakeredis.FakeRedis(server=self.server))
+        self.addCleanup(reader.close)
+
+        def load(key):
+            self.calls.append(key)
+            return len(self.calls)
+
+        read = reader.cached(timeout=60, namespace='tenant:1')(load)
+        other = reader.cached(timeout=60, namespace='tenant:2')(load)
+        self.assertEqual((read('a'), read('a'), other('a')), (1, 1, 2))
+        self.assertEqual(self.cache.invalidate_namespace('tenant:1'), 1)
+        deadline = time.monotonic() + 2
+        while reader._ns_versions.get('tenant:1', 0) < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual((read('a'), other('a')), (3, 2))     # 다른 네임스페이스는 유지
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestRedisLock(unittest.TestCase):
+    def setUp(self):
+        self.client = fakeredis.FakeRedis()
+
+    def test_exclusive_with_increasing_fencing_tokens(self):
+        first, second = RedisLock(self.client, 'job'), RedisLock(self.client, 'job')
+        with first.acquire_lock() as acquired:
+            self.assertTrue(acquired)
+            with second.acquire_lock(blocking_timeout=0.1) as other:
+                self.assertFalse(other)
+        with second.acquire_lock(blocking=False) as acquired:
+            self.assertTrue(acquired)
+            self.assertEqual(second.fencing_token, first.fencing_token + 1)
+
+    def test_expired_holder_cannot_release_new_owner(self):
+        stale, owner = RedisLock(self.client, 'job', timeout=0.1), RedisLock(self.client, 'job')
+        with stale.acquire_lock():
+            time.sleep(0.15)
+            with owner.acquire_lock(blocking=False) as acquired:
+                self.assertTrue(acquired)
+                self.assertFalse(stale.release_lock())
+                self.assertFalse(stale.extend())
+                self.assertTrue(self.client.exists(owner.lock_name))
+                self.assertGreater(owner.fencing_token, stale.fencing_token)
+
+    def test_waiter_wakes_on_release_notification(self):
+        holder, waiter = RedisLock(self.client, 'job', timeout=30), RedisLock(self.client, 'job', timeout=30)
+        with holder.acquire_lock():
+            threading.Timer(0.1, holder.release_lock).start()
+            start = time.monotonic()
+            with waiter.acquire_lock(blocking_timeout=5) as acquired:
+                self.assertTrue(acquired)
+        self.assertLess(time.monotonic() - start, 2)    # TTL(30초) 만료가 아니라 해제 알림으로 획득
+        self.assertTrue(RedisLock(self.client, 'job').wait_released(timeout=0.1))
+
+    def test_auto_renew_keeps_lock_past_timeout(self):
+        lock = RedisLock(self.client, 'job', timeout=0.3, auto_renew=True)
+        with lock.acquire_lock():
+            time.sleep(0.6)
+            self.assertTrue(self.client.exists(lock.lock_name))
+        self.assertFalse(self.client.exists(lock.lock_name))
+
+def wait_until(condition: Callable[[], bool], timeout: float = 2) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestPubSubDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.client = fakeredis.FakeRedis()
+        self.publisher = RedisPubSub(self.client)
+
+    def dispatcher(self, **kwargs) -> PubSubDispatcher:
+        dispatcher = self.publisher.dispatcher(**kwargs)
+        self.addCleanup(dispatcher.stop, 2)
+        return dispatcher
+
+    def test_messages_delivered_in_order_per_subscription(self):
+        dispatcher = self.dispatcher(workers=2)
+        received = {'a': [], 'b': []}
+        dispatcher.subscribe('a', received['a'].append)
+        dispatcher.subscribe('b', lambda message: received['b'].append(1 / message))   # 0 이면 콜백 예외
+        dispatcher.start()
+        for i in range(20):
+            self.publisher.publish('a', i)
+        for value in (1, 0, 2):
+            self.publisher.publish('b', value)
+        self.assertTrue(wait_until(lambda: len(received['a']) == 20 and len(received['b']) == 2))
+        self.assertEqual(received['a'], list(range(20)))
+        self.assertEqual(received['b'], [1.0, 0.5])     # 실패한 콜백 이후에도 워커 계속 동작
+        self.assertEqual(dispatcher.stats()['dispatched'], 23)
+
+    def test_batches_and_patterns(self):
+        dispatcher = self.dispatcher()
+        batches, matched = [], []
+        dispatcher.subscribe('events', batches.append, batch_size=5, batch_interval=0.2)
+        dispatcher.psubscribe('user:*', lambda channel, message: matched.append((channel, message)))
+        dispatcher.start()
+        for i in range(12):
+            self.publisher.publish('events', i)
+        self.publisher.publish('user:7', 'login')
+        self.assertTrue(wait_until(lambda: sum(map(len, batches)) == 12 and matched))
+        self.assertEqual([len(batch) for batch in batches], [5, 5, 2])      # 남은 2건은 batch_interval 후 전달
+        self.assertEqual(sum(batches, []), list(range(12)))
+        self.assertEqual(matched, [('user:7', 'login')])
+
+    def test_drop_newest_when_worker_queue_is_full(self):
+        dispatcher = self.dispatcher(workers=1, queue_size=2, overflow='drop_newest')
+        release, received = threading.Event(), []
+        dispatcher.subscribe('slow', lambda message: (release.wait(2), received.append(message)))
+        dispatcher.start()
+        for i in range(10):
+            self.publisher.publish('slow', i)
+        self.assertTrue(wait_until(lambda: dispatcher.stats()['dispatched'] + dispatcher.stats()['dropped'] == 10))
+        release.set()
+        self.assertTrue(wait_until(lambda: len(received) == dispatcher.stats()['dispatched']))
+        self.assertEqual(received, list(range(len(received))))      # 앞쪽 메시지만 처리, 이후 메시지는 버림
+        self.assertLessEqual(len(received), 3)      # 처리 중 1건 + 큐 2건
+
+    def test_unknown_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            PubSubDispatcher(self.client, overflow='drop_all')
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestCounterAggregator(unittest.TestCase):
+    def setUp(self):
+        self.client = fakeredis.FakeRedis()
+        self.manager = RedisDataManager(self.client)
+
+    def aggregator(self, **kwargs) -> CounterAggregator:
+        aggregator = self.manager.counter_aggregator(**{'flush_interval': 60, **kwargs})
+        self.addCleanup(aggregator.close)
+        return aggregator
+
+    def test_sums_increments_into_one_command_per_key(self):
+        aggregator = self.aggregator()
+        for i in range(1000):
+            aggregator.increment(f'hits:{i % 3}', 2)
+        self.assertEqual(self.client.keys(), [])
+        self.assertEqual(aggregator.flush(), 3)
+        self.assertEqual([int(self.client.get(f'hits:{i}')) for i in range(3)], [668, 666, 666])
+        self.assertEqual(aggregator.stats(), {'increments': 1000, 'commands': 3, 'commands_saved': 997,
+                                              'pending_keys': 0})
+
+    def test_flushes_on_max_keys_interval_and_close(self):
+        aggregator = self.aggregator(max_keys=2)
+        aggregator.increment('a')
+        aggregator.increment('b')       # 키 수가 max_keys 에 도달하면 즉시 전송
+        self.assertEqual(self.client.mget('a', 'b'), [b'1', b'1'])
+        periodic = self.aggregator(flush_interval=0.05)
+        periodic.increment('c', 5)
+        self.assertTrue(wait_until(lambda: self.client.get('c') == b'5'))
+        with self.manager.counter_aggregator(flush_interval=60) as scoped:
+            scoped.increment('d', 7)
+        self.assertEqual(self.client.get('d'), b'7')
+
+    def test_failed_flush_keeps_counts_for_retry(self):
+        aggregator = self.aggregator()
+        aggregator.increment('a', 3)
+        with mock.patch.object(self.client, 'pipeline', side_effect=redis.ConnectionError('down')):
+            self.assertEqual(aggregator.flush(), 0)
+        aggregator.increment('a', 1)
+        self.assertEqual(aggregator.flush(), 1)
+        self.assertEqual(self.client.get('a'), b'4')
+
+    def test_sampling_preserves_expected_total(self):
+        aggregator = self.aggregator(sample_rate=0.1)
+        for _ in range(10000):
+            aggregator.increment('events')
+        aggregator.flush()
+        self.assertAlmostEqual(int(self.client.get('events')), 10000, delta=1500)
+        with self.assertRaises(ValueError):
+            self.manager.counter_aggregator(sample_rate=0)
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestRedisBloomFilter(unittest.TestCase):
+    def setUp(self):
+        self.manager = RedisDataManager(fakeredis.FakeRedis(), batch_size=100)
+
+    def test_add_and_contains_batched(self):
+        bloom = self.manager.bloom_filter('bloom', capacity=1000)
+        self.assertEqual(bloom.add_many(['a', 'b', 1]), [True, True, True])
+        self.assertEqual(bloom.add_many(['a', 'c']), [False, True])
+        self.assertFalse(bloom.add(1))
+        self.assertEqual(bloom.contains_many(['a', 'b', 'c', 1]), [True] * 4)
+        self.assertNotIn('1', bloom)
+        bloom.clear()
+        self.assertFalse(bloom.contains('a'))
+
+    def test_false_positive_rate_within_bound(self):
+        bloom = self.manager.bloom_filter('bloom', capacity=2000, error_rate=0.01)
+        added = [f"member:{i}" for i in range(2000)]
+        # 추가 도중에도 이미 있는 것으로 판정(거짓 양성)될 수 있음
+        self.assertLess(bloom.add_many(added).count(False) / 2000, 0.02)
+        self.assertTrue(all(bloom.contains_many(added)))     # 거짓 음성 없음
+        false_positives = sum(bloom.contains_many([f"other:{i}" for i in range(5000)]))
+        self.assertLess(false_positives / 5000, 0.02)
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestRedisHyperLogLog(unittest.TestCase):
+    def setUp(self):
+        self.manager = RedisDataManager(fakeredis.FakeRedis(), batch_size=100)
+
+    def test_count_and_merge(self):
+        first, second = self.manager.hyperloglog('hll:1'), self.manager.hyperloglog('hll:2')
+        self.assertFalse(first.add_many([]))
+        self.assertTrue(first.add_many(range(1000)))
+        self.assertFalse(first.add(1, 2))
+        second.add_many(range(500, 1500))
+        self.assertAlmostEqual(first.count(), 1000, delta=1000 * 3 * RedisHyperLogLog.ERROR_RATE)
+        self.assertAlmostEqual(first.count('hll:2'), 1500, delta=1500 * 3 * RedisHyperLogLog.ERROR_RATE)
+        union = self.manager.hyperloglog('hll:union')
+        union.merge('hll:1', 'hll:2')
+        self.assertEqual(union.count(), first.count('hll:2'))
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestCountMinSketch(unittest.TestCase):
+    def setUp(self):
+        self.manager = RedisDataManager(fakeredis.FakeRedis())
+
+    def test_estimates_never_undercount(self):
+        sketch = self.manager.count_min_sketch('cms', error_rate=0.01, confidence=0.99)
+        self.assertEqual(sketch.estimate('item:0'), 0)
+        counts = {f"item:{i}": i % 7 + 1 for i in range(2000)}
+        sketch.increment_many(counts)
+        # increment 응답은 증가 시점의 추정값 : 이후 항목의 충돌을 반영한 최종값은 estimate 로 조회
+        estimates = sketch.estimate_many(list(counts))
+        total = sum(counts.values())
+        for item, count in counts.items():
+            self.assertGreaterEqual(estimates[item], count)
+        # confidence 확률로 오차는 error_rate * 전체 합 이하
+        within = sum(estimates[item] - count <= 0.01 * total for item, count in counts.items())
+        self.assertGreaterEqual(within / len(counts), 0.99)
+        self.assertEqual(sketch.increment('item:0', 10), estimates['item:0'] + 10)
+
+    def test_top_keeps_heaviest_items_by_type(self):
+        sketch = self.manager.count_min_sketch('cms', top_k=2)
+        sketch.increment_many([1] * 5 + ['1'] * 3 + [(2, 'b')] * 4 + ['rare'])
+        # 1 과 '1' 은 다른 항목, 원본 타입 그대로 반환
+        self.assertEqual(sketch.top(), [(1, 5), ((2, 'b'), 4)])
+        self.assertEqual(sketch.top(1), [(1, 5)])
+        self.assertEqual(sketch.top(0), [])
+        # 탈락한 항목의 원본은 남지 않음
+        self.assertEqual(self.manager.redis_client.hlen(sketch.topk_items_key), 2)
+        sketch.clear()
+        self.assertEqual(self.manager.redis_client.keys(), [])
+
+    def test_top_disabled(self):
+        sketch = self.manager.count_min_sketch('cms')
+        sketch.increment_many(['a', 'b'])
+        self.assertEqual(self.manager.redis_client.keys(), [b'cms'])
+        # 같은 키를 top_k 로 유지하는 다른 인스턴스가 있어도 top_k=0 이면 빈 목록
+        self.manager.count_min_sketch('cms', top_k=2).increment('a')
+        self.assertEqual(sketch.top(), [])
+
+def fake_sharded_client(shards: int = 3, servers: Optional[list] = None) -> ShardedRedisClient:
+    # 샤드별 fakeredis 서버로 교체 (연결 풀은 지연 연결이므로 실제 접속 없음)
+    # servers 를 넘기면 여러 클라이언트(프로세스)가 같은 샤드 서버를 공유
+    client = ShardedRedisClient([RedisConfig(port=6379 + i) for i in range(shards)], decode_responses=False)
+    for i, node in enumerate(client.clients):
+        client.clients[node] = fakeredis.FakeRedis(server=servers[i] if servers else None)
+    client.primary = next(iter(client.clients.values()))
+    return client
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestShardedChunkedData(unittest.TestCase):
+    def test_round_trip(self):
+        client = fake_sharded_client()
+        manager = RedisDataManager(client, chunk_size=1000)
+        large = {'rows': list(range(5000))}
+        manager.set_data('big', large)
+        manager.set_data('big', large)      # 덮어쓰기 : 기존 청크 조회(raise_on_error=False) 경로
+        self.assertEqual(manager.get_data('big'), large)
+        self.assertEqual(b''.join(manager.iter_chunks('big')), RedisSerializer().dumps(large))
+
+        manager.set_many({'a': large, 'b': 1})
+        self.assertEqual(manager.get_many(['a', 'b', 'missing']), {'a': large, 'b': 1, 'missing': None})
+        manager.delete_many(['big', 'a', 'b'])
+        # 남는 키는 덮어쓰기 전 청크(유예 TTL 설정) 뿐
+        remaining = [(node, key) for node in client.clients.values() for key in node.keys()]
+        self.assertTrue(all(b':chunk:' in key and node.ttl(key) > 0 for node, key in remaining))
+
+@unittest.skipIf(fakeredis is None, "fakeredis 미설치")
+class TestShardedCache(unittest.TestCase):
+    def test_invalidate_reaches_other_l1_caches(self):
+        # 무효화 채널이 primary 가 아닌 샤드로 해시되어도 구독 중인 다른 프로세스의 L1 에서 제거되어야 함
+        servers = [fakeredis.FakeServer() for _ in range(2)]
+        reader_client, writer_client = fake_sharded_client(2, servers), fake_sharded_client(2, servers)
+        config = RedisConfig(local_cache_size=10)
+        self.assertIsNot(reader_client.get_client(config.invalidation_channel), reader_client.primary)
+        reader = RedisCache(config, reader_client)
+        writer = RedisCache(RedisConfig(), writer_client)
+        self.addCleanup(reader.close)
+        self.addCleanup(writer.close)
+        values = {'x': 1}
+
+        @reader.cached(timeout=60)
+        def read(key):
+            return values[key]
+
+        self.assertEqual(read('x'), 1)
+        values['x'] = 2
+        writer.invalidate(reader.cache_key(function_key_name(read.__wrapped__), 'x'))
+        deadline = time.monotonic() + 2
+        while len(reader.local_cache) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(read('x'), 2)
+
+if __name__ == '__main__':
+    unittest.main()